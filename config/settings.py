@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -52,8 +53,11 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'pages.middleware.MetricsMiddleware',  # সবার আগে, যাতে পুরো রিকোয়েস্টের সময় মাপা হয়
+    'pages.middleware.ReadOnlyRequestMiddleware',  # GET এ সদস্য ডেটা read-only alias থেকে (প্রোডাকশন প্রোফাইল)
     'django.middleware.security.SecurityMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    'pages.middleware.AsyncWhiteNoiseMiddleware',  # WhiteNoise, async chain সমর্থনসহ (ASGI)
+    'pages.middleware.PrerenderedPageMiddleware',  # আগে থেকে রেন্ডার করা মার্কেটিং পেজ (`pages.prerender`)
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -66,7 +70,7 @@ ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'pages.metrics.InstrumentedDjangoTemplates',  # DjangoTemplates + রেন্ডার টাইমিং
         'DIRS': [
             BASE_DIR / 'templates', # Global templates directory
         ],
@@ -76,6 +80,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'pages.context_processors.member_stats',  # {{ member_stats.active }} ইত্যাদি
             ],
         },
     },
@@ -94,6 +99,41 @@ DATABASES = {
     }
 }
 
+# প্রোডাকশন SQLite প্রোফাইল: DJANGO_DB_PROFILE=production
+# - WAL + টিউন করা PRAGMA (নতুন connection এ বসানো হয়, `pages.signals`)
+# - persistent connection (প্রতি রিকোয়েস্টে নতুন করে খোলা হয় না)
+# - 'readonly' alias: GET রিকোয়েস্টে সদস্য ডেটা সেখান থেকে পড়া হয় (`pages.db.ReadOnlyRouter`)
+# বেঞ্চমার্ক: python manage.py bench_sqlite_concurrency
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',      # reader রা writer কে আটকায় না
+    'synchronous': 'NORMAL',    # WAL এ নিরাপদ, প্রতি commit এ fsync লাগে না
+    'busy_timeout': 5000,       # lock পেলে সাথে সাথে "database is locked" না দিয়ে ৫ সেকেন্ড অপেক্ষা
+    'mmap_size': 268435456,     # 256 MiB memory-mapped I/O
+    'cache_size': -20000,       # ~20 MiB page cache (ঋণাত্মক = KiB)
+    'temp_store': 'MEMORY',
+}
+DB_PROFILE = os.environ.get('DJANGO_DB_PROFILE', 'default')
+
+if DB_PROFILE == 'production':
+    DATABASES['default'].update({
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        # IMMEDIATE: transaction শুরুতেই write lock নেয়, তাই মাঝপথে lock upgrade এর deadlock হয় না
+        'OPTIONS': {'timeout': 20, 'transaction_mode': 'IMMEDIATE'},
+        'PRAGMAS': SQLITE_PRAGMAS,
+    })
+    DATABASES['readonly'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': (BASE_DIR / 'db.sqlite3').as_uri() + '?mode=ro',
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'timeout': 20},
+        # journal_mode ডাটাবেস ফাইলে থাকে, primary সেট করে; read-only connection এ বদলানো যায় না
+        'PRAGMAS': {name: value for name, value in SQLITE_PRAGMAS.items() if name != 'journal_mode'},
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['pages.db.ReadOnlyRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -133,8 +173,20 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']  # Directory for global static files
 STATIC_ROOT = BASE_DIR / 'staticfiles'  # Directory where static files will be collected
 
-# Production এ whitenoise কে বলি compress + cache করতে
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Production এ whitenoise কে বলি compress + cache করতে — collectstatic এর সময় ছবি অপটিমাইজ,
+# AVIF/WEBP বিকল্প, ছবির মাপ manifest এ এবং Brotli/gzip (`pages.staticfiles`)।
+# (Django 5.1 থেকে পুরনো STATICFILES_STORAGE setting আর পড়া হয় না, তাই STORAGES।)
+# DEBUG এ manifest লাগে না, collectstatic ছাড়াই চলে।
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+            else 'pages.staticfiles.OptimizedStaticFilesStorage'
+        ),
+    },
+}
+# STATIC_IMAGE_WORKERS = 4  # collectstatic এ ছবি প্রসেসের worker (ডিফল্ট: CPU core)
 
 
 
@@ -142,7 +194,83 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media' # Directory where media files will be stored
 
+# Media সার্ভ করা (`pages.media`)। সামনে nginx থাকলে ফাইল পাঠানো nginx কে দিন:
+#   location /protected-media/ { internal; alias /path/to/media/; }
+# MEDIA_X_ACCEL_REDIRECT = '/protected-media/'
+# MEDIA_X_SENDFILE = True  # Apache mod_xsendfile / lighttpd
+MEDIA_CACHE_MAX_AGE = 3600  # সেকেন্ড; নামে content hash থাকা ফাইল immutable (এক বছর)
+
+# হোম, About, Services ইত্যাদি পেজ আগে থেকে রেন্ডার করা HTML (gzip/Brotli সহ) থেকে, ভিউ ছাড়াই
+# (`pages.prerender`)। build: python manage.py prerender_pages — না করলেও প্রথম রিকোয়েস্টে
+# ব্যাকগ্রাউন্ডে হয়, আর টেমপ্লেট বা static manifest বদলালে আবার হয়।
+PRERENDER_PAGES = not DEBUG
+PRERENDER_ROOT = BASE_DIR / 'run' / 'prerendered'
+PRERENDER_CHECK_INTERVAL = 2  # সেকেন্ড পরপর টেমপ্লেটের dirty-check (None = শুধু প্রথমবার)
+PRERENDER_CACHE_MAX_AGE = 0  # ব্রাউজার প্রতিবার ETag দিয়ে যাচাই করে (304)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# --- Member directory ---
+# সদস্য সার্চ ব্যাকএন্ড (dotted path)। না দিলে SQLite এ FTS5 ইনডেক্স ব্যবহার হবে,
+# অন্য ডাটাবেসে 'pages.search.IContainsSearchBackend'।
+# MEMBER_SEARCH_BACKEND = 'pages.search.SQLiteFTSSearchBackend'
+
+# ব্যাকগ্রাউন্ড টাস্ক কিউ (`pages.tasks`) — worker: python manage.py run_tasks
+# True হলে worker ছাড়াই টাস্ক commit এর পরে একই প্রসেসে চলে (শুধু ডেভেলপমেন্টের জন্য)।
+TASKS_ALWAYS_EAGER = False
+TASKS_MAX_ATTEMPTS = 3
+
+# অ্যাডমিনের বড় টেবিল মোড (`pages.admin`): আনুমানিক/সারাংশ থেকে সংখ্যা, autocomplete এলাকা
+# ফিল্টার, ইনডেক্সে সার্চ এবং bulk সক্রিয়/নিষ্ক্রিয় — একটি chunk (এতজন সদস্য) এর মধ্যে হলে
+# সাথে সাথে, এর বেশি হলে chunk করা ব্যাকগ্রাউন্ড জবে (worker লাগে: python manage.py run_tasks)।
+MEMBER_ADMIN_LARGE_TABLE = True
+MEMBER_BULK_CHUNK_SIZE = 500
+
+# সার্চ বক্সের typeahead (`pages.suggest`): প্রসেসের মেমোরিতে prefix ইনডেক্স। bulk আপডেট বা
+# অন্য প্রসেসের পরিবর্তনের পরে ইনডেক্স ব্যাকগ্রাউন্ড thread এ নতুন করে তৈরি হয় (False = রিকোয়েস্টেই)।
+MEMBER_SUGGEST_BACKGROUND_REBUILD = True
+
+# Cache — সদস্য ডিরেক্টরির read path এই cache ব্যবহার করে (`pages.cache`)। cache অকেজো করা
+# (generation) সব worker এ পৌঁছাতে হলে একাধিক worker প্রসেসে (gunicorn/uvicorn --workers) শেয়ার
+# করা backend লাগে — DJANGO_CACHE_URL দিন:
+#   redis://host:6379/0   (redis প্যাকেজ)      memcached://host:11211   (pymemcache প্যাকেজ)
+#   file:///var/cache/somiti   (একই সার্ভারের worker গুলোর জন্য; পাথ ছাড়া `file://` = BASE_DIR/run/cache)
+# না দিলে প্রসেস-লোকাল LocMemCache — শুধু এক প্রসেসের জন্য; WEB_CONCURRENCY > 1 হলে
+# অ্যাপ চালু হয় না (`pages.cache.ensure_shared_cache`)।
+CACHE_URL = os.environ.get('DJANGO_CACHE_URL', '')
+if CACHE_URL.startswith('redis'):
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': CACHE_URL}}
+elif CACHE_URL.startswith('memcached://'):
+    CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+        'LOCATION': CACHE_URL.removeprefix('memcached://'),
+    }}
+elif CACHE_URL.startswith('file://'):
+    CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': CACHE_URL.removeprefix('file://') or BASE_DIR / 'run' / 'cache',
+    }}
+else:
+    CACHES = {
+        'default': {
+            # LocMemCache, async কল thread ছাড়াই (`pages.cache.AsyncLocMemCache`)
+            'BACKEND': 'pages.cache.AsyncLocMemCache',
+            'LOCATION': 'somiti-default',
+        }
+    }
+MEMBER_CACHE_TIMEOUT = 300  # সেকেন্ড; invalidation সিগন্যাল দিয়ে হয়
+
+# মেট্রিক (`pages.metrics`) — /metrics/ এন্ডপয়েন্ট শুধু স্টাফ ইউজার, `Authorization: Bearer
+# <METRICS_TOKEN>` দেওয়া scraper অথবা METRICS_ALLOWED_IPS থেকে। reverse proxy (nginx) এর পেছনে
+# সব রিকোয়েস্ট proxy এর ঠিকানা (127.0.0.1) থেকে আসে, তাই সেই ঠিকানা METRICS_ALLOWED_IPS এ দেবেন না।
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+METRICS_ALLOWED_IPS = []
+METRICS_SLOW_REQUEST_MS = 500  # এর চেয়ে ধীর রিকোয়েস্ট SQL সহ 'pages.metrics.slow' লগারে লেখা হয়
+# একাধিক worker প্রসেস (gunicorn ইত্যাদি) হলে একটি শেয়ার করা ডিরেক্টরি দিন, যাতে
+# /metrics/ সব প্রসেসের মোট মান দেখায়:
+# METRICS_DIR = BASE_DIR / 'run' / 'metrics'
+# (বন্ধ হওয়া worker এর snapshot গুলো সেখানে `dead-processes.json` এর মোটে যোগ হয়ে মুছে যায়)
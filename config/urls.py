@@ -16,10 +16,12 @@ Including another URLconf
 """
 
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 
 from django.conf import settings # for  media files
-from django.conf.urls.static import static # for media files
+from django.conf.urls.static import static # for static files (development)
+
+from pages.media import serve_media
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -31,9 +33,13 @@ urlpatterns = [
     # path('post/', include('post.urls')),
 ]
 
-# Static and Media files serve (only in development)
+# Media files — প্রোডাকশনেও (`pages.media`: X-Accel-Redirect/X-Sendfile, Range, immutable cache)
+urlpatterns += [
+    re_path(r'^%s(?P<path>.+)$' % settings.MEDIA_URL.lstrip('/'), serve_media, name='media'),
+]
+
+# Static files serve (only in development; প্রোডাকশনে WhiteNoise)
 if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 # Customize admin site
@@ -1,6 +1,123 @@
 # pages/admin.py
-from django.contrib import admin
-from .models import Member
+import re
+
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.admin.utils import prepare_lookup_value
+from django.contrib.admin.views.main import (
+    ALL_VAR, ERROR_FLAG, IS_FACETS_VAR, IS_POPUP_VAR, ORDER_VAR, PAGE_VAR, SEARCH_VAR, TO_FIELD_VAR,
+)
+from django.db.models import Q
+from django.http import JsonResponse
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html
+from .areas import matching_areas
+from .cache import bump_generation
+from .models import Area, AreaAlias, Member, MemberBulkUpdate, Task
+from .pagination import EstimatedCountPaginator
+from .search import search_members
+from .stats import filtered_count, get_stats, search_areas, update_members
+from .tasks import DEFAULT_BULK_CHUNK_SIZE, start_member_bulk_update
+
+# ফোন নম্বরের মতো সার্চ টার্ম (দেশের কোড ছাড়া বা সহ)
+PHONE_SEARCH = re.compile(r'^\+?\d{6,15}$')
+
+# changelist এর যে প্যারামিটারগুলো ফলাফলের সংখ্যা বদলায় না
+NON_FILTER_PARAMS = {ORDER_VAR, PAGE_VAR, IS_POPUP_VAR, TO_FIELD_VAR, IS_FACETS_VAR}
+
+# যে ফিল্টার প্যারামিটারগুলোর সংখ্যা সারাংশ টেবিল (`pages.stats`) থেকে জানা যায়
+STATS_FILTER_PARAMS = {'role__exact': 'role', 'area': 'area', 'is_active__exact': 'is_active'}
+
+# changelist এর যে ফিল্টার প্যারামিটারগুলো নিজেই ORM lookup (bulk জবের `filters` এ হুবহু যায়)
+LOOKUP_FILTER_PARAMS = {'joined_date__gte', 'joined_date__lt', 'joined_date__isnull'}
+
+
+def search_lookups(search_term):
+    """
+    ফোন নম্বর বা ইমেইলের মতো সার্চ টার্মের ইনডেক্স করা lookup (`{'phone__in': [...]}`);
+    অন্য টার্মে `None` — তখন সার্চ ব্যাকএন্ড (`search_members`)।
+    """
+    if PHONE_SEARCH.match(search_term):
+        number = search_term.lstrip('+')
+        return {'phone__in': sorted({search_term, number, f'+{number}', f'+88{number}'})}
+    if '@' in search_term:
+        return {'email__in': sorted({search_term, search_term.lower()})}
+    return None
+
+
+def large_table_mode():
+    """`settings.MEMBER_ADMIN_LARGE_TABLE` (ডিফল্ট True) — বড় সদস্য টেবিলের অ্যাডমিন মোড।"""
+    return getattr(settings, 'MEMBER_ADMIN_LARGE_TABLE', True)
+
+
+class AreaListFilter(admin.SimpleListFilter):
+    """
+    এলাকা ফিল্টার — এলাকার তালিকা ও সংখ্যা সদস্য টেবিলের DISTINCT scan এর বদলে
+    সারাংশ টেবিল (`pages.stats`) থেকে আসে। খোঁজা হয় FK (`area_ref`, `member_area_ref_idx`)
+    দিয়ে, তাই বানান ভিন্ন বা alias লিখলেও একই এলাকা।
+    """
+    title = 'Area'
+    parameter_name = 'area'
+
+    def lookups(self, request, model_admin):
+        return [
+            (area, f"{area} ({counts['active'] + counts['inactive']})")
+            for area, counts in get_stats()['areas'].items()
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(area_ref__in=matching_areas(self.value(), partial=False))
+        return queryset
+
+
+class RoleListFilter(admin.ChoicesFieldListFilter):
+    """
+    পদবি ফিল্টার — `role` এর সাথে `role_rank` এর equality ও যোগ হয়, যাতে তালিকার ক্রম
+    (`Member.ORDERING`) ইনডেক্স থেকেই আসে (`pages.filters.filter_role` এর মতো)।
+    """
+
+    def queryset(self, request, queryset):
+        queryset = super().queryset(request, queryset)
+        roles = self.used_parameters.get(self.lookup_kwarg)
+        if roles and len(roles) == 1:
+            queryset = queryset.filter(role_rank=Member.rank_for_role(roles[0]))
+        return queryset
+
+
+class AreaAutocompleteFilter(AreaListFilter):
+    """
+    বড় টেবিলের এলাকা ফিল্টার: সব এলাকার তালিকার বদলে একটি টেক্সট ইনপুট, যার সাজেশন
+    `area-autocomplete/` এন্ডপয়েন্ট থেকে আসে (`search_areas`, ইনডেক্স করা prefix খোঁজা)।
+    """
+    template = 'admin/pages/member/area_filter.html'
+
+    def __init__(self, request, params, model, model_admin):
+        self.request = request
+        super().__init__(request, params, model, model_admin)
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self):
+        return True
+
+    def choices(self, changelist):
+        yield {
+            'parameter_name': self.parameter_name,
+            'value': self.value() or '',
+            'clear_url': changelist.get_query_string(remove=[self.parameter_name, PAGE_VAR]),
+            # ফর্ম submit করলে বাকি ফিল্টার/সার্চ/ক্রম যেন থেকে যায়
+            'hidden_params': [
+                (name, value)
+                for name, values in self.request.GET.lists()
+                if name not in (self.parameter_name, PAGE_VAR)
+                for value in values
+            ],
+            'autocomplete_url': reverse('admin:pages_member_area_autocomplete'),
+        }
+
 
 # Member মডেলটিকে অ্যাডমিন সাইটে রেজিস্টার করা হয়েছে এবং এর প্রদর্শন কাস্টমাইজ করা হয়েছে।
 @admin.register(Member)
@@ -22,7 +139,7 @@ class MemberAdmin(admin.ModelAdmin):
     ]
     
     # ডান পাশের সাইডবারে ফিল্টার অপশন যোগ করা হয়েছে।
-    list_filter = ['role', 'area', 'is_active', 'joined_date']
+    list_filter = [('role', RoleListFilter), AreaListFilter, 'is_active', 'joined_date']
     
     # সার্চ বক্সের মাধ্যমে কোন কোন ফিল্ডে সার্চ করা যাবে।
     search_fields = ['name', 'phone', 'email', 'area']
@@ -37,7 +154,7 @@ class MemberAdmin(admin.ModelAdmin):
     # সদস্য যোগ বা এডিট করার পেজে ফিল্ডগুলোকে গ্রুপে ভাগ করে দেখানো হয়েছে।
     fieldsets = (
         ('Basic Information', {
-            'fields': ('name', 'role', 'area', 'image')
+            'fields': ('name', 'role', 'area', 'image', 'image_status')
         }),
         ('Contact Information', {
             'fields': ('phone', 'email')
@@ -52,23 +169,247 @@ class MemberAdmin(admin.ModelAdmin):
     )
     
     # যে ফিল্ডগুলো শুধুমাত্র পড়া যাবে, এডিট করা যাবে না।
-    readonly_fields = ['joined_date', 'created_at', 'updated_at']
-    
-    # ডিফল্টভাবে তালিকাটি পদবি ও নাম অনুযায়ী সাজানো থাকবে।
-    ordering = ['role', 'name']
+    readonly_fields = ['image_status', 'joined_date', 'created_at', 'updated_at']
     
+    # ডিফল্টভাবে তালিকাটি পদের ক্রম (`role_rank`) ও নাম অনুযায়ী সাজানো থাকবে (id সহ — ইনডেক্সের সাথে মেলে,
+    # তাই অ্যাডমিনকে নিজে থেকে '-pk' যোগ করে বাড়তি sort করতে হয় না)।
+    ordering = list(Member.ORDERING)
+
+    # --- বড় টেবিল মোড (`MEMBER_ADMIN_LARGE_TABLE`) ---
+    # পেজ লোডের খরচ টেবিলের আকারের উপর নির্ভর করে না: সংখ্যা সারাংশ টেবিল বা সীমিত COUNT
+    # থেকে, এলাকা ফিল্টার autocomplete, সার্চ ইনডেক্সে, bulk অ্যাকশন ব্যাকগ্রাউন্ড জবে।
+
+    @property
+    def show_full_result_count(self):
+        # "N results (M total)" এর M এর জন্য আলাদা COUNT(*) দরকার হয়
+        return not large_table_mode()
+
+    @property
+    def show_facets(self):
+        # facet গুলো প্রতিটি ফিল্টার অপশনের জন্য আলাদা COUNT চালায়
+        return admin.ShowFacets.NEVER if large_table_mode() else admin.ShowFacets.ALLOW
+
+    def get_list_filter(self, request):
+        if not large_table_mode():
+            return self.list_filter
+        return [AreaAutocompleteFilter if spec is AreaListFilter else spec for spec in self.list_filter]
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        if not large_table_mode():
+            return super().get_paginator(request, queryset, per_page, orphans, allow_empty_first_page)
+        return EstimatedCountPaginator(
+            queryset, per_page, orphans, allow_empty_first_page, count=self.get_known_count(request)
+        )
+
+    def get_known_count(self, request):
+        """
+        শুধু role/area/is_active ফিল্টার থাকলে ফলাফলের সংখ্যা সারাংশ টেবিল থেকে; অন্য কিছু
+        (সার্চ, তারিখ ফিল্টার) থাকলে `None` — তখন paginator সীমিত COUNT করে।
+        """
+        lookup = {}
+        for name, values in request.GET.lists():
+            if name in NON_FILTER_PARAMS:
+                continue
+            if name not in STATS_FILTER_PARAMS or len(values) != 1:
+                return None
+            lookup[STATS_FILTER_PARAMS[name]] = values[0]
+        if 'is_active' in lookup:
+            if lookup['is_active'] not in ('0', '1'):
+                return None
+            lookup['is_active'] = lookup['is_active'] == '1'
+        if 'area' in lookup:
+            # `AreaListFilter` এর মতো alias/normalized নাম মেলে; সারাংশ টেবিলে এলাকার নাম (`Area.name`)
+            area = Area.objects.filter(pk__in=matching_areas(lookup['area'], partial=False)).first()
+            if area is None:
+                return 0
+            lookup['area'] = area.name
+        return filtered_count(**lookup)
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        বড় টেবিল মোডে চার কলামের OR-LIKE (full scan) এর বদলে: ফোন নম্বর ও ইমেইল ইনডেক্সে
+        সরাসরি মেলানো, বাকি সব সার্চ ব্যাকএন্ডে (SQLite এ FTS5)।
+        """
+        search_term = search_term.strip()
+        if not large_table_mode() or not search_term:
+            return super().get_search_results(request, queryset, search_term)
+        lookups = search_lookups(search_term)
+        if lookups is not None:
+            return queryset.filter(**lookups), False
+        return search_members(queryset, search_term), False
+
+    def get_urls(self):
+        urls = [
+            path(
+                'area-autocomplete/',
+                self.admin_site.admin_view(self.area_autocomplete_view),
+                name='pages_member_area_autocomplete',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def area_autocomplete_view(self, request):
+        """এলাকা ফিল্টারের সাজেশন: `?term=` দিয়ে শুরু হওয়া এলাকা (select2 এর মতো JSON)।"""
+        if not self.has_view_permission(request):
+            return JsonResponse({'error': 'Permission denied'}, status=403)
+        areas = search_areas(request.GET.get('term', '').strip())
+        return JsonResponse({
+            'results': [{'id': area, 'text': f'{area} ({count})'} for area, count in areas],
+        }, json_dumps_params={'ensure_ascii': False})
+
     # --- কাস্টম অ্যাডমিন অ্যাকশন ---
     # অ্যাডমিন তালিকা থেকে একাধিক সদস্যকে একসাথে সক্রিয় বা নিষ্ক্রিয় করার জন্য।
     actions = ['activate_members', 'deactivate_members']
-    
+
+    def set_members_active(self, request, queryset, is_active):
+        verb = 'activated' if is_active else 'deactivated'
+        if large_table_mode():
+            # একটি chunk এর মধ্যে হলে এখনই (worker ছাড়াও কাজ করে); অনেক সদস্য হলে রিকোয়েস্টের
+            # ভেতরে একটি বড় UPDATE এর বদলে chunk করা ব্যাকগ্রাউন্ড জব (`run_tasks` worker)
+            size = getattr(settings, 'MEMBER_BULK_CHUNK_SIZE', DEFAULT_BULK_CHUNK_SIZE)
+            member_ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:size + 1])
+            if len(member_ids) <= size:
+                queryset = Member.objects.filter(pk__in=member_ids)
+            else:
+                self.start_bulk_update(request, queryset, is_active, verb)
+                return
+        count = update_members(queryset, is_active=is_active, updated_at=timezone.now())
+        bump_generation()  # queryset.update() সিগন্যাল পাঠায় না, তাই cache নিজে অকেজো করা হয়
+        self.message_user(request, f'{count} members {verb} successfully.')
+
+    def get_bulk_update_selection(self, request, queryset):
+        """
+        ব্যাকগ্রাউন্ড জবের selection `(filters, search)` — id এর তালিকা নয়। চেকবক্সে বাছাই করা
+        সদস্যরা (এক পেজের বেশি নয়) `pk__in`; "সব নির্বাচন" (select across) হলে changelist এর
+        ফিল্টার ও সার্চ, JSON এ রাখা যায় এমন lookup হিসেবে। অজানা ফিল্টার থাকলে `None`।
+        """
+        if request.POST.get('select_across') != '1':
+            return {'pk__in': list(queryset.order_by('pk').values_list('pk', flat=True))}, ''
+        filters, search = {}, ''
+        for name, values in request.GET.lists():
+            if name in NON_FILTER_PARAMS or name in (ALL_VAR, ERROR_FLAG):
+                continue
+            if len(values) != 1:
+                return None
+            value = values[0]
+            if name == SEARCH_VAR:
+                value = value.strip()
+                lookups = search_lookups(value) if value else {}
+                if lookups is None:
+                    search = value
+                else:
+                    filters.update(lookups)
+            elif name == 'role__exact':
+                filters.update(role=value, role_rank=Member.rank_for_role(value))
+            elif name == 'area':
+                filters['area_ref__in'] = [row['pk'] for row in matching_areas(value, partial=False)]
+            elif name == 'is_active__exact' and value in ('0', '1'):
+                filters['is_active'] = value == '1'
+            elif name in LOOKUP_FILTER_PARAMS:
+                filters[name] = prepare_lookup_value(name, value)
+            else:
+                return None
+        return filters, search
+
+    def start_bulk_update(self, request, queryset, is_active, verb):
+        """ব্যাকগ্রাউন্ড জব (`MemberBulkUpdate`) তৈরি করে তার লিংকসহ বার্তা দেখায়।"""
+        selection = self.get_bulk_update_selection(request, queryset)
+        if selection is None:
+            self.message_user(
+                request, 'These filters cannot run as a background job; select fewer members.', messages.ERROR,
+            )
+            return
+        filters, search = selection
+        job = start_member_bulk_update(filters, is_active, search)
+        url = reverse('admin:pages_memberbulkupdate_change', args=[job.pk])
+        self.message_user(request, format_html(
+            '{} members will be {} in the background: <a href="{}">bulk update #{}</a>.',
+            job.total, verb, url, job.pk,
+        ))
+
     def activate_members(self, request, queryset):
         """নির্বাচিত সদস্যদের সক্রিয় (Activate) করে।"""
-        count = queryset.update(is_active=True)
-        self.message_user(request, f'{count} members activated successfully.')
+        self.set_members_active(request, queryset, True)
     activate_members.short_description = 'Activate selected members'
 
     def deactivate_members(self, request, queryset):
         """নির্বাচিত সদস্যদের নিষ্ক্রিয় (Deactivate) করে।"""
-        count = queryset.update(is_active=False)
-        self.message_user(request, f'{count} members deactivated successfully.')
-    deactivate_members.short_description = 'Deactivate selected members'
\ No newline at end of file
+        self.set_members_active(request, queryset, False)
+    deactivate_members.short_description = 'Deactivate selected members'
+
+
+class AreaAliasInline(admin.TabularInline):
+    model = AreaAlias
+    fields = ['name', 'key']
+    readonly_fields = ['key']
+    extra = 1
+
+
+# সদস্যদের normalized এলাকা এবং তাদের বিকল্প নাম (alias)।
+@admin.register(Area)
+class AreaAdmin(admin.ModelAdmin):
+    """
+    Admin interface for areas.
+    নতুন এলাকা সদস্য save এর সময় নিজে থেকেই তৈরি হয়; এখানে একই এলাকার অন্য বানান
+    alias হিসেবে যোগ করা যায় (`?area=` তখন সেটিতেও মেলে)।
+    """
+    list_display = ['name', 'key']
+    search_fields = ['name', 'aliases__name']
+    inlines = [AreaAliasInline]
+
+    def get_readonly_fields(self, request, obj=None):
+        # নামটি সদস্যদের `area` কলামে কপি করা থাকে, তাই তৈরির পরে বদলানো যায় না
+        return ['key'] if obj is None else ['name', 'key']
+
+
+# অ্যাডমিনের bulk সক্রিয়/নিষ্ক্রিয় জবগুলোর অগ্রগতি দেখার জন্য।
+@admin.register(MemberBulkUpdate)
+class MemberBulkUpdateAdmin(admin.ModelAdmin):
+    """
+    Admin interface for member bulk updates.
+    জবগুলো শুধু দেখা যাবে; এগুলো টাস্ক কিউ (`run_member_bulk_update`) চালায়।
+    """
+    list_display = ['id', 'action', 'progress_display', 'status', 'created_at', 'finished_at']
+    list_filter = ['status']
+    fields = ['action', 'filters', 'search', 'progress_display', 'status', 'created_at', 'finished_at']
+    readonly_fields = fields
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description='Action')
+    def action(self, obj):
+        return 'Activate' if obj.is_active else 'Deactivate'
+
+    @admin.display(description='Progress')
+    def progress_display(self, obj):
+        return f'{obj.processed} / {obj.total} ({obj.progress}%)'
+
+
+# ব্যাকগ্রাউন্ড টাস্ক কিউ (ইমেজ প্রসেসিং ইত্যাদি) পর্যবেক্ষণের জন্য।
+@admin.register(Task)
+class TaskAdmin(admin.ModelAdmin):
+    """
+    Admin interface for background tasks.
+    টাস্কগুলো শুধু দেখা যাবে; এগুলো worker (`run_tasks`) চালায়।
+    """
+    list_display = ['id', 'name', 'status', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status']
+    readonly_fields = [
+        'name', 'args', 'status', 'attempts', 'last_error',
+        'run_after', 'created_at', 'started_at', 'finished_at',
+    ]
+    actions = ['retry_tasks']
+
+    def has_add_permission(self, request):
+        return False
+
+    def retry_tasks(self, request, queryset):
+        """নির্বাচিত failed টাস্কগুলো আবার কিউতে পাঠায়।"""
+        count = queryset.filter(status=Task.FAILED).update(status=Task.PENDING, attempts=0)
+        self.message_user(request, f'{count} tasks queued again.')
+    retry_tasks.short_description = 'Retry selected failed tasks'
+
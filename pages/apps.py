@@ -5,3 +5,10 @@ class PagesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'pages'
     verbose_name = 'সদস্য ব্যবস্থাপনা (Members Management)'
+
+    def ready(self):
+        # সিগন্যাল রিসিভারগুলো রেজিস্টার করা হয় (সার্চ ইনডেক্স সিঙ্ক ইত্যাদি)।
+        from . import signals  # noqa: F401
+        # একাধিক worker এ প্রসেস-লোকাল cache হলে চালু না হওয়া (deploy check: pages.W001)
+        from .cache import ensure_shared_cache
+        ensure_shared_cache()
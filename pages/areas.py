@@ -0,0 +1,44 @@
+# pages/areas.py
+"""
+সদস্যের এলাকা (`Area`, `AreaAlias`) খোঁজা ও বসানো।
+
+- `matching_areas(text)`: `?area=` এর মান থেকে এলাকার id এর subquery — আগে হুবহু মিল
+  (normalized নাম বা alias), না পেলে আংশিক মিল (আগের `area__icontains` এর মতো)।
+  এলাকার টেবিল ছোট; সদস্য টেবিলে শুধু FK (`area_ref`) ইনডেক্সে খোঁজা হয়। কোয়েরিটি lazy,
+  তাই sync ও async দুই ভিউতেই আলাদা round trip ছাড়া চলে। `partial=False`: শুধু হুবহু মিল
+  (অ্যাডমিনের এলাকা ফিল্টার)।
+- `assign_areas(members)`: bulk create/update এর জন্য — `Member.save()` এর মতো `area`
+  থেকে `area_ref` বসায়, সব সদস্যের জন্য মোট কয়েকটি কোয়েরিতে।
+"""
+from django.db.models import Exists, Q
+
+from .models import Area, AreaAlias, normalize_area_name
+
+
+def matching_areas(text, partial=True):
+    """`text` এর সাথে মেলা এলাকাগুলোর id (`area_ref__in=` এর জন্য subquery)।"""
+    key = normalize_area_name(text)
+    exact = Q(key=key) | Q(aliases__key=key)
+    if not partial:
+        return Area.objects.filter(exact).values('pk')
+    partial = (Q(key__contains=key) | Q(aliases__key__contains=key)) & ~Exists(Area.objects.filter(exact))
+    return Area.objects.filter(exact | partial).values('pk')
+
+
+def assign_areas(members):
+    """
+    সেভ না করা/বদলানো সদস্যদের `area` থেকে `area_ref` বসায় এবং `area` কে এলাকার নামে বদলায়।
+    নতুন এলাকাগুলো একবারে তৈরি হয়।
+    """
+    keys = {normalize_area_name(member.area): member.area for member in members}
+    areas = {area.key: area for area in Area.objects.filter(key__in=keys)}
+    for alias in AreaAlias.objects.filter(key__in=keys.keys() - areas.keys()).select_related('area'):
+        areas[alias.key] = alias.area
+    missing = [Area(name=' '.join(keys[key].split()), key=key) for key in keys.keys() - areas.keys()]
+    if missing:
+        Area.objects.bulk_create(missing, ignore_conflicts=True)
+        areas.update((area.key, area) for area in Area.objects.filter(key__in=[area.key for area in missing]))
+    for member in members:
+        member.area_ref = areas[normalize_area_name(member.area)]
+        member.area = member.area_ref.name
+    return members
@@ -0,0 +1,203 @@
+# pages/async_views.py
+"""
+সদস্য API এবং সদস্য তালিকা পেজের async (ASGI) সংস্করণ।
+
+DRF এর ভিউ sync, তাই uvicorn/daphne এর অধীনে প্রতিটি রিকোয়েস্ট sync adapter এর thread এ
+চলে — ধীর ক্লায়েন্ট বেশি হলে thread শেষ হয়ে যায়। এখানকার ভিউগুলো Django এর async ORM
+(`aiterator`, `aget`, `acount`) এবং async cache (`pages.cache.aget_or_build`) দিয়ে event loop
+এই চলে। আউটপুট `MemberViewSet` এর JSON এর সমান; cache ও conditional GET একই নিয়মে।
+
+যে কাজ async context এ করা যায় না (sync টেমপ্লেট রেন্ডার) সেটি `sync_to_async` দিয়ে চলে।
+"""
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, PageNotAnInteger, Page, Paginator
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import render
+
+from .cache import aget_or_build, normalize_params
+from .conditional import adirectory_validators, arespond_conditionally, object_validators
+from .filters import filter_members, filter_role, order_members
+from .models import Member
+from .pagination import (
+    CURSOR_CONFLICT_MESSAGE, InvalidCursor, KeysetPaginator, MemberCursorPagination, cursor_conflicts, cursor_link,
+)
+from .search import search_members
+from .serializers import MemberDetailSerializer, MemberListRowSerializer, MemberSerializer
+from .stats import active_count, aget_stats
+from .views import (
+    MEMBERS_PER_PAGE, SODOSSO_CACHE_PARAMS, MemberViewSet, legacy_page_redirect, sodosso_context, sodosso_members,
+)
+
+# DRF এর JSONRenderer এর মতো: UTF-8 (বাংলা escape ছাড়া) এবং compact
+JSON_DUMPS_PARAMS = {'ensure_ascii': False, 'separators': (',', ':')}
+
+NOT_FOUND = {'detail': 'No Member matches the given query.'}
+
+
+def json_response(data, status=200):
+    return JsonResponse(data, status=status, safe=False, json_dumps_params=JSON_DUMPS_PARAMS)
+
+
+def get_cache_params(request):
+    """`MemberViewSet.get_cache_params` এর মতো: host এবং প্রাসঙ্গিক কোয়েরি প্যারামিটার।"""
+    return (request.build_absolute_uri('/'),) + normalize_params(request.GET, MemberViewSet.cache_query_params)
+
+
+def get_page_size(request):
+    pagination = MemberCursorPagination
+    try:
+        size = int(request.GET[pagination.page_size_query_param])
+    except (KeyError, ValueError):
+        return pagination.page_size
+    return max(1, min(size, pagination.max_page_size))
+
+
+# --- সদস্য API ---
+
+async def member_list_view(request):
+    """
+    `GET /api/members/` এর async সংস্করণ — একই `search`, `role`, `area`, `ordering`,
+    `cursor`, `page_size` এবং `total` প্যারামিটার।
+    """
+    if cursor_conflicts(request.GET):
+        return json_response({'detail': CURSOR_CONFLICT_MESSAGE}, status=400)
+    params = get_cache_params(request)
+
+    async def build():
+        serializer = MemberListRowSerializer(request)
+        queryset = filter_members(Member.objects.filter(is_active=True), request.GET)
+        search = request.GET.get('search', '')
+        if search:
+            queryset = search_members(queryset, search)
+        queryset = order_members(queryset, request.GET, MemberViewSet.ordering_fields, MemberViewSet.ordering)
+        queryset = queryset.values(*serializer.value_fields)
+
+        if 'cursor' not in request.GET:
+            data = serializer.serialize([row async for row in queryset.aiterator()])
+        else:
+            paginator = KeysetPaginator(queryset, get_page_size(request), MemberCursorPagination.ordering)
+            page = await paginator.aget_page(request.GET['cursor'])
+            data = {
+                'next': cursor_link(request, page.next_cursor),
+                'previous': cursor_link(request, page.previous_cursor),
+            }
+            if request.GET.get('total'):
+                data['count'], data['count_is_exact'] = await paginator.aapproximate_total()
+            data['results'] = serializer.serialize(page)
+        return data
+
+    async def respond():
+        try:
+            return json_response(await aget_or_build('api-async:list', params, build))
+        except InvalidCursor:
+            return json_response({'detail': 'Invalid cursor'}, status=404)
+
+    return await arespond_conditionally(
+        request, await adirectory_validators('api-async:list', params + ('json',)), respond
+    )
+
+
+async def member_detail_api_view(request, pk):
+    """`GET /api/members/{id}/` এর async সংস্করণ।"""
+    queryset = filter_members(Member.objects.filter(is_active=True), request.GET)
+    updated_at = await queryset.filter(pk=pk).values_list('updated_at', flat=True).afirst()
+    if updated_at is None:
+        return json_response(NOT_FOUND, status=404)
+
+    async def respond():
+        member = await queryset.aget(pk=pk)
+        serializer = MemberDetailSerializer(member, context={'request': request})
+        return json_response(serializer.data)
+
+    validators = object_validators('api-async:retrieve', pk, updated_at, (request.build_absolute_uri('/'), 'json'))
+    return await arespond_conditionally(request, validators, respond)
+
+
+async def member_by_role_view(request):
+    """`GET /api/members/by-role/?role=President` এর async সংস্করণ।"""
+    role = request.GET.get('role', None)
+    if not role:
+        return json_response({'error': 'Role parameter is required'}, status=400)
+    params = get_cache_params(request)
+
+    async def build():
+        queryset = filter_role(filter_members(Member.objects.filter(is_active=True), request.GET), role)
+        members = [member async for member in queryset.aiterator()]
+        return MemberSerializer(members, many=True, context={'request': request}).data
+
+    async def respond():
+        return json_response(await aget_or_build('api-async:by-role', params, build))
+
+    return await arespond_conditionally(
+        request, await adirectory_validators('api-async:by-role', params + ('json',)), respond
+    )
+
+
+async def member_roles_view(request):
+    """`GET /api/members/roles/` এর async সংস্করণ (sync ভিউয়ের সাথে একই cache)।"""
+
+    async def build():
+        return [{'value': choice[0], 'label': choice[1]} for choice in Member.ROLE_CHOICES]
+
+    return json_response(await aget_or_build('api:roles', (), build))
+
+
+# --- সদস্য তালিকা পেজ ---
+
+async def sodosso_async_view(request):
+    """
+    `sodosso_view` এর async সংস্করণ। রেন্ডার করা HTML একই (লিংকগুলো relative), তাই
+    sync পেজের সাথে একই cache namespace ব্যবহার হয়।
+    """
+    redirect = await sync_to_async(legacy_page_redirect)(request)
+    if redirect is not None:
+        return redirect
+    params = normalize_params(request.GET, SODOSSO_CACHE_PARAMS)
+
+    async def respond():
+        return HttpResponse(await aget_or_build('sodosso', params, lambda: render_sodosso_page_async(request)))
+
+    return await arespond_conditionally(request, await adirectory_validators('sodosso', params), respond)
+
+
+async def render_sodosso_page_async(request):
+    """`render_sodosso_page` এর মতো, কিন্তু কোয়েরিগুলো async ORM দিয়ে; রেন্ডার করা HTML ফেরত দেয়।"""
+    members, search_query, role_filter, area_filter = sodosso_members(request)
+
+    cursor_pagination = not search_query
+    approximate_total = None
+    if cursor_pagination:
+        paginator = KeysetPaginator(members, MEMBERS_PER_PAGE, MemberCursorPagination.ordering)
+        try:
+            page_obj = await paginator.aget_page(request.GET.get('cursor'))
+        except InvalidCursor:
+            page_obj = await paginator.aget_page()
+        if area_filter:
+            approximate_total = await paginator.aapproximate_total()
+        else:
+            approximate_total = (active_count(await aget_stats(), role_filter), True)
+    else:
+        page_obj = await aget_numbered_page(Paginator(members, MEMBERS_PER_PAGE), request.GET.get('page', 1))
+
+    context = sodosso_context(page_obj, cursor_pagination, approximate_total, search_query, role_filter, area_filter)
+    # Django এর টেমপ্লেট রেন্ডার sync (lazy queryset পড়তে পারে), তাই রেন্ডার thread এ
+    response = await sync_to_async(render)(request, 'pages/sodosso-list.html', context)
+    return response.content
+
+
+async def aget_numbered_page(paginator, number):
+    """
+    `Paginator.get_page` এর async সংস্করণ: ভুল পেজ নম্বরে প্রথম, সীমার বাইরে হলে শেষ পেজ।
+    মোট সংখ্যা `acount()` দিয়ে আগেই বসানো হয়, তাই টেমপ্লেটে আর কোনো কোয়েরি লাগে না।
+    """
+    paginator.count = await paginator.object_list.acount()
+    try:
+        number = paginator.validate_number(number)
+    except PageNotAnInteger:
+        number = 1
+    except EmptyPage:
+        number = paginator.num_pages
+    bottom = (number - 1) * paginator.per_page
+    top = min(bottom + paginator.per_page, paginator.count)
+    rows = [row async for row in paginator.object_list[bottom:top]]
+    return Page(rows, number, paginator)
@@ -0,0 +1,201 @@
+# pages/benchmarks.py
+"""
+সদস্য ডিরেক্টরি ও API এর পারফরম্যান্স বেঞ্চমার্ক।
+
+প্রতিটি scenario কয়েকবার চালিয়ে latency (ms), প্রতি রিকোয়েস্টে কোয়েরি সংখ্যা এবং
+সর্বোচ্চ মেমোরি (tracemalloc) মাপা হয়। ফলাফল JSON এ লেখা যায়, যাতে আগের রানের সাথে
+তুলনা করা যায়। কোয়েরি সংখ্যা `max_queries` ছাড়ালে scenario টি ব্যর্থ ধরা হয় —
+N+1 এর মতো রিগ্রেশন এভাবে ধরা পড়ে। `python manage.py bench_members` থেকে চালানো হয়।
+"""
+from collections import namedtuple
+from datetime import datetime, timezone as dt_timezone
+from io import BytesIO
+import platform
+import statistics
+import time
+import tracemalloc
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from PIL import Image
+
+from .cache import bump_generation
+from .models import Member
+
+# `run(context)` একটি রিকোয়েস্ট/অপারেশন চালায়; `max_queries` হলো অনুমোদিত সর্বোচ্চ কোয়েরি।
+# `cold=True` হলে প্রতিবার চালানোর আগে সদস্য cache অকেজো করা হয় (আসল কাজ মাপার জন্য)।
+Scenario = namedtuple('Scenario', ['name', 'run', 'max_queries', 'cold'])
+
+# savepoint কোয়েরিগুলো গোনা হয় না — বাইরের transaction আছে কিনা তার উপর এগুলো নির্ভর করে
+TRANSACTION_SQL = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+
+
+class SkipScenario(Exception):
+    """scenario টি এই ডাটাবেসে চালানো যায় না (যেমন কোনো সদস্য বা অ্যাডমিন ইউজার নেই)।"""
+
+
+class BenchmarkContext:
+    """scenario গুলোর জন্য ভাগ করা অবস্থা: HTTP client, অ্যাডমিন client এবং নমুনা সদস্য।"""
+
+    def __init__(self, host='testserver', admin_user=None):
+        self.client = Client(HTTP_HOST=host)
+        self.admin_client = None
+        user_model = get_user_model()
+        admin = (
+            user_model.objects.filter(username=admin_user).first() if admin_user
+            else user_model.objects.filter(is_superuser=True, is_active=True).order_by('pk').first()
+        )
+        if admin is not None:
+            self.admin_client = Client(HTTP_HOST=host)
+            self.admin_client.force_login(admin)
+
+        active = Member.objects.filter(is_active=True)
+        count = active.count()
+        # মাঝামাঝি একজন সদস্য, যাতে retrieve টেবিলের শুরুর দিকের সারিতে আটকে না থাকে
+        self.sample_pk = active.order_by('pk').values_list('pk', flat=True)[count // 2] if count else None
+        self.sample_area = active.values_list('area', flat=True).first() or 'Mirpur'
+
+    def get(self, path, data=None, admin=False):
+        client = self.admin_client if admin else self.client
+        if client is None:
+            raise SkipScenario('no active superuser to log in as')
+        response = client.get(path, data)
+        if response.status_code != 200:
+            raise AssertionError(f'GET {path} {data or ""} returned {response.status_code}')
+        return response
+
+    def detail_path(self):
+        if self.sample_pk is None:
+            raise SkipScenario('no active members')
+        return reverse('pages:member-api-detail', args=[self.sample_pk])
+
+
+def _save_member_with_image(context):
+    """ছবিসহ `Member.save()` — rollback করা হয়, আপলোড করা ফাইলও মুছে দেওয়া হয়।"""
+    buffer = BytesIO()
+    Image.new('RGB', (800, 600), 'teal').save(buffer, format='JPEG')
+    upload = SimpleUploadedFile('bench.jpg', buffer.getvalue(), content_type='image/jpeg')
+    member = Member(name='বেঞ্চমার্ক সদস্য', role='Member', area='মিরপুর', phone='+8801700000000', image=upload)
+    with transaction.atomic():
+        member.save()
+        transaction.set_rollback(True)
+    member.image.storage.delete(member.image.name)
+
+
+def default_scenarios():
+    """ডিফল্ট scenario তালিকা (নাম, চালানোর ফাংশন, কোয়েরি সীমা, cold কিনা)।"""
+    sodosso = reverse('pages:sodosso')
+    api_list = reverse('pages:member-api-list')
+    by_role = reverse('pages:member-api-by-role')
+    changelist = reverse('admin:pages_member_changelist')
+    return [
+        Scenario('sodosso_view', lambda c: c.get(sodosso), 3, True),
+        Scenario('sodosso_view_role', lambda c: c.get(sodosso, {'role': 'Committee'}), 3, True),
+        Scenario('sodosso_view_search', lambda c: c.get(sodosso, {'search': c.sample_area}), 3, True),
+        Scenario('sodosso_view_cached', lambda c: c.get(sodosso), 0, False),
+        Scenario('api_list_page', lambda c: c.get(api_list, {'cursor': '', 'page_size': 50}), 2, True),
+        Scenario('api_list_search', lambda c: c.get(api_list, {'search': c.sample_area}), 2, True),
+        Scenario('api_retrieve', lambda c: c.get(c.detail_path()), 2, True),
+        Scenario('api_by_role', lambda c: c.get(by_role, {'role': 'President'}), 2, True),
+        Scenario('admin_changelist', lambda c: c.get(changelist, admin=True), 6, True),
+        Scenario('member_save_with_image', _save_member_with_image, 5, False),
+    ]
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def measure(scenario, context, iterations=5):
+    """একটি scenario চালিয়ে latency, কোয়েরি সংখ্যা এবং peak memory এর dict ফেরত দেয়।"""
+    # warm-up (টেমপ্লেট লোডিং, URL resolver ইত্যাদি মাপের বাইরে রাখতে)
+    if scenario.cold:
+        bump_generation()
+    try:
+        scenario.run(context)
+    except SkipScenario as exc:
+        return {'status': 'skipped', 'reason': str(exc)}
+
+    timings, queries = [], 0
+    for _ in range(iterations):
+        if scenario.cold:
+            bump_generation()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            scenario.run(context)
+            timings.append((time.perf_counter() - started) * 1000)
+        queries = max(queries, sum(1 for query in captured if not query['sql'].startswith(TRANSACTION_SQL)))
+
+    # মেমোরি আলাদা রানে মাপা হয়, কারণ tracemalloc নিজেই ধীর করে দেয়
+    if scenario.cold:
+        bump_generation()
+    tracemalloc.start()
+    try:
+        scenario.run(context)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'status': 'ok' if queries <= scenario.max_queries else 'query_regression',
+        'queries': queries,
+        'max_queries': scenario.max_queries,
+        'latency_ms': {
+            'min': round(min(timings), 3),
+            'median': round(statistics.median(timings), 3),
+            'p95': round(_percentile(timings, 95), 3),
+            'max': round(max(timings), 3),
+        },
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmarks(iterations=5, host='testserver', admin_user=None, only=None, scenarios=None):
+    """
+    সব (অথবা `only` তে থাকা) scenario চালিয়ে JSON-যোগ্য ফলাফল ফেরত দেয়:
+    `{'meta': {...}, 'results': {name: {...}}, 'failures': [name, ...]}`।
+    """
+    context = BenchmarkContext(host=host, admin_user=admin_user)
+    results = {}
+    for scenario in scenarios or default_scenarios():
+        if only and scenario.name not in only:
+            continue
+        results[scenario.name] = measure(scenario, context, iterations)
+    return {
+        'meta': {
+            'timestamp': datetime.now(dt_timezone.utc).isoformat(),
+            'members': Member.objects.count(),
+            'iterations': iterations,
+            'database': connection.vendor,
+            'django': django.get_version(),
+            'python': platform.python_version(),
+        },
+        'results': results,
+        'failures': [name for name, result in results.items() if result['status'] == 'query_regression'],
+    }
+
+
+def compare(current, previous):
+    """
+    দুই রানের ফলাফল তুলনা: `{name: {'median_change_pct': ..., 'queries_change': ...}}`।
+    যেসব scenario দুই রানেই আছে শুধু সেগুলো।
+    """
+    changes = {}
+    for name, result in current['results'].items():
+        before = previous.get('results', {}).get(name)
+        if result.get('status') == 'skipped' or not before or before.get('status') == 'skipped':
+            continue
+        old_median = before['latency_ms']['median']
+        changes[name] = {
+            'median_change_pct': round((result['latency_ms']['median'] - old_median) / old_median * 100, 1)
+            if old_median else None,
+            'queries_change': result['queries'] - before['queries'],
+        }
+    return changes
@@ -0,0 +1,134 @@
+# pages/bulk.py
+"""
+সদস্যদের bulk create / bulk update (যেমন spreadsheet থেকে import)।
+
+প্রতিটি সারি আলাদাভাবে validate হয় এবং ভুল সারিগুলোর error index সহ ফেরত দেওয়া হয়;
+সঠিক সারিগুলো `bulk_create` / `bulk_update` দিয়ে batch আকারে (প্রতি batch একটি
+transaction) লেখা হয়। `Member.save()` চলে না, তাই সার্চ ইনডেক্স এবং cache প্রতি
+batch এ একবার আপডেট করা হয়; সদস্য পরিসংখ্যানও (`pages.stats`) একই transaction এ।
+"""
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers
+
+from .areas import assign_areas
+from .cache import bump_generation
+from .models import Member
+from .search import get_search_backend
+from .serializers import MemberSerializer
+from .stats import add_members, apply_deltas, change_deltas, stat_key
+
+# প্রতি batch (transaction) এ কতগুলো সারি লেখা হবে
+BATCH_SIZE = 500
+
+# এক রিকোয়েস্টে সর্বোচ্চ কতগুলো সারি
+MAX_ROWS = 5000
+
+
+def _batches(items, size=BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _row_id(row, field=serializers.IntegerField()):
+    """সারির `id` — JSON/CSV থেকে আসা `"42"` ও `42` দুটোই; ভুল বা না থাকলে `None`।"""
+    if not isinstance(row, dict):
+        return None
+    try:
+        return field.to_internal_value(row.get('id'))
+    except serializers.ValidationError:
+        return None
+
+
+def _write_batches(members, write, update_stats):
+    """
+    প্রতিটি batch একটি transaction এ লেখে; একই transaction এ সার্চ ইনডেক্স ও পরিসংখ্যান
+    (`update_stats(batch)`) আপডেট হয় এবং প্রতি batch এর পরে cache একবার অকেজো করা হয়।
+    """
+    written = []
+    for batch in _batches(members):
+        with transaction.atomic():
+            batch = write(batch)
+            get_search_backend().index_many(batch)
+            update_stats(batch)
+        bump_generation()
+        written += batch
+    return written
+
+
+def bulk_create_members(rows, context=None):
+    """
+    `rows` (dict এর লিস্ট) থেকে সদস্য তৈরি করে।
+    `(created_members, errors)` ফেরত দেয়; `errors` = `[{'index': i, 'errors': {...}}, ...]`।
+    """
+    serializer = MemberSerializer(many=True, context=context or {})
+    members, errors = [], []
+    for index, row in enumerate(rows):
+        try:
+            validated = serializer.child.run_validation(row)
+        except serializers.ValidationError as exc:
+            errors.append({'index': index, 'errors': exc.detail})
+            continue
+        members.append(Member(**validated))
+
+    def write(batch):
+        return Member.objects.bulk_create(Member.assign_role_ranks(assign_areas(batch)))
+
+    return _write_batches(members, write, add_members), errors
+
+
+def bulk_update_members(rows, context=None, partial=True):
+    """
+    `rows` এর প্রতিটি সারিতে `id` থাকতে হবে; সেই সদস্যদের তথ্য আপডেট করে।
+    `partial=False` হলে (PUT) সব required ফিল্ড লাগবে।
+    `(updated_members, errors)` ফেরত দেয়।
+    """
+    ids = [_row_id(row) for row in rows]
+    existing = Member.objects.in_bulk([pk for pk in ids if pk is not None])
+
+    members, fields, errors = [], set(), []
+    seen = set()
+    for index, (row, pk) in enumerate(zip(rows, ids)):
+        instance = existing.get(pk)
+        if instance is None:
+            errors.append({'index': index, 'errors': {'id': ['Member not found.']}})
+            continue
+        # একই সদস্য দুইবার থাকলে পরিসংখ্যানের delta দুইবার যোগ হত — প্রথমটিই নেওয়া হয়
+        if instance.pk in seen:
+            errors.append({'index': index, 'errors': {'id': ['Duplicate id.']}})
+            continue
+        seen.add(instance.pk)
+        serializer = MemberSerializer(instance, data=row, partial=partial, context=context or {})
+        if not serializer.is_valid():
+            errors.append({'index': index, 'errors': serializer.errors})
+            continue
+        for field, value in serializer.validated_data.items():
+            setattr(instance, field, value)
+            fields.add(field)
+        members.append(instance)
+
+    if members:
+        now = timezone.now()
+        for member in members:
+            member.updated_at = now
+        fields.add('updated_at')
+
+        if 'area' in fields:
+            fields.add('area_ref')
+        if 'role' in fields:
+            fields.add('role_rank')
+
+        def write(batch):
+            if 'area' in fields:
+                assign_areas(batch)
+            if 'role' in fields:
+                Member.assign_role_ranks(batch)
+            Member.objects.bulk_update(batch, sorted(fields))
+            return batch
+
+        def update_stats(batch):
+            # `_loaded_values` এ ডাটাবেস থেকে লোড করা (আগের) মান আছে
+            apply_deltas(change_deltas((stat_key(member._loaded_values), stat_key(member)) for member in batch))
+
+        members = _write_batches(members, write, update_stats)
+    return members, errors
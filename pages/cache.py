@@ -0,0 +1,228 @@
+# pages/cache.py
+"""
+সদস্য ডিরেক্টরির read path (টেমপ্লেট পেজ এবং API) এর জন্য versioned cache।
+
+প্রতিটি key তে একটি generation নম্বর থাকে। কোনো সদস্য বদলালে (save/delete সিগন্যাল,
+অ্যাডমিনের bulk অ্যাকশন) generation বাড়ানো হয়, ফলে পুরনো সব এন্ট্রি একসাথে অকেজো
+হয়ে যায় — আলাদা করে কোনো key মুছতে হয় না। Django এর cache framework ব্যবহার হয়,
+তাই local-memory, file-based বা অন্য যেকোনো backend চলে।
+"""
+import hashlib
+import json
+import os
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from django.core.cache.backends.base import DEFAULT_TIMEOUT as DEFAULT_CACHE_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+
+GENERATION_KEY = 'members:generation'
+CHANGED_AT_KEY = 'members:changed_at'
+HITS_KEY = 'members:cache:hits'
+MISSES_KEY = 'members:cache:misses'
+
+# ডিফল্ট মেয়াদ (সেকেন্ড) — invalidation সিগন্যাল দিয়ে হয়, এটি শুধু নিরাপত্তার জন্য
+DEFAULT_TIMEOUT = 300
+
+
+def get_generation():
+    """বর্তমান generation নম্বর (না থাকলে 1 থেকে শুরু)।"""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+def bump_generation():
+    """সব cached সদস্য ডেটা অকেজো করে দেয় (generation +1) এবং পরিবর্তনের সময় মনে রাখে।"""
+    cache.set(CHANGED_AT_KEY, time.time(), timeout=None)
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # key টি নেই (যেমন cache restart) — নতুন generation শুরু
+        cache.add(GENERATION_KEY, 2, timeout=None)
+
+
+def get_last_change():
+    """শেষবার generation বাড়ানোর সময় (epoch সেকেন্ড), জানা না থাকলে None।"""
+    return cache.get(CHANGED_AT_KEY)
+
+
+def normalize_params(params, keys):
+    """
+    কোয়েরি প্যারামিটারগুলো থেকে শুধু `keys` এর মানগুলো নিয়ে (খালি বাদ দিয়ে, trim করে)
+    একটি স্থির ক্রমের tuple বানায়, যাতে `?role=x&search=y` এবং `?search=y&role=x` একই key পায়।
+    """
+    normalized = []
+    for key in sorted(keys):
+        value = (params.get(key) or '').strip()
+        if value:
+            normalized.append((key, value))
+    return tuple(normalized)
+
+
+def make_key(namespace, params):
+    digest = hashlib.md5(json.dumps(params, ensure_ascii=False).encode()).hexdigest()
+    return f'members:{get_generation()}:{namespace}:{digest}'
+
+
+def _count(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
+
+
+def get_or_build(namespace, params, builder, timeout=None):
+    """
+    `namespace` + `params` এর cached মান ফেরত দেয়; না থাকলে `builder()` চালিয়ে cache করে।
+    hit/miss কাউন্টার আপডেট হয়।
+    """
+    key = make_key(namespace, params)
+    value = cache.get(key)
+    if value is not None:
+        _count(HITS_KEY)
+        return value
+    _count(MISSES_KEY)
+    value = builder()
+    if timeout is None:
+        timeout = getattr(settings, 'MEMBER_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+    cache.set(key, value, timeout)
+    return value
+
+
+# --- async সংস্করণ (ASGI ভিউ, `pages.async_views`) ---
+# একই key ও কাউন্টার ব্যবহার করে, তাই sync ও async ভিউ একই generation দেখে।
+
+async def aget_generation():
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(GENERATION_KEY, 1, timeout=None)
+        generation = await cache.aget(GENERATION_KEY, 1)
+    return generation
+
+
+async def aget_last_change():
+    return await cache.aget(CHANGED_AT_KEY)
+
+
+async def amake_key(namespace, params):
+    digest = hashlib.md5(json.dumps(params, ensure_ascii=False).encode()).hexdigest()
+    return f'members:{await aget_generation()}:{namespace}:{digest}'
+
+
+async def _acount(key):
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 1, timeout=None)
+
+
+async def aget_or_build(namespace, params, builder, timeout=None):
+    """`get_or_build` এর async সংস্করণ; `builder` একটি async ফাংশন।"""
+    key = await amake_key(namespace, params)
+    value = await cache.aget(key)
+    if value is not None:
+        await _acount(HITS_KEY)
+        return value
+    await _acount(MISSES_KEY)
+    value = await builder()
+    if timeout is None:
+        timeout = getattr(settings, 'MEMBER_CACHE_TIMEOUT', DEFAULT_TIMEOUT)
+    await cache.aset(key, value, timeout)
+    return value
+
+
+def get_cache_stats():
+    """hit/miss কাউন্টার এবং বর্তমান generation।"""
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else None,
+        'generation': get_generation(),
+    }
+
+
+# --- cache backend ---
+
+class AsyncLocMemCache(LocMemCache):
+    """
+    Django এর `LocMemCache`, কিন্তু async মেথডগুলো সরাসরি চলে। ডিফল্ট async মেথড প্রতিটি
+    কলে `sync_to_async` দিয়ে thread এ যায়; এখানে সব কাজ প্রসেসের মেমরিতে (IO নেই),
+    তাই event loop আটকায় না এবং async ভিউয়ের প্রতি রিকোয়েস্টে কয়েকটি thread hop বাঁচে।
+    `CACHES['default']['BACKEND']` এ ব্যবহার হয়।
+    """
+
+    async def aadd(self, key, value, timeout=DEFAULT_CACHE_TIMEOUT, version=None):
+        return self.add(key, value, timeout, version)
+
+    async def aget(self, key, default=None, version=None):
+        return self.get(key, default, version)
+
+    async def aset(self, key, value, timeout=DEFAULT_CACHE_TIMEOUT, version=None):
+        return self.set(key, value, timeout, version)
+
+    async def atouch(self, key, timeout=DEFAULT_CACHE_TIMEOUT, version=None):
+        return self.touch(key, timeout, version)
+
+    async def adelete(self, key, version=None):
+        return self.delete(key, version)
+
+    async def aget_many(self, keys, version=None):
+        return self.get_many(keys, version)
+
+    async def ahas_key(self, key, version=None):
+        return self.has_key(key, version)
+
+    async def aincr(self, key, delta=1, version=None):
+        return self.incr(key, delta, version)
+
+    async def aclear(self):
+        return self.clear()
+
+
+# --- একাধিক worker প্রসেস ---
+# `bump_generation` শুধু এই cache এ লেখে। LocMemCache প্রতিটি প্রসেসের নিজস্ব, তাই অন্য worker
+# গুলো পুরনো পেজ/API এবং conditional GET এর অবস্থা (`pages.conditional`, অর্থাৎ ভুল 304)
+# মেয়াদ শেষ না হওয়া পর্যন্ত দেখায়। সেজন্য শেয়ার করা backend লাগে (`DJANGO_CACHE_URL`)।
+
+def cache_is_process_local(alias='default'):
+    backend = import_string(settings.CACHES[alias]['BACKEND'])
+    return issubclass(backend, LocMemCache)
+
+
+def worker_count():
+    """gunicorn ও uvicorn দুটোই `WEB_CONCURRENCY` থেকে worker সংখ্যা পড়ে।"""
+    try:
+        return int(os.environ.get('WEB_CONCURRENCY', 1))
+    except ValueError:
+        return 1
+
+
+def ensure_shared_cache():
+    """একাধিক worker এ প্রসেস-লোকাল cache হলে চালু হতে দেয় না (`PagesConfig.ready`)।"""
+    if worker_count() > 1 and cache_is_process_local():
+        raise ImproperlyConfigured(
+            'WEB_CONCURRENCY > 1 needs a cache shared between worker processes: set DJANGO_CACHE_URL '
+            '(redis://, memcached:// or file://) instead of the per-process LocMemCache.'
+        )
+
+
+@checks.register(checks.Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if cache_is_process_local():
+        return [checks.Warning(
+            'The default cache is a per-process LocMemCache; member cache invalidation only reaches '
+            'the worker that made the change.',
+            hint='Set DJANGO_CACHE_URL to a redis://, memcached:// or file:// cache when running more than one worker.',
+            id='pages.W001',
+        )]
+    return []
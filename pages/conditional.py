@@ -0,0 +1,102 @@
+# pages/conditional.py
+"""
+সদস্য ডিরেক্টরি এবং API এর জন্য conditional GET (ETag / Last-Modified)।
+
+validator গুলো সস্তা aggregate অবস্থা থেকে তৈরি হয় — MAX(updated_at) (ইনডেক্স থেকে), মোট ও
+সক্রিয় সদস্যের সংখ্যা (`MemberStat` সারাংশ টেবিল থেকে, scan ছাড়া) এবং কোয়েরি প্যারামিটার। এই অবস্থাটি নিজেও versioned cache এ থাকে,
+তাই অপরিবর্তিত পেজের 304 রেসপন্সে সাধারণত কোনো ডাটাবেস কোয়েরি লাগে না।
+"""
+import hashlib
+import json
+
+from django.db.models import Max, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .cache import aget_last_change, aget_or_build, get_last_change, get_or_build
+from .models import Member, MemberStat
+
+
+# একটি কোয়েরিতে: সারাংশ টেবিলের যোগফল এবং `member_updated_at_idx` থেকে সর্বশেষ updated_at
+STATE_AGGREGATES = {
+    'last_updated': Max(Subquery(Member.objects.order_by('-updated_at').values('updated_at')[:1])),
+    'total': Coalesce(Sum('count'), 0),
+    'active': Coalesce(Sum('count', filter=Q(is_active=True)), 0),
+}
+
+
+def _make_state(state, last_change):
+    last_modified = state['last_updated'].timestamp() if state['last_updated'] else 0
+    # delete বা queryset.update() MAX(updated_at) বদলায় না — তাই শেষ invalidation এর সময়ও ধরা হয়
+    if last_change:
+        last_modified = max(last_modified, last_change)
+    return {'last_modified': int(last_modified), 'total': state['total'], 'active': state['active']}
+
+
+def _compute_state():
+    return _make_state(MemberStat.objects.aggregate(**STATE_AGGREGATES), get_last_change())
+
+
+async def _acompute_state():
+    return _make_state(await MemberStat.objects.aaggregate(**STATE_AGGREGATES), await aget_last_change())
+
+
+def directory_state():
+    """সদস্য টেবিলের aggregate অবস্থা (cache থেকে; সদস্য বদলালে নতুন করে গণনা হয়)।"""
+    return get_or_build('state', (), _compute_state)
+
+
+async def adirectory_state():
+    return await aget_or_build('state', (), _acompute_state)
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(json.dumps(parts, ensure_ascii=False, default=str).encode()).hexdigest()
+    return quote_etag(digest)
+
+
+def directory_validators(namespace, params):
+    """তালিকা ধরনের রেসপন্সের জন্য `(etag, last_modified)`।"""
+    state = directory_state()
+    etag = make_etag(namespace, state['last_modified'], state['total'], state['active'], params)
+    return etag, state['last_modified']
+
+
+async def adirectory_validators(namespace, params):
+    state = await adirectory_state()
+    etag = make_etag(namespace, state['last_modified'], state['total'], state['active'], params)
+    return etag, state['last_modified']
+
+
+def object_validators(namespace, pk, updated_at, params=()):
+    """একজন সদস্যের রেসপন্সের জন্য `(etag, last_modified)`।"""
+    return make_etag(namespace, pk, updated_at.isoformat(), params), int(updated_at.timestamp())
+
+
+def respond_conditionally(request, validators, build_response):
+    """
+    `If-None-Match` / `If-Modified-Since` মিলে গেলে `build_response()` না চালিয়েই 304 ফেরত দেয়।
+    নাহলে রেসপন্স তৈরি করে তাতে `ETag` এবং `Last-Modified` হেডার বসায়।
+    """
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = build_response()
+    return _set_validators(response, etag, last_modified)
+
+
+async def arespond_conditionally(request, validators, build_response):
+    """`respond_conditionally` এর async সংস্করণ; `build_response` একটি async ফাংশন।"""
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = await build_response()
+    return _set_validators(response, etag, last_modified)
+
+
+def _set_validators(response, etag, last_modified):
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    return response
@@ -0,0 +1,13 @@
+# pages/context_processors.py
+from django.utils.functional import SimpleLazyObject
+
+from .stats import get_stats
+
+
+def member_stats(request):
+    """
+    সব টেমপ্লেটে `member_stats` — `pages.stats.get_stats()` এর ফলাফল, যেমন:
+    `{{ member_stats.active }}`, `{{ member_stats.roles.President.active }}`।
+    lazy, তাই যে টেমপ্লেট ব্যবহার করে না সেখানে কোনো কোয়েরি বা cache lookup হয় না।
+    """
+    return {'member_stats': SimpleLazyObject(get_stats)}
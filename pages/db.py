@@ -0,0 +1,84 @@
+# pages/db.py
+"""
+প্রোডাকশন SQLite প্রোফাইলের সহায়ক অংশ (`DJANGO_DB_PROFILE=production`, `config/settings.py`)।
+
+- `apply_pragmas`: নতুন connection এ WAL, busy_timeout, mmap ইত্যাদি PRAGMA বসায়
+  (`pages.signals` এর `connection_created` রিসিভার থেকে, alias এর `PRAGMAS` অনুযায়ী)।
+- `ReadOnlyRouter`: GET/HEAD রিকোয়েস্টের ভেতরে সদস্য ডেটা পড়া read-only alias এ পাঠায়,
+  লেখা সবসময় primary (`default`) তে। WAL মোডে reader রা writer কে আটকায় না।
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+import re
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# read-only alias এর নাম (`settings.DATABASES` এ থাকলে তবেই ব্যবহার হয়)
+READ_ONLY_ALIAS = 'readonly'
+
+# যে মডেলগুলোর read, read-only alias এ যেতে পারে ('app_label.ModelName' lowercase)
+READ_ONLY_MODELS = {'pages.member', 'pages.membersearchentry'}
+
+_PRAGMA_NAME = re.compile(r'^[a-z_]+$')
+
+_read_only = ContextVar('pages_read_only_request', default=False)
+
+
+def apply_pragmas(connection, pragmas):
+    """DB-API (sqlite3) connection এ `{name: value}` PRAGMA গুলো বসায়।"""
+    for name, value in pragmas.items():
+        if not _PRAGMA_NAME.match(name):
+            raise ValueError(f'Invalid PRAGMA name: {name!r}')
+        connection.execute(f'PRAGMA {name} = {value}')
+
+
+@contextmanager
+def read_only_request():
+    """এই ব্লকের ভেতরে `READ_ONLY_MODELS` এর read গুলো read-only alias এ যায়।"""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def _read_only_alias_available():
+    """
+    read-only alias কনফিগার করা আছে এবং সেটি primary এর test mirror নয়
+    (টেস্টে mirror আলাদা connection হলে primary এর transaction এর ডেটা দেখতে পায় না)।
+    """
+    if READ_ONLY_ALIAS not in settings.DATABASES:
+        return False
+    return connections[READ_ONLY_ALIAS].settings_dict['NAME'] != connections[DEFAULT_DB_ALIAS].settings_dict['NAME']
+
+
+class ReadOnlyRouter:
+    """
+    GET ভিউ থেকে সদস্য পড়া -> `readonly`, বাকি সব (এবং সব লেখা) -> `default`।
+    দুটি alias একই ডাটাবেস ফাইল, তাই migration শুধু `default` এ চলে।
+    """
+
+    def db_for_read(self, model, **hints):
+        if _read_only.get() and _label(model) in READ_ONLY_MODELS and _read_only_alias_available():
+            return READ_ONLY_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        # read-only alias থেকে লোড করা instance save করলেও primary তে লেখা হবে
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, READ_ONLY_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == READ_ONLY_ALIAS:
+            return False
+        return None
@@ -0,0 +1,86 @@
+# pages/exports.py
+"""
+সদস্য তালিকার streaming export (CSV / NDJSON)।
+
+`queryset.values().iterator()` দিয়ে সারিগুলো chunk আকারে পড়া হয় এবং সাথে সাথে লেখা হয়,
+তাই টেবিল যত বড়ই হোক মেমোরি স্থির থাকে এবং প্রথম বাইট সাথে সাথেই পাঠানো শুরু হয়।
+API (`MemberViewSet.export`) এবং `export_members` কমান্ড দুটোই এটি ব্যবহার করে।
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# export এ যে কলামগুলো থাকে (এই ক্রমে)
+EXPORT_FIELDS = [
+    'id', 'name', 'role', 'area', 'phone', 'email', 'bio',
+    'image', 'is_active', 'joined_date', 'created_at', 'updated_at',
+]
+
+# ডাটাবেস থেকে প্রতিবার কতগুলো সারি আনা হবে
+DEFAULT_CHUNK_SIZE = 2000
+
+# কতগুলো সারি একসাথে জোড়া লাগিয়ে একটি chunk হিসেবে পাঠানো হবে
+ROWS_PER_WRITE = 500
+
+# এই অক্ষরগুলো দিয়ে শুরু হওয়া ঘরকে স্প্রেডশিট সূত্র হিসেবে চালায় (CSV formula injection),
+# তাই CSV তে এদের আগে `'` বসে — ঘরটি লেখা হিসেবেই দেখায়
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class _Echo:
+    """csv.writer এর জন্য pseudo-buffer — লেখা লাইনটিই ফেরত দেয়।"""
+
+    def write(self, value):
+        return value
+
+
+def iter_rows(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """`id` অনুযায়ী সাজানো সদস্যের সারি (dict), chunk আকারে ডাটাবেস থেকে পড়া।"""
+    return queryset.order_by('id').values(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+
+
+def _batched(lines):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= ROWS_PER_WRITE:
+            yield ''.join(batch)
+            batch = []
+    if batch:
+        yield ''.join(batch)
+
+
+def _csv_cell(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_lines(rows):
+    writer = csv.writer(_Echo())
+    # UTF-8 BOM — Excel যাতে বাংলা নাম ঠিকভাবে দেখায়
+    yield '\ufeff' + writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([_csv_cell(row[field]) for field in EXPORT_FIELDS])
+
+
+def _ndjson_lines(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def stream_export(queryset, export_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    """`export_format` ('csv' বা 'ndjson') অনুযায়ী export এর text chunk গুলো yield করে।"""
+    rows = iter_rows(queryset, chunk_size)
+    lines = _csv_lines(rows) if export_format == 'csv' else _ndjson_lines(rows)
+    return _batched(lines)
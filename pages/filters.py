@@ -0,0 +1,90 @@
+# pages/filters.py
+from rest_framework import filters
+
+from .areas import matching_areas
+from .models import Member
+from .search import get_search_backend
+
+# `?ordering=` এর ফিল্ড -> ডাটাবেসের কলাম: পদবি বর্ণানুক্রমে নয়, পদের ক্রমে (`role_rank`)
+ORDERING_ALIASES = {'role': 'role_rank'}
+
+
+def filter_role(queryset, role):
+    """
+    পদবি অনুযায়ী ফিল্টার। `role_rank` এর equality ও যোগ করা হয়, যাতে (is_active, role_rank,
+    name, id) ইনডেক্স থেকেই `Member.ORDERING` ক্রমে সারি আসে (আলাদা sort ছাড়া)।
+    """
+    return queryset.filter(role=role, role_rank=Member.rank_for_role(role))
+
+
+def ordering_column(field):
+    """`-role` -> `-role_rank`; বাকি ফিল্ড অপরিবর্তিত।"""
+    prefix = '-' if field.startswith('-') else ''
+    name = field.lstrip('-')
+    return prefix + ORDERING_ALIASES.get(name, name)
+
+
+def filter_members(queryset, params):
+    """
+    কোয়েরি প্যারামিটার অনুযায়ী ফিল্টার: `role` (হুবহু) এবং `area` (এলাকার নাম বা alias;
+    না মিললে আংশিক মিল — `pages.areas.matching_areas`)।
+    API ভিউসেট, export এবং async ভিউ সবাই এটি ব্যবহার করে।
+    """
+    # পদবি (`role`) অনুযায়ী ফিল্টার
+    role = params.get('role', None)
+    if role:
+        queryset = filter_role(queryset, role)
+
+    # এলাকা (`area`) অনুযায়ী ফিল্টার
+    area = params.get('area', None)
+    if area:
+        queryset = queryset.filter(area_ref__in=matching_areas(area))
+
+    return queryset
+
+
+def order_members(queryset, params, ordering_fields, default_ordering):
+    """
+    DRF ভিউসেটের `MemberSearchFilter` + `MemberOrderingFilter` এর মতো অর্ডারিং (DRF ছাড়া):
+    বৈধ `?ordering=` থাকলে সেটি, ranked সার্চ চলাকালীন rank এর ক্রম, নাহলে ডিফল্ট।
+    """
+    ordering = [
+        ordering_column(field.strip()) for field in (params.get('ordering') or '').split(',')
+        if field.strip().lstrip('-') in ordering_fields
+    ]
+    if ordering:
+        return queryset.order_by(*ordering)
+    if params.get(MemberSearchFilter.search_param) and get_search_backend().ranked:
+        return queryset
+    return queryset.order_by(*default_ordering)
+
+
+class MemberSearchFilter(filters.SearchFilter):
+    """
+    DRF এর `SearchFilter` কিন্তু OR-LIKE এর বদলে কনফিগার করা সার্চ ব্যাকএন্ড
+    (`pages.search`) ব্যবহার করে। ফলাফল relevance অনুযায়ী সাজানো থাকে।
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        return get_search_backend().search(queryset, ' '.join(terms))
+
+
+class MemberOrderingFilter(filters.OrderingFilter):
+    """
+    সার্চ চলাকালীন `?ordering=` না দিলে ডিফল্ট অর্ডারিং প্রয়োগ করে না,
+    যাতে সার্চ ব্যাকএন্ডের rank অনুযায়ী সাজানো ক্রম বজায় থাকে।
+    """
+
+    def get_default_ordering(self, view):
+        request = getattr(view, 'request', None)
+        if request is not None and get_search_backend().ranked:
+            if request.query_params.get(MemberSearchFilter.search_param):
+                return None
+        return super().get_default_ordering(view)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        return ordering and [ordering_column(field) for field in ordering]
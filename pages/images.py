@@ -0,0 +1,174 @@
+# pages/images.py
+"""
+সদস্যের ছবি প্রসেসিং (WEBP কনভার্সন এবং responsive thumbnail derivative)।
+রিকোয়েস্টের ভেতরে নয়, ব্যাকগ্রাউন্ড টাস্ক (`pages.tasks`) বা `reencode_media` কমান্ড থেকে চালানো হয়।
+"""
+import hashlib
+from io import BytesIO
+import os
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+# WEBP এনকোডিং কোয়ালিটি
+WEBP_QUALITY = 85
+# AVIF (ঐচ্ছিক, `reencode_media --avif`) — একই মানের জন্য WEBP এর চেয়ে কম কোয়ালিটি যথেষ্ট
+AVIF_QUALITY = 60
+
+# srcset এর জন্য যে প্রস্থগুলোর (px) derivative তৈরি হয়
+DERIVATIVE_WIDTHS = (96, 256, 768)
+
+# derivative ফাইলগুলো এখানে থাকে: <DERIVATIVE_DIR>/<hash[:2]>/<hash>_<width>.webp
+DERIVATIVE_DIR = 'members/derivatives'
+
+
+def encode_webp(source, quality=WEBP_QUALITY):
+    """একটি ইমেজ ফাইল (path বা file object) পড়ে WEBP bytes ফেরত দেয়।"""
+    with Image.open(source) as img:
+        webp_io = BytesIO()
+        img.save(webp_io, format='WEBP', quality=quality)
+    return webp_io.getvalue()
+
+
+def convert_member_image(member):
+    """
+    সদস্যের বর্তমান ছবিকে WEBP তে কনভার্ট করে সংরক্ষণ করে; নতুন ফাইলের নাম `member.image` এ
+    বসানো থাকে (মডেল save করে না)। storage (`pages.storage`) নাম দেয় কনটেন্টের hash থেকে।
+    আগের ফাইলটি মোছা হয় না — অন্য সদস্যও একই ফাইল ব্যবহার করতে পারে; আগের নাম ফেরত দেয়।
+    """
+    old_name = member.image.name
+    with member.image.open('rb') as source:
+        data = encode_webp(source)
+    stem = os.path.splitext(os.path.basename(old_name))[0]
+    member.image.save(f'{stem}.webp', ContentFile(data), save=False)
+    return old_name
+
+
+# --- Responsive derivative (thumbnail) ---
+# `Member.image_derivatives` manifest এর গঠন:
+# {"source": <image name>, "hash": <sha256>, "sizes": {"96": <file name>, ...}}
+
+def derivatives_are_current(member):
+    """manifest টি সদস্যের বর্তমান ছবির জন্য তৈরি কিনা (কোনো IO ছাড়া)।"""
+    manifest = member.image_derivatives or {}
+    return bool(member.image) and manifest.get('source') == member.image.name
+
+
+def derivative_name(source_hash, width, extension='webp'):
+    return f'{DERIVATIVE_DIR}/{source_hash[:2]}/{source_hash}_{width}.{extension}'
+
+
+def encode(img, format, quality):
+    buffer = BytesIO()
+    img.save(buffer, format=format, quality=quality)
+    return buffer.getvalue()
+
+
+def generate_derivatives(member, widths=DERIVATIVE_WIDTHS):
+    """
+    সদস্যের বর্তমান ছবি থেকে প্রতিটি প্রস্থের WEBP derivative তৈরি করে manifest ফেরত দেয়।
+    ফাইলগুলো ছবির content hash দিয়ে নামকরণ করা, তাই একই ছবির derivative আগে থেকে
+    ডিস্কে থাকলে আবার এনকোড করা হয় না। মূল ছবির চেয়ে বড় প্রস্থ তৈরি করা হয় না।
+    """
+    with member.image.open('rb') as source:
+        data = source.read()
+    return build_derivatives(member.image.storage, member.image.name, data, widths)
+
+
+def build_derivatives(storage, name, data, widths=DERIVATIVE_WIDTHS, avif=False):
+    """
+    `generate_derivatives` এর মূল অংশ: `data` (`name` ফাইলের bytes) থেকে derivative এবং manifest।
+    `avif=True` হলে প্রতিটি প্রস্থের AVIF ও (`manifest['avif']`)।
+    """
+    source_hash = hashlib.sha256(data).hexdigest()
+    formats = [('sizes', 'webp', 'WEBP', WEBP_QUALITY)]
+    if avif:
+        formats.append(('avif', 'avif', 'AVIF', AVIF_QUALITY))
+
+    manifest = {'source': name, 'hash': source_hash}
+    with Image.open(BytesIO(data)) as img:
+        original_width = img.width
+        for key, extension, format, quality in formats:
+            variants = manifest[key] = {}
+            for width in sorted(widths):
+                actual_width = min(width, original_width)
+                derivative = derivative_name(source_hash, actual_width, extension)
+                if not storage.exists(derivative):
+                    thumb = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+                    thumb.thumbnail((actual_width, actual_width * 4))
+                    storage.save(derivative, ContentFile(encode(thumb, format, quality)))
+                variants[str(actual_width)] = derivative
+                if width >= original_width:
+                    break
+    return manifest
+
+
+# --- পুরো লাইব্রেরি রি-এনকোড (`reencode_media` কমান্ড) ---
+# নিচের ফাংশনগুলো worker প্রসেসে চলে: শুধু ফাইল পড়া/লেখা, ডাটাবেস নয়।
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        while chunk := source.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reencode_member_image(media_root, name, known_hash=None, avif=False, quality=WEBP_QUALITY):
+    """
+    MEDIA_ROOT এর `name` ছবিকে WEBP তে (আগে থেকেই WEBP হলে যেমন আছে) এবং derivative
+    (ও AVIF) তৈরি করে। উৎসের hash `known_hash` এর সমান হলে কিছুই করে না।
+    ফেরত দেয় `{'source', 'hash', 'image', 'derivatives'}` (অপরিবর্তিত হলে `image` নেই)।
+    """
+    from .storage import ContentAddressedStorage
+
+    storage = ContentAddressedStorage(location=media_root)
+    with storage.open(name, 'rb') as source:
+        data = source.read()
+    source_hash = hashlib.sha256(data).hexdigest()
+    if source_hash == known_hash:
+        return {'source': name, 'hash': source_hash}
+
+    with Image.open(BytesIO(data)) as img:
+        if img.format != 'WEBP':
+            img = ImageOps.exif_transpose(img)
+            data = encode(img, 'WEBP', quality)
+    image = storage.save(f'{os.path.splitext(os.path.basename(name))[0]}.webp', ContentFile(data))
+    return {
+        'source': name, 'hash': source_hash, 'image': image,
+        'derivatives': build_derivatives(storage, image, data, avif=avif),
+    }
+
+
+def reencode_static_image(path, known_hash=None, avif=False, quality=WEBP_QUALITY):
+    """
+    static ছবির পাশে একই নামের `.webp` (JPEG/PNG হলে) ও `.avif` তৈরি করে; মূল ফাইল থাকে।
+    ফেরত দেয় `{'source', 'hash', 'outputs'}`।
+    """
+    source_hash = file_hash(path)
+    if source_hash == known_hash:
+        return {'source': path, 'hash': source_hash}
+    stem = os.path.splitext(path)[0]
+    outputs = []
+    with Image.open(path) as img:
+        img = ImageOps.exif_transpose(img)
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'A' in img.getbands() or 'transparency' in img.info else 'RGB')
+        targets = [] if path.lower().endswith('.webp') else [('.webp', 'WEBP', quality)]
+        if avif:
+            targets.append(('.avif', 'AVIF', AVIF_QUALITY))
+        for extension, format, target_quality in targets:
+            data = encode(img, format, target_quality)
+            temp_path = f'{stem}{extension}.tmp'
+            with open(temp_path, 'wb') as output:
+                output.write(data)
+            os.replace(temp_path, stem + extension)
+            outputs.append(stem + extension)
+    return {'source': path, 'hash': source_hash, 'outputs': outputs}
+
+
+def derivative_variants(member, key='sizes'):
+    """manifest থেকে `[(width, url), ...]` (ছোট থেকে বড়)। `key='avif'`: AVIF সংস্করণগুলো (থাকলে)।"""
+    storage = member.image.storage
+    sizes = (member.image_derivatives or {}).get(key, {})
+    return sorted((int(width), storage.url(name)) for width, name in sizes.items())
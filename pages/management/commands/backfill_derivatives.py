@@ -0,0 +1,23 @@
+# pages/management/commands/backfill_derivatives.py
+from django.core.management.base import BaseCommand
+
+from pages.tasks import enqueue_missing_derivatives
+
+
+class Command(BaseCommand):
+    """
+    derivative manifest পুরনো বা নেই এমন সদস্যদের (যেমন derivative চালুর আগে আপলোড করা
+    ছবি) srcset derivative তৈরির টাস্ক কিউতে পাঠায় — `run_tasks` worker সেগুলো তৈরি করে।
+    নতুন ছবির derivative সংরক্ষণের টাস্কেই (`process_member_image`) তৈরি হয়; API বা পেজ
+    রেন্ডার টাস্ক পাঠায় না, তখন মূল ছবিই দেখানো হয়।
+
+    ব্যবহার: python manage.py backfill_derivatives [--chunk-size N]
+    """
+    help = 'Queue derivative generation for members whose image derivatives are missing or stale.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Members read per query.')
+
+    def handle(self, *args, **options):
+        count = enqueue_missing_derivatives(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'{count} derivative tasks queued.'))
@@ -0,0 +1,193 @@
+# pages/management/commands/bench_asgi.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import json
+import statistics
+import sys
+import threading
+import time
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from pages.models import Member
+
+# (মোড, সার্ভার, এন্ডপয়েন্ট) — একই কোয়েরি, একই আউটপুট
+MODES = (
+    ('wsgi', 'wsgi', 'pages:member-api-list'),
+    ('asgi-sync', 'asgi', 'pages:member-api-list'),
+    ('asgi-async', 'asgi', 'pages:member-async-list'),
+)
+
+DUMMY_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+
+
+class Command(BaseCommand):
+    """
+    একই সদস্য API এন্ডপয়েন্টে WSGI বনাম ASGI এর লোড তুলনা, প্রসেসের ভেতরেই
+    (uvicorn/gunicorn ছাড়া): অনেক ধীর ক্লায়েন্ট একসাথে রিকোয়েস্ট পাঠায়।
+
+    - wsgi: `WSGIHandler`, নির্দিষ্ট সংখ্যক worker thread (gunicorn `gthread` এর মতো);
+      ধীর ক্লায়েন্ট রেসপন্স পড়া শেষ না করা পর্যন্ত thread আটকে থাকে।
+    - asgi-sync: `ASGIHandler` + DRF ভিউ (sync adapter এর thread এ চলে)।
+    - asgi-async: `ASGIHandler` + `pages.async_views` (event loop এ চলে)।
+
+    `--no-cache` দিলে প্রতিটি রিকোয়েস্ট ডাটাবেসে যায়।
+    ব্যবহার: python manage.py bench_asgi --clients 200 --requests 5 --client-delay 0.2
+    """
+    help = 'Compare WSGI and ASGI throughput on the member list API with many slow clients.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=100, help='Concurrent clients.')
+        parser.add_argument('--requests', type=int, default=5, help='Requests per client.')
+        parser.add_argument('--client-delay', type=float, default=0.2,
+                            help='Seconds each client takes to read a response (slow client).')
+        parser.add_argument('--threads', type=int, default=8, help='WSGI worker threads.')
+        parser.add_argument('--host', default='localhost', help='Host header (must be in ALLOWED_HOSTS).')
+        parser.add_argument('--no-cache', action='store_true', help='Disable the cache so every request hits the database.')
+        parser.add_argument('--only', nargs='+', choices=[mode for mode, _, _ in MODES])
+        parser.add_argument('--output', help='Write results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        if not Member.objects.filter(is_active=True).exists():
+            raise CommandError('No members to benchmark; run seed_members first.')
+        roles = [role for role, _ in Member.ROLE_CHOICES]
+
+        results = {}
+        overrides = {'METRICS_SLOW_REQUEST_MS': float('inf')}  # ধীর ক্লায়েন্ট = ধীর রিকোয়েস্ট, লগ নয়
+        if options['no_cache']:
+            overrides['CACHES'] = DUMMY_CACHES
+        with override_settings(**overrides):
+            for mode, server, url_name in MODES:
+                if options['only'] and mode not in options['only']:
+                    continue
+                path = reverse(url_name)
+                queries = [f'cursor=&page_size=20&role={role}' for role in roles]
+                results[mode] = asyncio.run(self.run_mode(server, path, queries, options))
+                self.report(mode, results[mode])
+
+        if 'wsgi' in results and 'asgi-async' in results and results['wsgi']['requests_per_sec']:
+            self.stdout.write(self.style.SUCCESS(
+                f'asgi-async vs wsgi: x{results["asgi-async"]["requests_per_sec"] / results["wsgi"]["requests_per_sec"]:.1f} req/s'
+            ))
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
+
+    # --- এক মোডের লোড ---
+
+    async def run_mode(self, server, path, queries, options):
+        if server == 'wsgi':
+            handler, pool = WSGIHandler(), ThreadPoolExecutor(max_workers=options['threads'])
+            loop = asyncio.get_running_loop()
+
+            async def send_request(query):
+                return await loop.run_in_executor(
+                    pool, self.wsgi_request, handler, path, query, options['host'], options['client_delay']
+                )
+        else:
+            handler, pool = ASGIHandler(), None
+
+            async def send_request(query):
+                return await self.asgi_request(handler, path, query, options['host'], options['client_delay'])
+
+        latencies, statuses, peak = [], {}, [threading.active_count()]
+        done = asyncio.Event()
+
+        async def sample_threads():
+            while not done.is_set():
+                peak[0] = max(peak[0], threading.active_count())
+                await asyncio.sleep(0.01)
+
+        async def client(index):
+            for number in range(options['requests']):
+                started = time.perf_counter()
+                status = await send_request(queries[(index + number) % len(queries)])
+                latencies.append(time.perf_counter() - started)
+                statuses[status] = statuses.get(status, 0) + 1
+
+        # warm-up: প্রতিটি কোয়েরি একবার, যাতে সব মোড একই (গরম) cache অবস্থা থেকে শুরু করে
+        for query in queries:
+            await send_request(query)
+
+        sampler = asyncio.create_task(sample_threads())
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(client(index) for index in range(options['clients'])))
+        finally:
+            elapsed = time.perf_counter() - started
+            done.set()
+            await sampler
+            if pool is not None:
+                pool.shutdown()
+
+        latencies.sort()
+        return {
+            'requests': len(latencies),
+            'requests_per_sec': round(len(latencies) / elapsed, 1),
+            'median_ms': round(statistics.median(latencies) * 1000, 1),
+            'p95_ms': round(latencies[int(len(latencies) * 0.95)] * 1000, 1),
+            'peak_threads': peak[0],
+            'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        }
+
+    @staticmethod
+    def wsgi_request(handler, path, query, host, delay):
+        environ = {
+            'REQUEST_METHOD': 'GET', 'SCRIPT_NAME': '', 'PATH_INFO': path, 'QUERY_STRING': query,
+            'SERVER_NAME': host, 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1', 'HTTP_HOST': host,
+            'REMOTE_ADDR': '127.0.0.1', 'wsgi.version': (1, 0), 'wsgi.url_scheme': 'http',
+            'wsgi.input': BytesIO(), 'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True, 'wsgi.multiprocess': False, 'wsgi.run_once': False,
+        }
+        status = []
+        body = handler(environ, lambda line, headers, exc_info=None: status.append(int(line.split()[0])))
+        try:
+            for _ in body:
+                pass
+            # ধীর ক্লায়েন্ট: রেসপন্স পাঠানো শেষ না হওয়া পর্যন্ত worker thread আটকে থাকে
+            time.sleep(delay)
+        finally:
+            body.close()
+        return status[0]
+
+    @staticmethod
+    async def asgi_request(handler, path, query, host, delay):
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': query.encode(),
+            'root_path': '', 'headers': [(b'host', host.encode())],
+            'client': ('127.0.0.1', 0), 'server': (host, 80),
+        }
+        received, finished, status = False, asyncio.Event(), []
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status.append(message['status'])
+            elif message['type'] == 'http.response.body' and not message.get('more_body'):
+                # ধীর ক্লায়েন্ট: event loop এ অপেক্ষা, কোনো thread আটকে থাকে না
+                await asyncio.sleep(delay)
+
+        try:
+            await handler(scope, receive, send)
+        finally:
+            finished.set()
+        return status[0]
+
+    def report(self, mode, result):
+        self.stdout.write(
+            f'{mode:<11} {result["requests_per_sec"]:>8.1f} req/s  median {result["median_ms"]} ms  '
+            f'p95 {result["p95_ms"]} ms  peak threads {result["peak_threads"]}  status {result["statuses"]}'
+        )
@@ -0,0 +1,51 @@
+# pages/management/commands/bench_member_list.py
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+
+from pages.models import Member
+from pages.serializers import MemberListRowSerializer, MemberListSerializer
+
+
+class Command(BaseCommand):
+    """
+    সদস্য তালিকার দুটি সিরিয়ালাইজেশন পথের গতি তুলনা করে (rows/sec):
+    `MemberListSerializer` (মডেল instance) বনাম `MemberListRowSerializer` (`values()` সারি)।
+    ব্যবহার: python manage.py bench_member_list --repeat 5
+    """
+    help = 'Benchmark member list serialization (model serializer vs values() fast path).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per path; the best run is reported.')
+        parser.add_argument('--limit', type=int, default=None, help='Serialize at most this many members.')
+        parser.add_argument('--host', default='localhost', help='Host used to build absolute URLs.')
+
+    def handle(self, *args, **options):
+        request = RequestFactory(HTTP_HOST=options['host']).get('/api/members/')
+        queryset = Member.objects.filter(is_active=True).order_by(*Member.ORDERING)
+        if options['limit']:
+            queryset = queryset[:options['limit']]
+
+        def model_path():
+            return MemberListSerializer(queryset.all(), many=True, context={'request': request}).data
+
+        def values_path():
+            serializer = MemberListRowSerializer(request)
+            return serializer.serialize(queryset.values(*serializer.value_fields))
+
+        results = {}
+        for label, func in (('serializer', model_path), ('values', values_path)):
+            best, rows = None, 0
+            for _ in range(max(options['repeat'], 1)):
+                started = time.perf_counter()
+                rows = len(func())
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            results[label] = rows / best if best else 0.0
+            self.stdout.write(f'{label:>10}: {rows} rows in {best * 1000:.1f} ms ({results[label]:,.0f} rows/sec)')
+
+        if results['serializer']:
+            self.stdout.write(self.style.SUCCESS(
+                f'values() path is {results["values"] / results["serializer"]:.1f}x faster.'
+            ))
@@ -0,0 +1,69 @@
+# pages/management/commands/bench_members.py
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.benchmarks import compare, default_scenarios, run_benchmarks
+
+
+class Command(BaseCommand):
+    """
+    সদস্য ডিরেক্টরি, API, অ্যাডমিন এবং `Member.save()` এর বেঞ্চমার্ক চালায়।
+    ফলাফল JSON এ লেখে; কোনো scenario এর কোয়েরি সংখ্যা সীমা ছাড়ালে exit code 1।
+    ব্যবহার:
+        python manage.py seed_members --size 100k
+        python manage.py bench_members --output bench.json --compare previous.json
+    """
+    help = 'Benchmark member directory/API paths and fail on query-count regressions.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=5)
+        parser.add_argument('--output', help='Write results as JSON to this file.')
+        parser.add_argument('--compare', help='Previous JSON results to compare against.')
+        parser.add_argument('--host', default='localhost', help='Host header for the requests.')
+        parser.add_argument('--admin-user', help='Username for the admin changelist (default: first superuser).')
+        parser.add_argument(
+            '--only', nargs='+', choices=[scenario.name for scenario in default_scenarios()],
+            help='Run only these scenarios.',
+        )
+
+    def handle(self, *args, **options):
+        report = run_benchmarks(
+            iterations=max(options['iterations'], 1),
+            host=options['host'],
+            admin_user=options['admin_user'],
+            only=options['only'],
+        )
+
+        if options['compare']:
+            try:
+                with open(options['compare'], encoding='utf-8') as handle:
+                    previous = json.load(handle)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f'Cannot read {options["compare"]}: {exc}')
+            report['comparison'] = compare(report, previous)
+
+        self.stdout.write(f'{report["meta"]["members"]} members, {report["meta"]["iterations"]} iterations')
+        for name, result in report['results'].items():
+            if result['status'] == 'skipped':
+                self.stdout.write(f'{name:<24} skipped ({result["reason"]})')
+                continue
+            line = (
+                f'{name:<24} median {result["latency_ms"]["median"]:>9.2f} ms  '
+                f'p95 {result["latency_ms"]["p95"]:>9.2f} ms  '
+                f'queries {result["queries"]:>2}/{result["max_queries"]:<2}  '
+                f'peak {result["peak_memory_kb"]:>9.1f} KiB'
+            )
+            change = report.get('comparison', {}).get(name)
+            if change and change['median_change_pct'] is not None:
+                line += f'  ({change["median_change_pct"]:+.1f}%)'
+            style = self.style.ERROR if result['status'] == 'query_regression' else self.style.SUCCESS
+            self.stdout.write(style(line))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                json.dump(report, handle, ensure_ascii=False, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+        if report['failures']:
+            raise CommandError(f'Query-count regression: {", ".join(report["failures"])}')
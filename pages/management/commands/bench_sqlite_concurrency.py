@@ -0,0 +1,152 @@
+# pages/management/commands/bench_sqlite_concurrency.py
+import json
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from pages.db import apply_pragmas
+from pages.models import Member
+
+READ_SQL = (
+    f'SELECT id, name, role, area, image FROM {Member._meta.db_table} '
+    'WHERE is_active = 1 AND role_rank = ? ORDER BY role_rank, name, id LIMIT 20'
+)
+WRITE_SQL = f'UPDATE {Member._meta.db_table} SET bio = ?, updated_at = ? WHERE id = ?'
+
+
+class Command(BaseCommand):
+    """
+    মিশ্র read/write লোডে SQLite এর throughput মাপে — ডিফল্ট সেটিংস বনাম প্রোডাকশন প্রোফাইল
+    (WAL + PRAGMA, persistent connection, read-only reader connection, BEGIN IMMEDIATE)।
+    প্রতিটি মোড ডাটাবেসের একটি আলাদা কপিতে চলে, আসল ফাইল বদলায় না।
+    ব্যবহার: python manage.py bench_sqlite_concurrency --readers 8 --writers 2 --duration 10
+    """
+    help = 'Benchmark mixed read/write SQLite throughput: default settings vs the production profile.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=8)
+        parser.add_argument('--writers', type=int, default=2)
+        parser.add_argument('--duration', type=float, default=10.0, help='Seconds per mode.')
+        parser.add_argument('--output', help='Write results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        source = connections['default']
+        if source.vendor != 'sqlite':
+            raise CommandError('This benchmark only applies to SQLite.')
+        member_ids = list(Member.objects.values_list('id', flat=True)[:10000])
+        if not member_ids:
+            raise CommandError('No members to benchmark; run seed_members first.')
+
+        workdir = tempfile.mkdtemp(prefix='bench-sqlite-')
+        try:
+            results = {}
+            for mode in ('default', 'production'):
+                path = os.path.join(workdir, f'{mode}.sqlite3')
+                with sqlite3.connect(path) as target:
+                    source.ensure_connection()
+                    source.connection.backup(target)
+                target.close()
+                results[mode] = self.run_mode(mode, path, member_ids, options)
+                self.report(mode, results[mode])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        before, after = results['default'], results['production']
+        if before['reads_per_sec'] and before['writes_per_sec']:
+            self.stdout.write(self.style.SUCCESS(
+                f'production profile: reads x{after["reads_per_sec"] / before["reads_per_sec"]:.1f}, '
+                f'writes x{after["writes_per_sec"] / before["writes_per_sec"]:.1f}'
+            ))
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
+
+    # --- এক মোডের লোড ---
+
+    def connect(self, mode, path, read_only):
+        if mode == 'default':
+            # Django এর ডিফল্ট: rollback journal, timeout 5s, প্রতি রিকোয়েস্টে নতুন connection
+            return sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        if read_only:
+            conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, timeout=20, isolation_level=None)
+            apply_pragmas(conn, {k: v for k, v in settings.SQLITE_PRAGMAS.items() if k != 'journal_mode'})
+        else:
+            conn = sqlite3.connect(path, timeout=20, isolation_level=None)
+            apply_pragmas(conn, settings.SQLITE_PRAGMAS)
+        return conn
+
+    def run_mode(self, mode, path, member_ids, options):
+        if mode == 'production':
+            # WAL ডাটাবেস ফাইলে স্থায়ী হয়; reader রা read-only connection খোলার আগেই সেট করতে হয়
+            self.connect(mode, path, read_only=False).close()
+        persistent = mode == 'production'
+        begin = 'BEGIN IMMEDIATE' if persistent else 'BEGIN'
+        roles = list(Member.ROLE_RANKS.values())
+        deadline = time.perf_counter() + options['duration']
+        lock = threading.Lock()
+        stats = {'reads': [], 'writes': [], 'errors': 0}
+
+        def worker(read_only):
+            rng = random.Random()
+            conn = self.connect(mode, path, read_only) if persistent else None
+            latencies, errors = [], 0
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                current = conn or self.connect(mode, path, read_only)
+                try:
+                    if read_only:
+                        current.execute(READ_SQL, (rng.choice(roles),)).fetchall()
+                    else:
+                        current.execute(begin)
+                        current.execute(WRITE_SQL, (f'bench {rng.random()}', timezone.now().isoformat(), rng.choice(member_ids)))
+                        current.execute('COMMIT')
+                    latencies.append(time.perf_counter() - started)
+                except sqlite3.OperationalError:
+                    # "database is locked" — busy timeout এর পরেও lock পাওয়া যায়নি
+                    errors += 1
+                    if current.in_transaction:
+                        current.execute('ROLLBACK')
+                finally:
+                    if conn is None:
+                        current.close()
+            if conn is not None:
+                conn.close()
+            with lock:
+                stats['reads' if read_only else 'writes'].extend(latencies)
+                stats['errors'] += errors
+
+        threads = [threading.Thread(target=worker, args=(True,)) for _ in range(options['readers'])]
+        threads += [threading.Thread(target=worker, args=(False,)) for _ in range(options['writers'])]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        def p95(values):
+            return round(sorted(values)[int(len(values) * 0.95)] * 1000, 2) if values else None
+
+        return {
+            'reads_per_sec': round(len(stats['reads']) / options['duration'], 1),
+            'writes_per_sec': round(len(stats['writes']) / options['duration'], 1),
+            'read_p95_ms': p95(stats['reads']),
+            'write_p95_ms': p95(stats['writes']),
+            'read_median_ms': round(statistics.median(stats['reads']) * 1000, 2) if stats['reads'] else None,
+            'lock_errors': stats['errors'],
+        }
+
+    def report(self, mode, result):
+        self.stdout.write(
+            f'{mode:<11} reads {result["reads_per_sec"]:>9.1f}/s (p95 {result["read_p95_ms"]} ms)  '
+            f'writes {result["writes_per_sec"]:>8.1f}/s (p95 {result["write_p95_ms"]} ms)  '
+            f'lock errors {result["lock_errors"]}'
+        )
@@ -0,0 +1,79 @@
+# pages/management/commands/bench_suggest.py
+import json
+import random
+import resource
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.models import Member
+from pages.seed import generate_members
+from pages.suggest import DEFAULT_LIMIT, PrefixIndex, load_index
+
+
+class Command(BaseCommand):
+    """
+    typeahead prefix ইনডেক্সের (`pages.suggest`) মাপ: তৈরির সময়, মেমোরি এবং প্রতি কোয়েরির
+    latency (১-৪ অক্ষরের prefix, এক বা দুই শব্দ)। ডাটাবেসের সক্রিয় সদস্যদের থেকে, অথবা
+    `--synthetic N` দিলে ডাটাবেস ছাড়াই N জন কৃত্রিম সদস্য (`pages.seed`) থেকে।
+    ব্যবহার: python manage.py bench_suggest --synthetic 1000000 --queries 5000
+    """
+    help = 'Benchmark the in-memory member suggest index: build time, memory and lookup latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--synthetic', type=int, help='Index this many generated members instead of the database.')
+        parser.add_argument('--queries', type=int, default=2000)
+        parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', help='Write results as JSON to this file.')
+
+    def handle(self, *args, **options):
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        if options['synthetic']:
+            rows = (
+                (number, member.name, member.area, Member.rank_for_role(member.role))
+                for number, member in enumerate(generate_members(options['synthetic'], options['seed']), start=1)
+            )
+            index = PrefixIndex.build(rows)
+        else:
+            index = load_index()
+        build_seconds = time.perf_counter() - started
+        # প্রসেসের সর্বোচ্চ RSS এর বৃদ্ধি (Linux এ KB) — ইনডেক্স এবং তৈরির সময়ের অস্থায়ী মেমোরি
+        memory = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) * 1024
+        if not len(index):
+            raise CommandError('No members to index; run seed_members first or pass --synthetic.')
+
+        rng = random.Random(options['seed'])
+        words = rng.sample(index.terms, min(len(index.terms), 500))
+        queries = []
+        for _ in range(options['queries']):
+            query = rng.choice(words)[:rng.randint(1, 4)]
+            if rng.random() < 0.3:
+                query = f'{rng.choice(words)} {query}'
+            queries.append(query)
+
+        latencies, hits = [], 0
+        for query in queries:
+            started = time.perf_counter()
+            hits += bool(index.search(query, options['limit']))
+            latencies.append(time.perf_counter() - started)
+        latencies.sort()
+
+        results = {
+            'members': len(index),
+            'build_seconds': round(build_seconds, 2),
+            'memory_mb': round(memory / 2**20, 1),
+            'median_us': round(statistics.median(latencies) * 1e6, 1),
+            'p99_us': round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+            'queries_with_results': hits,
+        }
+        self.stdout.write(
+            f'{results["members"]} members: built in {results["build_seconds"]} s, {results["memory_mb"]} MB; '
+            f'lookup median {results["median_us"]} µs, p99 {results["p99_us"]} µs '
+            f'({hits}/{len(queries)} queries matched)'
+        )
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                json.dump(results, handle, indent=2)
@@ -0,0 +1,38 @@
+# pages/management/commands/export_members.py
+import sys
+
+from django.core.management.base import BaseCommand
+
+from pages.exports import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, stream_export
+from pages.filters import filter_members
+from pages.models import Member
+
+
+class Command(BaseCommand):
+    """
+    সদস্য তালিকা CSV বা NDJSON ফাইলে export করে (স্থির মেমোরিতে, streaming)।
+    ব্যবহার: python manage.py export_members --format csv --output members.csv --role Committee
+    """
+    help = 'Stream the member roster as CSV or NDJSON.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', '-o', help='Output file (default: stdout).')
+        parser.add_argument('--role', help='Only members with this role.')
+        parser.add_argument('--area', help='Only members in this area (name or alias; partial match as a fallback).')
+        parser.add_argument('--is-active', choices=['true', 'false', 'all'], default='true')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        # API export (`/api/members/export/`) এর একই ফিল্টার — এলাকার alias সহ
+        queryset = filter_members(Member.objects.all(), {'role': options['role'], 'area': options['area']})
+        if options['is_active'] != 'all':
+            queryset = queryset.filter(is_active=options['is_active'] == 'true')
+
+        chunks = stream_export(queryset, options['format'], options['chunk_size'])
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(chunks)
+            self.stderr.write(self.style.SUCCESS(f"Exported to {options['output']}"))
+        else:
+            sys.stdout.writelines(chunks)
@@ -0,0 +1,154 @@
+# pages/management/commands/gc_media.py
+from itertools import islice
+import os
+import posixpath
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from pages.cache import bump_generation
+from pages.images import DERIVATIVE_DIR
+from pages.models import Member
+from pages.storage import is_content_addressed, iter_files, member_image_storage
+
+
+def referenced_names(names):
+    """`names` (MEDIA_ROOT এর সাপেক্ষে) এর যেগুলো কোনো সদস্যের ছবি বা derivative manifest এ আছে।"""
+    found = set(Member.objects.filter(image__in=names).values_list('image', flat=True))
+
+    # derivative `<hash>_<width>.webp` — hash হলো সদস্যের (content-addressed) ছবির hash,
+    # তাই প্রথমে ছবির নাম দিয়ে (ইনডেক্সে) খোঁজা হয়
+    derivatives = {}
+    for name in names:
+        if name.startswith(DERIVATIVE_DIR + '/'):
+            digest = posixpath.basename(name).partition('_')[0]
+            derivatives.setdefault(digest, []).append(name)
+    if derivatives:
+        images = [f'{member_image_storage.prefix}/{digest[:2]}/{digest}.webp' for digest in derivatives]
+        manifests = list(Member.objects.filter(image__in=images).values_list('image_derivatives', flat=True))
+        unresolved = derivatives.keys() - {manifest.get('hash') for manifest in manifests}
+        if unresolved:
+            # পুরনো (hash লেআউটের আগের) ছবির derivative — manifest এর hash দিয়ে
+            manifests += Member.objects.filter(image_derivatives__hash__in=unresolved).values_list(
+                'image_derivatives', flat=True
+            )
+        for manifest in manifests:
+            found.update((manifest.get('sizes') or {}).values())
+            found.update((manifest.get('avif') or {}).values())  # `reencode_media --avif`
+    return found
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    """
+    MEDIA_ROOT এর ফাইলগুলো ডাটাবেসের রেফারেন্সের (`Member.image` ও derivative manifest) সাথে
+    মেলায় এবং কোনো সারি ব্যবহার করে না এমন ফাইল (orphan) দেখায় বা মুছে দেয়।
+
+    ডিরেক্টরিগুলো `os.scandir` দিয়ে ধীরে ধীরে পড়া হয় এবং নামগুলো `--chunk-size` করে
+    ডাটাবেসে (`member_image_idx` ইনডেক্সে) মেলানো হয় — পুরো তালিকা কখনো মেমোরিতে নেই।
+    সদ্য আপলোড হওয়া (এখনো commit না হওয়া) ফাইল যাতে না মোছে, তাই `--min-age` এর চেয়ে
+    নতুন ফাইল বাদ।
+
+    `--rehash`: পুরনো নামের (`members/<role>/...`) ছবিগুলো content-addressed নামে
+    (`pages.storage`) সরানো — একই ছবির কপিগুলো একটি ফাইলে মিলে যায়, পুরনো ফাইলগুলো
+    তারপর orphan হিসেবে ধরা পড়ে। `--missing`: যে সারির ছবি ডিস্কে নেই।
+
+    ব্যবহার: python manage.py gc_media [--rehash] [--missing] [--delete]
+    """
+    help = 'Report or delete media files no member references, and reconcile member images with the disk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delete', action='store_true', help='Delete orphans (default: only report).')
+        parser.add_argument(
+            '--min-age', type=int, default=24 * 60 * 60,
+            help='Ignore files modified within this many seconds (default: one day).',
+        )
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--rehash', action='store_true', help='Move legacy member images to content-addressed names first.')
+        parser.add_argument('--missing', action='store_true', help='Also report members whose image file is missing.')
+
+    def handle(self, *args, **options):
+        if options['rehash']:
+            self.rehash(options['chunk_size'])
+        if options['missing']:
+            self.report_missing(options['chunk_size'])
+        self.collect(options['delete'], options['min_age'], options['chunk_size'])
+
+    def rehash(self, chunk_size):
+        storage = member_image_storage
+        moved = 0
+        rows = (
+            Member.objects.exclude(image='').exclude(image__isnull=True).order_by('pk')
+            .values_list('pk', 'image', 'image_derivatives').iterator(chunk_size=chunk_size)
+        )
+        for pk, name, manifest in rows:
+            if is_content_addressed(name) or not storage.exists(name):
+                continue
+            with storage.open(name) as source:
+                new_name = storage.save(name, source)
+            if (manifest or {}).get('source') == name:
+                manifest = {**manifest, 'source': new_name}
+            # updated_at: fragment cache ও ETag পুরনো নাম না দেখায় (`--delete` সেটি মুছে ফেলবে)
+            moved += Member.objects.filter(pk=pk, image=name).update(
+                image=new_name, image_derivatives=manifest, updated_at=timezone.now(),
+            )
+        if moved:
+            bump_generation()
+        self.stdout.write(f'{moved} member images moved to content-addressed names.')
+
+    def report_missing(self, chunk_size):
+        storage = member_image_storage
+        missing = 0
+        rows = (
+            Member.objects.exclude(image='').exclude(image__isnull=True).order_by('pk')
+            .values_list('pk', 'image').iterator(chunk_size=chunk_size)
+        )
+        for pk, name in rows:
+            if not os.path.isfile(storage.path(name)):
+                missing += 1
+                self.stdout.write(f'  missing: member {pk} -> {name}')
+        self.stdout.write(f'{missing} members reference a missing image.')
+
+    def collect(self, delete, min_age, chunk_size):
+        root = os.path.abspath(settings.MEDIA_ROOT)
+        cutoff = time.time() - min_age
+        orphans = reclaimed = scanned = 0
+        emptied = set()
+        for chunk in chunked(iter_files(root), chunk_size):
+            scanned += len(chunk)
+            files = {os.path.relpath(entry.path, root).replace(os.sep, '/'): entry for entry in chunk}
+            referenced = referenced_names(list(files))
+            for name, entry in files.items():
+                if name in referenced:
+                    continue
+                stat_result = entry.stat(follow_symlinks=False)
+                if stat_result.st_mtime > cutoff:
+                    continue
+                orphans += 1
+                reclaimed += stat_result.st_size
+                self.stdout.write(f'  {"deleted" if delete else "orphan"}: {name} ({stat_result.st_size} bytes)')
+                if delete:
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        continue
+                    emptied.add(os.path.dirname(entry.path))
+        for directory in sorted(emptied, key=len, reverse=True):
+            # খালি হয়ে যাওয়া ডিরেক্টরি (এবং খালি parent) — MEDIA_ROOT নিজে নয়
+            while directory != root and directory.startswith(root):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    break
+                directory = os.path.dirname(directory)
+        action = 'deleted' if delete else 'found'
+        self.stdout.write(self.style.SUCCESS(
+            f'{scanned} files scanned; {orphans} orphan files {action} ({reclaimed} bytes).'
+        ))
@@ -0,0 +1,41 @@
+# pages/management/commands/prerender_pages.py
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.prerender import build, load_manifest, prerender_root, source_fingerprint
+
+
+class Command(BaseCommand):
+    """
+    মার্কেটিং পেজগুলো (`pages.prerender.PAGES`) রেন্ডার করে `PRERENDER_ROOT` এ HTML, gzip ও
+    Brotli ফাইল লেখে — `collectstatic` এর পরে চালান, যাতে hash করা static নামগুলো বসে।
+    চলমান প্রসেসগুলো পরের dirty-check এ নতুন ফাইলগুলো পড়ে নেয়।
+
+    `--check`: ফাইলগুলো টেমপ্লেটের সাথে হালনাগাদ কিনা শুধু দেখায় (না হলে exit code 1)।
+
+    ব্যবহার: python manage.py prerender_pages [--check]
+    """
+    help = 'Pre-render the fixed marketing pages to HTML with gzip/Brotli variants.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help='Only report whether the pages are up to date.')
+
+    def handle(self, *args, **options):
+        if options['check']:
+            manifest = load_manifest()
+            if manifest is None or manifest.get('fingerprint') != source_fingerprint():
+                raise CommandError('Pre-rendered pages are missing or out of date.')
+            self.stdout.write(self.style.SUCCESS(f'{len(manifest["pages"])} pre-rendered pages are up to date.'))
+            return
+
+        manifest = build()
+        root = prerender_root()
+        totals = {'identity': 0, 'gzip': 0, 'br': 0}
+        for path, page in manifest['pages'].items():
+            sizes = {encoding: (root / filename).stat().st_size for encoding, filename in page['files'].items()}
+            for encoding, size in sizes.items():
+                totals[encoding] += size
+            self.stdout.write(f'  {path}: ' + ', '.join(f'{encoding} {size}' for encoding, size in sizes.items()))
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(manifest["pages"])} pages pre-rendered to {root} '
+            f'({totals["identity"]} bytes; gzip {totals["gzip"]}, brotli {totals["br"]}).'
+        ))
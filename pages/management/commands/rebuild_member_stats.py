@@ -0,0 +1,31 @@
+# pages/management/commands/rebuild_member_stats.py
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.stats import rebuild
+
+
+class Command(BaseCommand):
+    """
+    সদস্য পরিসংখ্যানের সারাংশ টেবিল (`MemberStat`) সদস্য টেবিল থেকে নতুন করে গণনা করে
+    এবং গরমিলগুলো দেখায়। raw SQL বা ক্র্যাশের পরে, অথবা নিয়মিত (cron) চালানো যায়।
+    ব্যবহার: python manage.py rebuild_member_stats [--check]
+    """
+    help = 'Reconcile the member statistics summary table with the members table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help='Only report drift; exit with an error if any is found.',
+        )
+
+    def handle(self, *args, **options):
+        drift = rebuild(dry_run=options['check'])
+        for (role, area, is_active), (stored, actual) in sorted(drift.items()):
+            status = 'active' if is_active else 'inactive'
+            self.stdout.write(f'  {role} / {area} / {status}: {stored} -> {actual}')
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Member statistics are up to date.'))
+        elif options['check']:
+            raise CommandError(f'{len(drift)} statistics rows have drifted.')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'{len(drift)} statistics rows corrected.'))
@@ -0,0 +1,19 @@
+# pages/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from pages.search import get_search_backend
+
+
+class Command(BaseCommand):
+    """
+    সদস্যদের সার্চ ইনডেক্স পুরোপুরি নতুন করে তৈরি করে।
+    ব্যবহার: python manage.py rebuild_search_index
+    """
+    help = 'Rebuild the member full-text search index.'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        count = backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'{type(backend).__name__}: {count} members indexed.'
+        ))
@@ -0,0 +1,202 @@
+# pages/management/commands/reencode_media.py
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import json
+import os
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from pages.cache import bump_generation
+from pages.images import reencode_member_image, reencode_static_image
+from pages.models import Member
+
+STATIC_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+class Progress:
+    """
+    কোন ফাইল কোন hash এ শেষ হয়েছে — JSON ফাইলে (`{key: {'hash', 'size', 'mtime'}}`)।
+    আকার ও mtime না বদলালে ফাইলটি পড়াই হয় না; বদলালে worker hash মিলিয়ে দেখে।
+    প্রতিটি ব্যাচ commit এর পরে লেখা হয়, তাই মাঝপথে থামলে পরের বার সেখান থেকেই শুরু।
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self.entries = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def is_done(self, key, path):
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return False
+        return entry['size'] == stat_result.st_size and entry['mtime'] == stat_result.st_mtime_ns
+
+    def known_hash(self, key):
+        return self.entries.get(key, {}).get('hash')
+
+    def record(self, key, path, digest):
+        stat_result = os.stat(path)
+        self.entries[key] = {'hash': digest, 'size': stat_result.st_size, 'mtime': stat_result.st_mtime_ns}
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(self.entries, indent=0, sort_keys=True))
+        os.replace(temp_path, self.path)
+
+
+class Command(BaseCommand):
+    """
+    পুরো ছবির লাইব্রেরি একই নিয়মে রি-এনকোড করে: সদস্যের ছবি WEBP তে (content-addressed
+    নামে) এবং srcset derivative (ঐচ্ছিক AVIF সহ), আর `static/assets/img` এর JPEG/PNG এর
+    পাশে `.webp` (ও `.avif`)।
+
+    এনকোডিং CPU-bound, তাই কাজগুলো `ProcessPoolExecutor` এ (ডিফল্ট: CPU core এর সমান
+    worker) — worker গুলো শুধু ফাইল নিয়ে কাজ করে, ডাটাবেস আপডেট (`Member.image` ও
+    manifest) মূল প্রসেসে `--batch-size` করে এক একটি transaction এ। অগ্রগতি `--progress`
+    ফাইলে থাকে; আবার চালালে শেষ হওয়া এবং hash না বদলানো ফাইল বাদ যায়।
+    পুরনো ফাইলগুলো থেকে যায় — `gc_media --delete` দিয়ে মুছুন।
+
+    ব্যবহার: python manage.py reencode_media [--avif] [--workers N] [--no-static]
+    """
+    help = 'Re-encode member and static images to WEBP (optionally AVIF) with derivatives, in parallel and resumably.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument('--avif', action='store_true', help='Also write AVIF versions.')
+        parser.add_argument('--batch-size', type=int, default=200, help='Member rows updated per transaction.')
+        parser.add_argument('--progress', default=str(settings.BASE_DIR / 'run' / 'reencode-progress.json'))
+        parser.add_argument('--static-dir', default=str(settings.BASE_DIR / 'static' / 'assets' / 'img'))
+        parser.add_argument('--no-static', action='store_true', help='Only member images.')
+        parser.add_argument('--no-members', action='store_true', help='Only static images.')
+
+    def handle(self, *args, **options):
+        self.progress = Progress(options['progress'])
+        self.batch, self.batch_size = [], options['batch_size']
+        self.outputs = set()
+        self.counts = {'encoded': 0, 'unchanged': 0, 'skipped': 0, 'failed': 0}
+        avif = options['avif']
+        media_root = os.path.abspath(settings.MEDIA_ROOT)
+
+        jobs = []
+        if not options['no_members']:
+            jobs.append(self.member_jobs(media_root, avif))
+        if not options['no_static']:
+            jobs.append(self.static_jobs(options['static_dir'], avif))
+
+        # django.setup: spawn (macOS/Windows) এ worker এ মডেল/storage import এর জন্য
+        with ProcessPoolExecutor(max_workers=options['workers'], initializer=django.setup) as executor:
+            pending = {}
+            for job_list in jobs:
+                for key, func, args in job_list:
+                    # একসাথে worker সংখ্যার দ্বিগুণ কাজ — পুরো তালিকা মেমোরিতে নয়
+                    if len(pending) >= 2 * options['workers']:
+                        self.collect(pending, wait(pending, return_when=FIRST_COMPLETED).done)
+                    pending[executor.submit(func, *args)] = key
+            self.collect(pending, wait(pending).done)
+        self.flush()
+
+        self.stdout.write(self.style.SUCCESS(
+            '{encoded} images re-encoded, {unchanged} unchanged, {skipped} already done, {failed} failed.'.format(**self.counts)
+        ))
+
+    def member_names(self, chunk_size=2000):
+        """
+        সদস্যদের আলাদা আলাদা ছবির নাম (`member_image_idx` ইনডেক্সে keyset ধরে chunk করে) —
+        খোলা cursor নেই, তাই মাঝের ব্যাচ আপডেটগুলো পড়ার সাথে মেশে না।
+        """
+        queryset = Member.objects.exclude(image='').exclude(image__isnull=True).order_by('image')
+        last = None
+        while True:
+            page = queryset.filter(image__gt=last) if last is not None else queryset
+            names = list(page.values_list('image', flat=True).distinct()[:chunk_size])
+            if not names:
+                return
+            yield from names
+            last = names[-1]
+
+    def member_jobs(self, media_root, avif):
+        """সদস্যের ছবি — একই ফাইলের একাধিক সদস্য থাকলে কাজ একবারই।"""
+        for name in self.member_names():
+            if name in self.outputs:
+                continue  # এই রানেই তৈরি হওয়া WEBP
+            key = f'media:{name}'
+            path = os.path.join(media_root, name)
+            if not os.path.isfile(path) or self.progress.is_done(key, path):
+                self.counts['skipped'] += 1
+                continue
+            yield key, reencode_member_image, (media_root, name, self.progress.known_hash(key), avif)
+
+    def static_jobs(self, static_dir, avif):
+        for root, _, files in os.walk(static_dir):
+            for filename in sorted(files):
+                path = os.path.join(root, filename)
+                stem, extension = os.path.splitext(path)
+                if extension.lower() not in STATIC_EXTENSIONS:
+                    continue
+                if extension.lower() == '.webp' and not avif:
+                    continue
+                if extension.lower() == '.webp' and any(os.path.exists(stem + other) for other in ('.jpg', '.jpeg', '.png')):
+                    continue  # JPEG/PNG থেকে তৈরি আউটপুট
+                key = f'static:{os.path.relpath(path, static_dir)}'
+                if self.progress.is_done(key, path):
+                    self.counts['skipped'] += 1
+                    continue
+                yield key, reencode_static_image, (path, self.progress.known_hash(key), avif)
+
+    def collect(self, pending, done):
+        for future in done:
+            key = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as exc:
+                self.counts['failed'] += 1
+                self.stderr.write(f'  failed: {key}: {exc}')
+                continue
+            self.counts['encoded' if 'image' in result or result.get('outputs') else 'unchanged'] += 1
+            if 'image' in result:
+                self.outputs.add(result['image'])
+            self.batch.append((key, result))
+            if len(self.batch) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """জমা হওয়া ফলাফলগুলোর সদস্য রেফারেন্স এক transaction এ আপডেট করে অগ্রগতি লেখে।"""
+        if not self.batch:
+            return
+        media_root = os.path.abspath(settings.MEDIA_ROOT)
+        changed = False
+        # updated_at বদলায়, যাতে fragment cache ও ETag (`fragment_version`, `object_validators`)
+        # নতুন ফাইলের নাম দেখায় — নাহলে পুরনো নাম থেকে যায়, আর `gc_media` সেটি মুছে ফেলে
+        now = timezone.now()
+        with transaction.atomic():
+            for key, result in self.batch:
+                if 'image' in result:
+                    changed |= bool(Member.objects.filter(image=result['source']).update(
+                        image=result['image'], image_derivatives=result['derivatives'],
+                        image_status=Member.IMAGE_READY, updated_at=now,
+                    ))
+        if changed:
+            bump_generation()
+        for key, result in self.batch:
+            if key.startswith('media:'):
+                self.progress.record(key, os.path.join(media_root, result['source']), result['hash'])
+                if 'image' in result:
+                    # রি-এনকোড করা ফাইলটিও শেষ হিসেবে (পরের বার আবার এনকোড হবে না);
+                    # content-addressed নামের stem ই তার hash
+                    digest = os.path.splitext(os.path.basename(result['image']))[0]
+                    self.progress.record(f'media:{result["image"]}', os.path.join(media_root, result['image']), digest)
+            else:
+                self.progress.record(key, result['source'], result['hash'])
+        self.progress.save()
+        self.batch = []
@@ -0,0 +1,60 @@
+# pages/management/commands/run_tasks.py
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from pages import tasks
+
+
+class Command(BaseCommand):
+    """
+    ব্যাকগ্রাউন্ড টাস্ক worker — `Task` টেবিল থেকে pending টাস্ক নিয়ে thread pool এ চালায়।
+    ব্যবহার: python manage.py run_tasks --workers 4
+    একাধিক worker প্রসেস একসাথে চালানো নিরাপদ (টাস্ক claim করা হয় atomic UPDATE দিয়ে)।
+    """
+    help = 'Run queued background tasks (image processing etc.).'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Thread pool size. 0 runs tasks in the main thread.',
+        )
+        parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds to sleep when the queue is empty.')
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit.')
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        requeued = tasks.requeue_stale()
+        if requeued:
+            self.stdout.write(f'{requeued} stale running tasks requeued.')
+
+        if workers <= 0:
+            self._run_sync(options)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='task-worker') as executor:
+            while True:
+                futures = [
+                    executor.submit(tasks.execute_in_thread, task_id)
+                    for task_id in tasks.due_task_ids(workers * 2)
+                    if tasks.claim(task_id)
+                ]
+                if futures:
+                    wait(futures)
+                    self.stdout.write(f'{len(futures)} tasks processed.')
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(options['poll_interval'])
+
+    def _run_sync(self, options):
+        while True:
+            count = tasks.run_pending()
+            if count:
+                self.stdout.write(f'{count} tasks processed.')
+            elif options['once']:
+                break
+            else:
+                time.sleep(options['poll_interval'])
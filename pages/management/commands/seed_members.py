@@ -0,0 +1,43 @@
+# pages/management/commands/seed_members.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from pages.seed import DEFAULT_BATCH_SIZE, SIZES, clear_members, seed_members
+
+
+class Command(BaseCommand):
+    """
+    বেঞ্চমার্কের জন্য কৃত্রিম সদস্য (বাংলা/ইংরেজি নাম, এলাকা, বায়ো) তৈরি করে।
+    ব্যবহার: python manage.py seed_members --size 100k --clear
+    শুধু ডেভেলপমেন্ট/বেঞ্চমার্ক ডাটাবেসে চালান।
+    """
+    help = 'Generate synthetic members (1k / 100k / 1m) for benchmarking.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', choices=sorted(SIZES), help='Preset row count.')
+        parser.add_argument('--count', type=int, help='Exact number of members (overrides --size).')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same data.')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--clear', action='store_true', help='Delete ALL existing members first.')
+
+    def handle(self, *args, **options):
+        count = options['count'] or SIZES.get(options['size'])
+        if not count or count < 0:
+            raise CommandError('Pass --size (1k, 100k, 1m) or a positive --count.')
+
+        if options['clear']:
+            self.stdout.write(f'{clear_members()} members deleted.')
+
+        started = time.perf_counter()
+
+        def progress(created):
+            self.stdout.write(f'  {created}/{count}', ending='\r')
+            self.stdout.flush()
+
+        created = seed_members(count, seed=options['seed'], batch_size=options['batch_size'], progress=progress)
+        elapsed = time.perf_counter() - started
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(
+            f'{created} members created in {elapsed:.1f}s ({created / elapsed:,.0f} rows/sec).'
+        ))
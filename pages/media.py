@@ -0,0 +1,168 @@
+# pages/media.py
+"""
+প্রোডাকশনে MEDIA (আপলোড করা ছবি) সার্ভ করা — `DEBUG` ছাড়াও।
+
+WhiteNoise শুধু static ফাইল দেখে, তাই `/media/` এর জন্য এই ভিউ:
+- `MEDIA_X_ACCEL_REDIRECT` (nginx `internal` location এর prefix) বা `MEDIA_X_SENDFILE`
+  (Apache/lighttpd) দেওয়া থাকলে Django শুধু হেডার ফেরত দেয়, ফাইল পাঠায় সামনের সার্ভার
+  (Range সহ)।
+- নাহলে `FileResponse` — `Range: bytes=...` (একটি পরিসর, 206) এবং
+  `If-Modified-Since`/`If-None-Match` (304) সহ।
+- content-addressed নামের ফাইল (`pages.storage.is_content_addressed`: সদস্যের ছবি
+  `members/<hh>/<sha256><ext>` ও derivative `<sha256>_<width>.webp`) কখনো বদলায় না, তাই
+  সেগুলো `Cache-Control: immutable` সহ এক বছরের জন্য cache হয়; বাকিগুলো (নামে hex অংশ
+  থাকলেও) `MEDIA_CACHE_MAX_AGE` সেকেন্ড, তারপর conditional GET এ যাচাই।
+"""
+import mimetypes
+import os
+import re
+import stat
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+from .storage import is_content_addressed
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+CHUNK_SIZE = 64 * 1024
+
+
+def is_immutable(name):
+    """
+    নামটি content-addressed কিনা (তাহলে একই নামে অন্য কনটেন্ট কখনো আসে না)। শুধু নামে
+    hash এর মতো অংশ থাকা যথেষ্ট নয় — পুরনো আপলোডের নামেও থাকতে পারে, যা বদলানো যায়।
+    """
+    return is_content_addressed(name)
+
+
+def parse_range(header, size):
+    """
+    `Range` হেডার থেকে `(start, end)` (দুটোই সহ)। হেডার না থাকলে বা বোঝা না গেলে (একাধিক
+    পরিসর সহ) `None` — তখন পুরো ফাইল। পরিসর ফাইলের বাইরে হলে `ValueError` (416)।
+    """
+    match = RANGE_RE.match(header.replace(' ', '')) if header else None
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+        if start >= size or (last and int(last) < start):
+            raise ValueError(header)
+    else:
+        # bytes=-N: শেষের N বাইট
+        if not int(last) or not size:
+            raise ValueError(header)
+        start, end = max(size - int(last), 0), size - 1
+    return start, end
+
+
+class RangeFile:
+    """খোলা ফাইলের `[start, start + length)` অংশ পড়ার জন্য file-like (`FileResponse` এর জন্য)।"""
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def media_validators(stat_result):
+    """nginx এর মতো ETag (mtime ও আকার থেকে) এবং Last-Modified।"""
+    etag = f'"{int(stat_result.st_mtime):x}-{stat_result.st_size:x}"'
+    return etag, int(stat_result.st_mtime)
+
+
+def set_cache_headers(response, name, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    if is_immutable(name):
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, max_age=getattr(settings, 'MEDIA_CACHE_MAX_AGE', 3600))
+    return response
+
+
+def offload_response(path, full_path, content_type):
+    """সামনের সার্ভারকে ফাইল পাঠাতে বলা (খালি বডি); `None` = অফলোড কনফিগার করা নেই।"""
+    accel_prefix = getattr(settings, 'MEDIA_X_ACCEL_REDIRECT', None)
+    if accel_prefix:
+        response = HttpResponse(content_type=content_type)
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(path)
+        return response
+    if getattr(settings, 'MEDIA_X_SENDFILE', False):
+        response = HttpResponse(content_type=content_type)
+        response['X-Sendfile'] = full_path
+        return response
+    return None
+
+
+@require_safe
+def serve_media(request, path):
+    """`MEDIA_ROOT` এর নিচের `path` ফাইলটি (GET/HEAD)।"""
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat_result = os.stat(full_path)
+    except (SuspiciousFileOperation, OSError, ValueError):
+        raise Http404('Media file not found.')
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise Http404('Media file not found.')
+
+    etag, last_modified = media_validators(stat_result)
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return set_cache_headers(response, path, etag, last_modified)
+
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or 'application/octet-stream'
+    response = offload_response(path, full_path, content_type)
+    if response is None:
+        response = file_response(request, full_path, stat_result.st_size, content_type, etag, last_modified)
+    if encoding:
+        response['Content-Encoding'] = encoding
+    return set_cache_headers(response, path, etag, last_modified)
+
+
+def file_response(request, full_path, size, content_type, etag, last_modified):
+    """পুরো ফাইল (200) বা `Range` এর একটি অংশ (206)।"""
+    byte_range = None
+    if_range = request.headers.get('If-Range')
+    # If-Range মিলে না গেলে (ফাইল বদলে গেছে) পুরো ফাইল পাঠানো হয়
+    if not if_range or if_range == etag or parse_http_date_safe(if_range) == last_modified:
+        try:
+            byte_range = parse_range(request.headers.get('Range'), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+
+    file = open(full_path, 'rb')
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+        response.block_size = CHUNK_SIZE
+    else:
+        start, end = byte_range
+        response = FileResponse(RangeFile(file, start, end - start + 1), status=206, content_type=content_type)
+        response.block_size = CHUNK_SIZE
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        response['Content-Length'] = end - start + 1
+    response['Accept-Ranges'] = 'bytes'
+    return response
@@ -0,0 +1,385 @@
+# pages/metrics.py
+"""
+ভিউ ভিত্তিক পারফরম্যান্স মেট্রিক (Prometheus text format)।
+
+`pages.middleware.MetricsMiddleware` প্রতিটি রিকোয়েস্টের latency, SQL কোয়েরির সংখ্যা ও সময়,
+টেমপ্লেট রেন্ডার এবং সিরিয়ালাইজারের সময় URL name (`pages:member-api-list` ইত্যাদি)
+অনুযায়ী এখানে জমা করে। সব মান cumulative counter/histogram, তাই একাধিক worker প্রসেসের
+মান যোগ করলেই মোট পাওয়া যায়: `METRICS_DIR` সেট থাকলে প্রতিটি প্রসেস নিজের snapshot
+(`metrics-<pid>-<token>.json`) সেখানে লিখে রাখে এবং `/metrics/` এন্ডপয়েন্ট সব ফাইল যোগ করে দেখায়।
+
+worker বন্ধ/রিস্টার্ট হলে তার ফাইল থেকে যায়। `collect()` এমন snapshot (`is_stale_snapshot`:
+PID আর চলছে না, বা একই PID কিন্তু অন্য token — PID আবার ব্যবহার হয়েছে) এর মান
+`dead-processes.json` এর মোটে যোগ করে তারপর ফাইলটি মুছে ফেলে, তাই counter গুলো কখনো কমে না
+(Prometheus এর `rate()`/`increase()` ঠিক থাকে)। ডিরেক্টরিটি একটি হোস্টের (একই PID namespace এর)
+প্রসেসগুলোর জন্যই — অন্য কন্টেইনারের PID এখান থেকে দেখা যায় না।
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import glob
+import json
+import logging
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+import time
+import uuid
+
+from django.conf import settings
+from django.template.backends.django import DjangoTemplates, Template
+
+logger = logging.getLogger(__name__)
+
+# রিকোয়েস্ট latency histogram এর bucket (সেকেন্ড)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# slow request log এর ডিফল্ট সীমা (ms) এবং লগে সর্বোচ্চ কতগুলো SQL রাখা হবে
+DEFAULT_SLOW_REQUEST_MS = 500
+MAX_LOGGED_QUERIES = 100
+
+# METRICS_DIR এ snapshot লেখার ন্যূনতম বিরতি (সেকেন্ড)
+DEFAULT_FLUSH_INTERVAL = 5
+
+# বন্ধ হওয়া প্রসেসগুলোর মোট মান (METRICS_DIR এ)
+DEAD_PROCESSES_FILE = 'dead-processes.json'
+
+# এই প্রসেসের snapshot ফাইলের নামের অংশ — PID আবার ব্যবহার হলেও আগের প্রসেসের ফাইল আলাদা থাকে
+PROCESS_TOKEN = uuid.uuid4().hex
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# মেট্রিকের নাম -> (type, help)
+METRICS = {
+    'somiti_http_requests_total': ('counter', 'HTTP requests by view, method and status code.'),
+    'somiti_http_request_duration_seconds': ('histogram', 'Request latency by view.'),
+    'somiti_db_queries_total': ('counter', 'SQL queries executed by view.'),
+    'somiti_db_query_duration_seconds_total': ('counter', 'Time spent executing SQL by view.'),
+    'somiti_template_render_seconds_total': ('counter', 'Time spent rendering templates by view.'),
+    'somiti_serializer_seconds_total': ('counter', 'Time spent serializing API responses by view.'),
+    'somiti_slow_requests_total': ('counter', 'Requests slower than METRICS_SLOW_REQUEST_MS by view.'),
+}
+
+
+class RequestMetrics:
+    """একটি রিকোয়েস্ট চলাকালীন জমা হওয়া মাপ।"""
+    __slots__ = ('queries', 'query_time', 'sql', 'timings')
+
+    def __init__(self):
+        self.queries = 0
+        self.query_time = 0.0
+        self.sql = []
+        self.timings = defaultdict(float)
+
+    def __call__(self, execute, sql, params, many, context):
+        """`connection.execute_wrapper` হিসেবে প্রতিটি SQL এর সময় মাপে।"""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.queries += 1
+            self.query_time += elapsed
+            if len(self.sql) < MAX_LOGGED_QUERIES:
+                self.sql.append((elapsed, sql))
+
+
+_current = ContextVar('pages_request_metrics', default=None)
+
+
+def start_request():
+    """বর্তমান রিকোয়েস্টের জন্য নতুন `RequestMetrics` চালু করে; `(metrics, token)` ফেরত দেয়।"""
+    current = RequestMetrics()
+    return current, _current.set(current)
+
+
+def end_request(token):
+    _current.reset(token)
+
+
+def execute_wrapper(execute, sql, params, many, context):
+    """
+    প্রতিটি connection এ স্থায়ীভাবে বসানো wrapper (`pages.signals`): বর্তমান রিকোয়েস্টের
+    `RequestMetrics` (ContextVar) থাকলে তাকে দিয়ে কোয়েরি মাপে। async ORM কোয়েরিগুলো
+    `sync_to_async` এর thread এ চলে, কিন্তু ContextVar সেখানেও পৌঁছায় — তাই ASGI ভিউয়ের
+    কোয়েরিও গোনা হয়।
+    """
+    current = _current.get()
+    if current is None:
+        return execute(sql, params, many, context)
+    return current(execute, sql, params, many, context)
+
+
+def install_execute_wrapper(connection):
+    """Django `DatabaseWrapper` এ `execute_wrapper` একবার যোগ করে।"""
+    if execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(execute_wrapper)
+
+
+@contextmanager
+def track(kind):
+    """`with track('serializer'):` — ব্লকের সময় বর্তমান রিকোয়েস্টের `kind` এ যোগ হয়।"""
+    current = _current.get()
+    if current is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        current.timings[kind] += time.perf_counter() - started
+
+
+class Registry:
+    """প্রসেসের ভেতরের counter এবং histogram (thread-safe)।"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = defaultdict(float)  # (name, labels) -> value
+        self.histograms = {}  # (name, labels) -> [bucket counts..., +Inf count, sum]
+        self._flushed_at = 0.0
+
+    def record_request(self, view, method, status, duration, current, slow):
+        labels = (('view', view),)
+        with self._lock:
+            self.counters['somiti_http_requests_total', labels + (('method', method), ('status', str(status)))] += 1
+            self.counters['somiti_db_queries_total', labels] += current.queries
+            self.counters['somiti_db_query_duration_seconds_total', labels] += current.query_time
+            self.counters['somiti_template_render_seconds_total', labels] += current.timings['template']
+            self.counters['somiti_serializer_seconds_total', labels] += current.timings['serializer']
+            if slow:
+                self.counters['somiti_slow_requests_total', labels] += 1
+            histogram = self.histograms.setdefault(
+                ('somiti_http_request_duration_seconds', labels), [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+            )
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if duration <= bound:
+                    histogram[index] += 1
+            histogram[len(LATENCY_BUCKETS)] += 1
+            histogram[-1] += duration
+
+    def snapshot(self):
+        """JSON-যোগ্য snapshot।"""
+        with self._lock:
+            return as_snapshot(self.counters, self.histograms)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def maybe_flush(self):
+        """`METRICS_DIR` সেট থাকলে (কিছুক্ষণ পর পর) এই প্রসেসের snapshot ফাইলে লেখে।"""
+        directory = getattr(settings, 'METRICS_DIR', None)
+        if not directory:
+            return
+        now = time.monotonic()
+        if now - self._flushed_at < getattr(settings, 'METRICS_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL):
+            return
+        self._flushed_at = now
+        write_snapshot(directory, self.snapshot())
+
+
+registry = Registry()
+
+
+def _snapshot_path(directory):
+    return os.path.join(directory, f'metrics-{os.getpid()}-{PROCESS_TOKEN}.json')
+
+
+def _pid_is_running(pid):
+    if os.name == 'nt':
+        return True  # Windows এ `os.kill` প্রসেস বন্ধ করে দেয়
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # আছে, কিন্তু অন্য ইউজারের (PermissionError)
+    return True
+
+
+def is_stale_snapshot(path):
+    """
+    snapshot ফাইলটি আর চলমান কোনো প্রসেসের নয় কিনা: PID চলছে না, অথবা একই PID কিন্তু অন্য
+    token (PID এর আগের প্রসেস)। PID অন্য কোনো প্রোগ্রাম পেলে ফাইলটি থেকে যায় — মোট তাতে ঠিকই থাকে।
+    """
+    name = os.path.basename(path)[len('metrics-'):-len('.json')]
+    pid, _, token = name.partition('-')
+    if not pid.isdigit():
+        return False
+    if int(pid) == os.getpid():
+        return token != PROCESS_TOKEN
+    return not _pid_is_running(int(pid))
+
+
+@contextmanager
+def _directory_lock(directory):
+    """একই সময়ে একটি প্রসেসই মৃত snapshot গুলো যোগ করে/পড়ে (Windows এ lock নেই)।"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(directory, '.lock'), 'a') as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as handle:
+        json.dump(data, handle)
+    os.replace(temp_path, path)
+
+
+def as_snapshot(counters, histograms):
+    """`merge` এর ফলাফলকে আবার snapshot (JSON) আকারে।"""
+    return {
+        'counters': [[name, list(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [[name, list(labels), list(values)] for (name, labels), values in histograms.items()],
+    }
+
+
+def fold_stale_snapshots(directory, paths):
+    """
+    মৃত প্রসেসের snapshot গুলো `DEAD_PROCESSES_FILE` এর মোটে যোগ করে ফাইলগুলো মুছে ফেলে।
+    কোন ফাইল যোগ হয়েছে তা (`folded`) মোটের সাথেই লেখা থাকে, তাই মোছার আগে থেমে গেলেও
+    পরের বার একই ফাইল দুইবার যোগ হয় না। ফেরত দেয় নতুন মোট।
+    """
+    dead_path = os.path.join(directory, DEAD_PROCESSES_FILE)
+    dead = _read_json(dead_path) or {}
+    folded = set(dead.get('folded', []))
+    names = [os.path.basename(path) for path in paths]
+    new = [path for path, name in zip(paths, names) if name not in folded]
+    if new:
+        snapshots = [dead] + [snapshot for snapshot in map(_read_json, new) if snapshot]
+        # তালিকায় শুধু এখনো ডিস্কে থাকা ফাইলগুলো, যাতে এটি বাড়তেই না থাকে
+        dead = {**as_snapshot(*merge(snapshots)), 'folded': names}
+        try:
+            _write_json(dead_path, dead)
+        except OSError:
+            # মোট লেখা না গেলে ফাইলগুলো থাকুক — পরের বার আবার চেষ্টা
+            logger.warning('Could not write %s', dead_path, exc_info=True)
+            return dead
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return dead
+
+
+def write_snapshot(directory, snapshot):
+    """atomic ভাবে (temp ফাইল + rename) snapshot লেখে, যাতে পড়ার সময় অর্ধেক ফাইল না আসে।"""
+    os.makedirs(directory, exist_ok=True)
+    try:
+        _write_json(_snapshot_path(directory), snapshot)
+    except OSError:
+        logger.warning('Could not write metrics snapshot to %s', directory, exc_info=True)
+
+
+def merge(snapshots):
+    """একাধিক snapshot যোগ করে `(counters, histograms)` dict দুটি ফেরত দেয়।"""
+    counters, histograms = defaultdict(float), {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get('counters', []):
+            counters[name, tuple(map(tuple, labels))] += value
+        for name, labels, values in snapshot.get('histograms', []):
+            key = (name, tuple(map(tuple, labels)))
+            if key in histograms:
+                histograms[key] = [a + b for a, b in zip(histograms[key], values)]
+            else:
+                histograms[key] = list(values)
+    return counters, histograms
+
+
+def collect():
+    """
+    দেখানোর জন্য সব প্রসেসের মোট মান: `METRICS_DIR` থাকলে সেখানকার সব snapshot
+    (এই প্রসেসেরটি সর্বশেষ মান দিয়ে) এবং বন্ধ হওয়া প্রসেসগুলোর মোট (`fold_stale_snapshots`),
+    না থাকলে শুধু এই প্রসেস।
+    """
+    own = registry.snapshot()
+    directory = getattr(settings, 'METRICS_DIR', None)
+    if not directory:
+        return merge([own])
+    write_snapshot(directory, own)
+    with _directory_lock(directory):
+        paths = glob.glob(os.path.join(directory, 'metrics-*.json'))
+        stale = [path for path in paths if is_stale_snapshot(path)]
+        snapshots = [fold_stale_snapshots(directory, stale)]
+        snapshots += [snapshot for snapshot in map(_read_json, set(paths) - set(stale)) if snapshot]
+    return merge(snapshots)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else f'{value:.6f}'
+
+
+def render_prometheus(counters, histograms):
+    """Prometheus text exposition format (0.0.4)।"""
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'histogram':
+            for (metric, labels), values in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(LATENCY_BUCKETS, values):
+                    lines.append(f'{name}_bucket{_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_labels(labels, [("le", "+Inf")])} {values[len(LATENCY_BUCKETS)]}')
+                lines.append(f'{name}_sum{_labels(labels)} {_number(values[-1])}')
+                lines.append(f'{name}_count{_labels(labels)} {values[len(LATENCY_BUCKETS)]}')
+        else:
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+    return '\n'.join(lines) + '\n'
+
+
+# --- টেমপ্লেট রেন্ডার টাইমিং ---
+
+class InstrumentedTemplate(Template):
+    def render(self, context=None, request=None):
+        with track('template'):
+            return super().render(context, request)
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """
+    Django এর টেমপ্লেট backend, কিন্তু প্রতিটি (top-level) টেমপ্লেট রেন্ডারের সময়
+    বর্তমান রিকোয়েস্টের মেট্রিকে যোগ করে। `TEMPLATES['BACKEND']` এ ব্যবহার হয়।
+    """
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return InstrumentedTemplate(template.template, self)
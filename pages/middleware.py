@@ -0,0 +1,168 @@
+# pages/middleware.py
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import metrics, prerender
+from .db import read_only_request
+
+slow_logger = logging.getLogger('pages.metrics.slow')
+
+
+class AsyncCapableMiddleware:
+    """
+    sync এবং async দুই chain এই চলে এমন middleware এর ভিত্তি (Django এর
+    `sync_capable`/`async_capable`)। ASGI এর অধীনে async ভিউয়ের রিকোয়েস্ট
+    thread এ না গিয়ে event loop এই থাকে; সাবক্লাস `__call__` এবং `__acall__` দুটোই লেখে।
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.handle(request)
+
+    def handle(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
+
+
+class MetricsMiddleware(AsyncCapableMiddleware):
+    """
+    `pages` namespace এর প্রতিটি ভিউ (টেমপ্লেট পেজ এবং `member-api` রাউট) এর latency,
+    SQL কোয়েরি (execute wrapper দিয়ে), টেমপ্লেট ও সিরিয়ালাইজারের সময় `pages.metrics`
+    এ জমা করে। `METRICS_SLOW_REQUEST_MS` এর চেয়ে ধীর রিকোয়েস্টের SQL সহ লগ লেখে।
+    MIDDLEWARE তালিকার একদম শুরুতে রাখতে হবে।
+    """
+
+    def handle(self, request):
+        current, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        self.record(request, response, time.perf_counter() - started, current)
+        return response
+
+    async def __acall__(self, request):
+        current, token = metrics.start_request()
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            metrics.end_request(token)
+        self.record(request, response, time.perf_counter() - started, current)
+        return response
+
+    def record(self, request, response, duration, current):
+        match = getattr(request, 'resolver_match', None)
+        if match is not None and match.url_name and 'pages' in match.namespaces:
+            view = f'pages:{match.url_name}'
+            slow = duration * 1000 >= getattr(settings, 'METRICS_SLOW_REQUEST_MS', metrics.DEFAULT_SLOW_REQUEST_MS)
+            metrics.registry.record_request(view, request.method, response.status_code, duration, current, slow)
+            if slow:
+                self.log_slow_request(request, view, duration, current)
+            metrics.registry.maybe_flush()
+
+    def log_slow_request(self, request, view, duration, current):
+        queries = '\n'.join(f'  [{elapsed * 1000:.1f} ms] {sql}' for elapsed, sql in current.sql)
+        slow_logger.warning(
+            'Slow request %s %s (%s) took %.0f ms: %d queries in %.0f ms, template %.0f ms, serializer %.0f ms\n%s',
+            request.method, request.get_full_path(), view, duration * 1000,
+            current.queries, current.query_time * 1000,
+            current.timings['template'] * 1000, current.timings['serializer'] * 1000,
+            queries,
+        )
+
+
+class ReadOnlyRequestMiddleware(AsyncCapableMiddleware):
+    """
+    GET/HEAD রিকোয়েস্টে সদস্য ডেটা read-only alias থেকে পড়া হয় (`pages.db.ReadOnlyRouter`)।
+    router চালু না থাকলে (`DATABASE_ROUTERS`) কোনো প্রভাব নেই।
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD')
+
+    def handle(self, request):
+        if request.method not in self.SAFE_METHODS:
+            return self.get_response(request)
+        with read_only_request():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        if request.method not in self.SAFE_METHODS:
+            return await self.get_response(request)
+        with read_only_request():
+            return await self.get_response(request)
+
+
+class PrerenderedPageMiddleware(AsyncCapableMiddleware):
+    """
+    মার্কেটিং পেজগুলো (`pages.prerender.PAGES`) আগে থেকে রেন্ডার করা HTML থেকে পাঠায় —
+    URL resolver, ভিউ, session/auth middleware বা context processor ছাড়াই, মেমোরি থেকে।
+    পেজ না মিললে বা টেমপ্লেট বদলানোর পরে নতুন build না হওয়া পর্যন্ত সাধারণ পথে যায়।
+    `PRERENDER_PAGES` False হলে chain এ থাকেই না।
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD')
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PRERENDER_PAGES', False):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def handle(self, request):
+        page = prerender.get_page(request.path_info) if request.method in self.SAFE_METHODS else None
+        if page is not None:
+            return page.respond(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        page = prerender.get_page(request.path_info) if request.method in self.SAFE_METHODS else None
+        if page is not None:
+            return page.respond(request)
+        return await self.get_response(request)
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise, কিন্তু async chain এও চলে — নাহলে ASGI তে এর পরের সব middleware
+    এবং async ভিউ sync adapter এর thread এ চলে যেত। স্ট্যাটিক ফাইল পাওয়া গেলে
+    WhiteNoise এর মতোই সার্ভ করে, নাহলে পরের ধাপে পাঠায়।
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
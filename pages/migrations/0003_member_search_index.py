@@ -0,0 +1,115 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:22
+
+import django.core.validators
+import django.db.models.deletion
+import pages.models
+from django.db import migrations, models
+
+
+# FTS5 virtual table: rowid = pages_member.id, bm25 এ name কে সবচেয়ে বেশি ওজন দেওয়া হয়েছে।
+CREATE_FTS_SQL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS pages_member_fts USING fts5("
+    "name, role, area, bio, tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "INSERT INTO pages_member_fts (pages_member_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 5.0, 1.0)')",
+    "INSERT INTO pages_member_fts (rowid, name, role, area, bio) SELECT id, name, role, area, bio FROM pages_member",
+]
+
+
+def create_search_index(apps, schema_editor):
+    # FTS5 শুধু SQLite এ আছে; অন্য ডাটাবেসে `IContainsSearchBackend` ব্যবহার হবে।
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in CREATE_FTS_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute("DROP TABLE IF EXISTS pages_member_fts")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0002_alter_member_created_at_alter_member_email_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberSearchEntry',
+            fields=[
+                ('member', models.OneToOneField(db_column='rowid', db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_entry', serialize=False, to='pages.member')),
+                ('name', models.TextField()),
+                ('role', models.TextField()),
+                ('area', models.TextField()),
+                ('bio', models.TextField()),
+                ('document', pages.models.FTSDocumentField(db_column='pages_member_fts')),
+                ('rank', models.FloatField(db_column='rank')),
+            ],
+            options={
+                'db_table': 'pages_member_fts',
+                'managed': False,
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='member',
+            options={'ordering': ['id', 'role', 'name'], 'verbose_name': 'Member', 'verbose_name_plural': 'Members'},
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='area',
+            field=models.CharField(max_length=100, verbose_name='Area'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='bio',
+            field=models.TextField(blank=True, verbose_name='Short Description'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Created At'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='email',
+            field=models.EmailField(blank=True, max_length=254, null=True, verbose_name='E-mail'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='image',
+            field=models.ImageField(blank=True, null=True, upload_to=pages.models.member_image_upload_path, verbose_name='Image'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Active'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='joined_date',
+            field=models.DateField(auto_now_add=True, verbose_name='Joining Date'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='name',
+            field=models.CharField(max_length=200, verbose_name='Name'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='phone',
+            field=models.CharField(max_length=17, validators=[django.core.validators.RegexValidator(message="Phone number must be entered in the format: '+8801900000000'. Up to 15 digits allowed.", regex='^\\+?1?\\d{9,15}$')], verbose_name='Phone'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='role',
+            field=models.CharField(choices=[('President', 'President'), ('Secretary', 'Secretary'), ('Treasurer', 'Treasurer'), ('Committee', 'Committee'), ('Member', 'Member')], default='Member', max_length=50, verbose_name='Role'),
+        ),
+        migrations.AlterField(
+            model_name='member',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Updated At'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
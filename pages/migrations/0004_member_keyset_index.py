@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0003_member_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['is_active', 'role', 'name', 'id'], name='member_active_role_name_idx'),
+        ),
+    ]
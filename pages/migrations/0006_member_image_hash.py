@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0005_background_tasks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='image_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64, verbose_name='Image Hash'),
+        ),
+    ]
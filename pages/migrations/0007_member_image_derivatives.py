@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0006_member_image_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='member',
+            name='image_derivatives',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Image Derivatives'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0007_member_image_derivatives'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['updated_at'], name='member_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:56
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_member_stats(apps, schema_editor):
+    """বিদ্যমান সদস্যদের থেকে সারাংশ টেবিল তৈরি (একটি GROUP BY)।"""
+    Member = apps.get_model('pages', 'Member')
+    MemberStat = apps.get_model('pages', 'MemberStat')
+    rows = Member.objects.order_by().values('role', 'area', 'is_active').annotate(members=Count('pk'))
+    MemberStat.objects.bulk_create(
+        MemberStat(role=row['role'], area=row['area'], is_active=row['is_active'], count=row['members'])
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0008_member_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(max_length=50, verbose_name='Role')),
+                ('area', models.CharField(max_length=100, verbose_name='Area')),
+                ('is_active', models.BooleanField(verbose_name='Active')),
+                ('count', models.IntegerField(default=0, verbose_name='Members')),
+            ],
+            options={
+                'verbose_name': 'Member Statistic',
+                'verbose_name_plural': 'Member Statistics',
+                'constraints': [models.UniqueConstraint(fields=('role', 'area', 'is_active'), name='member_stat_key')],
+            },
+        ),
+        migrations.RunPython(populate_member_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-18 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0009_member_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberBulkUpdate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('member_ids', models.JSONField(default=list, verbose_name='Members')),
+                ('is_active', models.BooleanField(verbose_name='Set Active')),
+                ('total', models.PositiveIntegerField(default=0, verbose_name='Total')),
+                ('processed', models.PositiveIntegerField(default=0, verbose_name='Processed')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20, verbose_name='Status')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created At')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Finished At')),
+            ],
+            options={
+                'verbose_name': 'Member Bulk Update',
+                'verbose_name_plural': 'Member Bulk Updates',
+                'ordering': ['-id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['role', 'name', 'id'], name='member_role_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['area', 'role', 'name', 'id'], name='member_area_role_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['phone'], name='member_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['email'], name='member_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='memberstat',
+            index=models.Index(fields=['area'], name='member_stat_area_idx'),
+        ),
+    ]
@@ -0,0 +1,126 @@
+# Generated by Django 5.2.6 on 2026-10-18 07:08
+
+from collections import Counter, defaultdict
+import unicodedata
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def normalize_area_name(name):
+    """
+    `pages.models.normalize_area_name` এর এই migration এর সময়ের কপি — মডেলের কোড পরে বদলালেও
+    migration এর আচরণ একই থাকে।
+    """
+    chars, previous = [], None
+    for char in unicodedata.normalize('NFKC', name or '').casefold():
+        category = unicodedata.category(char)
+        if category == 'Cf':
+            continue
+        if category == 'Nd':
+            kind, char = 'digit', str(unicodedata.digit(char))
+        elif category[0] in 'LMN':
+            kind = 'letter'
+        else:
+            chars.append(' ')
+            previous = None
+            continue
+        if previous is not None and previous != kind:
+            chars.append(' ')
+        chars.append(char)
+        previous = kind
+    return ' '.join(''.join(chars).split())
+
+
+def canonicalize_areas(apps, schema_editor):
+    """
+    বিদ্যমান `Member.area` মানগুলো normalized key অনুযায়ী গ্রুপ করে প্রতিটির জন্য একটি `Area`
+    তৈরি করে (নাম = সবচেয়ে বেশি ব্যবহৃত বানান), সদস্যদের `area`/`area_ref` বসায় এবং
+    নাম বদলানোয় সারাংশ টেবিল ও সার্চ ইনডেক্স নতুন করে তৈরি করে।
+    """
+    Area = apps.get_model('pages', 'Area')
+    Member = apps.get_model('pages', 'Member')
+    MemberStat = apps.get_model('pages', 'MemberStat')
+
+    variants = defaultdict(Counter)
+    for row in Member.objects.order_by().values('area').annotate(members=Count('pk')):
+        variants[normalize_area_name(row['area'])][row['area']] = row['members']
+
+    renamed = False
+    for key, spellings in variants.items():
+        # সবচেয়ে বেশি ব্যবহৃত বানান; সমান হলে সব-বড়/সব-ছোট হাতের নয় এমনটি, তারপর বর্ণানুক্রমে
+        spelling = min(spellings, key=lambda value: (-spellings[value], value.isupper() or value.islower(), value))
+        area = Area.objects.create(name=' '.join(spelling.split()), key=key)
+        for value in spellings:
+            renamed = renamed or value != area.name
+            Member.objects.filter(area=value).update(area=area.name, area_ref=area)
+
+    if renamed:
+        MemberStat.objects.all().delete()
+        rows = Member.objects.order_by().values('role', 'area', 'is_active').annotate(members=Count('pk'))
+        MemberStat.objects.bulk_create(
+            MemberStat(role=row['role'], area=row['area'], is_active=row['is_active'], count=row['members'])
+            for row in rows
+        )
+        if schema_editor.connection.vendor == 'sqlite':
+            schema_editor.execute("DELETE FROM pages_member_fts")
+            schema_editor.execute(
+                "INSERT INTO pages_member_fts (rowid, name, role, area, bio) "
+                "SELECT id, name, role, area, bio FROM pages_member"
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0010_admin_large_table'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Area',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Name')),
+                ('key', models.CharField(editable=False, max_length=100, unique=True, verbose_name='Key')),
+            ],
+            options={
+                'verbose_name': 'Area',
+                'verbose_name_plural': 'Areas',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AreaAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='Alias')),
+                ('key', models.CharField(editable=False, max_length=100, unique=True, verbose_name='Key')),
+            ],
+            options={
+                'verbose_name': 'Area Alias',
+                'verbose_name_plural': 'Area Aliases',
+            },
+        ),
+        migrations.AddField(
+            model_name='member',
+            name='area_ref',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='members', to='pages.area', verbose_name='Area (normalized)'),
+        ),
+        migrations.AddField(
+            model_name='areaalias',
+            name='area',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='pages.area', verbose_name='Area'),
+        ),
+        migrations.RunPython(canonicalize_areas, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='member',
+            name='area_ref',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, related_name='members', to='pages.area', verbose_name='Area (normalized)'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['area_ref', 'is_active', 'role', 'name', 'id'], name='member_area_ref_idx'),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.6 on 2026-10-18 07:12
+
+from django.db import migrations, models
+
+# এই migration এর সময়ের `Member.ROLE_CHOICES` এর ক্রম
+ROLES = ['President', 'Secretary', 'Treasurer', 'Committee', 'Member']
+
+
+def populate_role_ranks(apps, schema_editor):
+    """বিদ্যমান সদস্যদের `role_rank` — প্রতিটি পদবির জন্য একটি UPDATE; অজানা পদবি সবার শেষে।"""
+    Member = apps.get_model('pages', 'Member')
+    for rank, role in enumerate(ROLES):
+        Member.objects.filter(role=role).update(role_rank=rank)
+    Member.objects.exclude(role__in=ROLES).update(role_rank=len(ROLES))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0011_area'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='member',
+            options={'ordering': ['role_rank', 'name', 'id'], 'verbose_name': 'Member', 'verbose_name_plural': 'Members'},
+        ),
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_role_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_area_role_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_area_ref_idx',
+        ),
+        migrations.AddField(
+            model_name='member',
+            name='role_rank',
+            field=models.PositiveSmallIntegerField(default=4, editable=False, verbose_name='Role Rank'),
+        ),
+        migrations.RunPython(populate_role_ranks, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['role_rank', 'name', 'id'], name='member_active_rank_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['role_rank', 'name', 'id'], name='member_rank_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['area', 'role_rank', 'name', 'id'], name='member_area_rank_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['area_ref', 'role_rank', 'name', 'id'], name='member_area_ref_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-18 07:37
+
+import pages.models
+import pages.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0012_role_rank'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='member',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=pages.storage.get_member_image_storage, upload_to=pages.models.member_image_upload_path, verbose_name='Image'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['image'], name='member_image_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:25
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0013_member_image_storage'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_active_role_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_active_rank_name_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='member',
+            name='member_area_rank_name_idx',
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:31
+
+from django.db import migrations, models
+
+
+def selection_from_member_ids(apps, schema_editor):
+    """
+    শেষ না হওয়া পুরনো জবগুলোর id তালিকার বাকি অংশ `pk__in` lookup হিসেবে; `processed` পর্যন্ত
+    আপডেট হওয়া id গুলো `cursor` এর আগে পড়ে। শেষ হওয়া জবে selection আর লাগে না।
+    """
+    MemberBulkUpdate = apps.get_model('pages', 'MemberBulkUpdate')
+    for job in MemberBulkUpdate.objects.exclude(status='done'):
+        ids = job.member_ids
+        if not ids:
+            continue
+        job.filters = {'pk__in': ids[job.processed:]}
+        job.cursor = ids[job.processed - 1] if job.processed else 0
+        job.last_pk = max(ids)
+        job.save(update_fields=['filters', 'cursor', 'last_pk'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pages', '0014_drop_redundant_member_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memberbulkupdate',
+            name='cursor',
+            field=models.BigIntegerField(default=0, verbose_name='Cursor'),
+        ),
+        migrations.AddField(
+            model_name='memberbulkupdate',
+            name='filters',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Filters'),
+        ),
+        migrations.AddField(
+            model_name='memberbulkupdate',
+            name='last_pk',
+            field=models.BigIntegerField(default=0, verbose_name='Last Member ID'),
+        ),
+        migrations.AddField(
+            model_name='memberbulkupdate',
+            name='search',
+            field=models.CharField(blank=True, max_length=200, verbose_name='Search'),
+        ),
+        migrations.RunPython(selection_from_member_ids, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='memberbulkupdate',
+            name='member_ids',
+        ),
+    ]
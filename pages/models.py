@@ -1,20 +1,121 @@
 # pages/models.py
-from datetime import datetime
 from django.db import models
+from django.db.models import Lookup
+from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
+from django.urls import reverse
+from django.utils import timezone
 
-from io import BytesIO
-from PIL import Image
-from django.core.files.base import ContentFile
+from .images import derivative_variants, derivatives_are_current
+from .storage import get_member_image_storage
+
+import copy
+import hashlib
 import os
+import unicodedata
+
+# ছবি না থাকলে যে ডিফল্ট অ্যাভাটার দেখানো হয়
+DEFAULT_AVATAR_URL = 'https://images.unsplash.com/photo-1506794778202-cad84cf45f1d?q=80&w=200&h=200&auto=format&fit=crop&crop=faces'
 
 # সদস্যের ইমেজ আপলোড পাথ কাস্টমাইজ করার জন্য ফাংশন
 def member_image_upload_path(instance, filename):
     # শুধু ফাইলের নাম রেখে দিচ্ছি, যাতে আগের path যোগ না হয়
     filename = os.path.basename(filename)
     # এখন শুধু এইরকম path হবে: members/<role>/<filename>
+    # content-addressed storage (`pages.storage`) এখান থেকে শুধু extension নেয় —
+    # আসল নাম হয় কনটেন্টের hash থেকে: members/<hash[:2]>/<hash><ext>
     return f"members/{instance.role}/{filename}"
 
+# --- এলাকা ---
+
+def normalize_area_name(name):
+    """
+    এলাকার নামের তুলনার key: Unicode NFKC, ছোট হাতের অক্ষর, যেকোনো ভাষার অঙ্ক -> ASCII অঙ্ক,
+    যতিচিহ্ন/হাইফেন -> একটি স্পেস, অক্ষর ও সংখ্যার মাঝে স্পেস।
+    যেমন "Mirpur-10", "mirpur 10" ও "MIRPUR10" সবই "mirpur 10"; "মিরপুর-১০" হয় "মিরপুর 10"।
+    """
+    chars, previous = [], None
+    for char in unicodedata.normalize('NFKC', name or '').casefold():
+        category = unicodedata.category(char)
+        if category == 'Cf':
+            continue  # zero-width joiner ইত্যাদি
+        if category == 'Nd':
+            kind, char = 'digit', str(unicodedata.digit(char))
+        elif category[0] in 'LMN':
+            kind = 'letter'  # বাংলা কার-চিহ্ন (M*) অক্ষরেরই অংশ
+        else:
+            chars.append(' ')
+            previous = None
+            continue
+        if previous is not None and previous != kind:
+            chars.append(' ')
+        chars.append(char)
+        previous = kind
+    return ' '.join(''.join(chars).split())
+
+
+class AreaManager(models.Manager):
+
+    def get_for_name(self, name):
+        """
+        নামের (বা alias এর) normalized key অনুযায়ী এলাকা; না থাকলে `name` দিয়ে নতুন এলাকা তৈরি করে।
+        """
+        key = normalize_area_name(name)
+        area = self.filter(models.Q(key=key) | models.Q(aliases__key=key)).first()
+        if area is None:
+            area, _ = self.get_or_create(key=key, defaults={'name': ' '.join(name.split())})
+        return area
+
+
+class Area(models.Model):
+    """
+    সদস্যদের এলাকা (normalized)। `key` (`normalize_area_name`) দিয়ে একই এলাকার ভিন্ন
+    বানান এক হয়; অন্য নামগুলো (যেমন বাংলা/ইংরেজি) `AreaAlias` হিসেবে থাকে।
+    `Member.area` এ এলাকার `name` এর কপি থাকে (তালিকা, সার্চ ইনডেক্স ও পরিসংখ্যানের জন্য)।
+    """
+    name = models.CharField(max_length=100, unique=True, verbose_name='Name') # দেখানোর নাম
+    key = models.CharField(max_length=100, unique=True, editable=False, verbose_name='Key') # তুলনার key
+
+    objects = AreaManager()
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = 'Area'
+        verbose_name_plural = 'Areas'
+
+    def __str__(self):
+        return self.name
+
+    def save(self, *args, **kwargs):
+        self.key = normalize_area_name(self.name)
+        super().save(*args, **kwargs)
+
+
+class AreaAlias(models.Model):
+    """একটি এলাকার বিকল্প নাম — `?area=` এবং সদস্য save এ এই নামও একই এলাকায় মেলে।"""
+    area = models.ForeignKey(Area, on_delete=models.CASCADE, related_name='aliases', verbose_name='Area')
+    name = models.CharField(max_length=100, verbose_name='Alias')
+    key = models.CharField(max_length=100, unique=True, editable=False, verbose_name='Key')
+
+    class Meta:
+        verbose_name = 'Area Alias'
+        verbose_name_plural = 'Area Aliases'
+
+    def __str__(self):
+        return f"{self.name} -> {self.area}"
+
+    def clean(self):
+        key = normalize_area_name(self.name)
+        if Area.objects.filter(key=key).exclude(pk=self.area_id).exists():
+            raise ValidationError({'name': 'Another area already has this name.'})
+        if AreaAlias.objects.filter(key=key).exclude(pk=self.pk).exists():
+            raise ValidationError({'name': 'This alias is already in use.'})
+
+    def save(self, *args, **kwargs):
+        self.key = normalize_area_name(self.name)
+        super().save(*args, **kwargs)
+
+
 class Member(models.Model):
     """
     সমিতি বা কমিটির সদস্যদের তথ্য সংরক্ষণ করার জন্য এই মডেলটি তৈরি করা হয়েছে।
@@ -29,6 +130,24 @@ class Member(models.Model):
         ('Committee', 'Committee'),
         ('Member', 'Member'),
     ]
+    # পদবির ক্রম (`ROLE_CHOICES` এর অবস্থান): President = 0 ... Member = 4; অজানা পদবি সবার শেষে
+    ROLE_RANKS = {value: rank for rank, (value, _) in enumerate(ROLE_CHOICES)}
+
+    # সব তালিকার (সদস্য পেজ, API, cursor, অ্যাডমিন) একই ক্রম — `member_rank_name_idx`
+    # ইনডেক্সের কলামের ক্রমে, তাই ডাটাবেসকে আলাদা sort করতে হয় না।
+    ORDERING = ('role_rank', 'name', 'id')
+
+    # ছবি প্রসেসিং (WEBP কনভার্সন) এর অবস্থা।
+    IMAGE_PENDING = 'pending'
+    IMAGE_PROCESSING = 'processing'
+    IMAGE_READY = 'ready'
+    IMAGE_FAILED = 'failed'
+    IMAGE_STATUS_CHOICES = [
+        (IMAGE_PENDING, 'Pending'),
+        (IMAGE_PROCESSING, 'Processing'),
+        (IMAGE_READY, 'Ready'),
+        (IMAGE_FAILED, 'Failed'),
+    ]
     
     # === মৌলিক তথ্য ===
     name = models.CharField(max_length=200, verbose_name='Name') # সদস্যের পূর্ণ নাম
@@ -38,7 +157,20 @@ class Member(models.Model):
         default='Member',
         verbose_name='Role' # সদস্যের পদবি
     )
-    area = models.CharField(max_length=100, verbose_name='Area') # সদস্যের এলাকা বা ওয়ার্ড
+    role_rank = models.PositiveSmallIntegerField(
+        default=len(ROLE_CHOICES) - 1,
+        editable=False,
+        verbose_name='Role Rank' # save এ `role` থেকে নির্ধারিত হয় (`ROLE_RANKS`)
+    )
+    area = models.CharField(max_length=100, verbose_name='Area') # সদস্যের এলাকা বা ওয়ার্ড (`area_ref` এর নাম)
+    area_ref = models.ForeignKey(
+        Area,
+        on_delete=models.PROTECT,
+        related_name='members',
+        editable=False,
+        db_index=False,  # `member_area_ref_idx` composite ইনডেক্সের প্রথম কলাম
+        verbose_name='Area (normalized)' # save এ `area` থেকে নির্ধারিত হয়
+    )
     
     # === যোগাযোগের তথ্য ===
     # ফোন নম্বরের ফরম্যাট যাচাই করার জন্য RegexValidator ব্যবহার করা হয়েছে।
@@ -57,10 +189,30 @@ class Member(models.Model):
     bio = models.TextField(blank=True, verbose_name='Short Description') # সংক্ষিপ্ত বর্ণনা (অপশনাল)
     image = models.ImageField(
         upload_to=member_image_upload_path,
+        storage=get_member_image_storage,  # একই ছবি একবারই (content hash দিয়ে নাম)
         blank=True, 
         null=True,
         verbose_name='Image' # প্রোফাইল ছবি (অপশনাল)
     )
+    image_status = models.CharField(
+        max_length=20,
+        choices=IMAGE_STATUS_CHOICES,
+        default=IMAGE_READY,
+        editable=False,
+        verbose_name='Image Status' # ব্যাকগ্রাউন্ডে ছবি প্রসেসিং এর অবস্থা
+    )
+    image_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name='Image Hash' # আপলোড করা মূল ছবির sha256 — একই ছবি আবার প্রসেস হয় না
+    )
+    image_derivatives = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='Image Derivatives' # srcset এর জন্য ছোট সাইজের ছবিগুলোর manifest
+    )
     
     # === মেটাডেটা ===
     joined_date = models.DateField(auto_now_add=True, verbose_name='Joining Date')
@@ -71,13 +223,29 @@ class Member(models.Model):
     class Meta:
         """
         মডেলের মেটা-অপশনস।
-        - ordering: সদস্যদের তালিকা ডিফল্টভাবে 'role' এবং 'name' অনুযায়ী সাজানো থাকবে।
+        - ordering: সদস্যদের তালিকা ডিফল্টভাবে পদবির ক্রম (`role_rank`), নাম এবং id অনুযায়ী সাজানো থাকবে।
         - verbose_name: অ্যাডমিন প্যানেলে মডেলের সিঙ্গুলার নাম 'সদস্য' হিসেবে দেখাবে।
         - verbose_name_plural: অ্যাডমিন প্যানেলে মডেলের প্লুরাল নাম 'সদস্যগণ' হিসেবে দেখাবে।
         """
-        ordering = ['id' ,'role', 'name']
+        ordering = ['role_rank', 'name', 'id']
         verbose_name = 'Member'
         verbose_name_plural = 'Members'
+        indexes = [
+            # সব তালিকা (সদস্য পেজ, API, cursor, অ্যাডমিন changelist) ও keyset pagination
+            # (`pages.pagination`) এর seek কী (role_rank, name, id); পদবি ফিল্টারে role_rank ও equality।
+            # সক্রিয় সদস্য ফিল্টার (`WHERE "is_active"`) ইনডেক্সের ক্রমে পড়ার সময়ই হয়, তাই আলাদা sort নেই
+            models.Index(fields=['role_rank', 'name', 'id'], name='member_rank_name_idx'),
+            # conditional GET validator এর MAX(updated_at) এর জন্য
+            models.Index(fields=['updated_at'], name='member_updated_at_idx'),
+            # `?area=` ফিল্টার (`pages.areas.matching_areas`, অ্যাডমিনের `AreaListFilter`): FK দিয়ে খোঁজা;
+            # একাধিক এলাকা মিলতে পারে (IN), তাই শুধু ঐ এলাকাগুলোর সারিগুলো sort হয় — পুরো টেবিল নয়
+            models.Index(fields=['area_ref', 'role_rank', 'name', 'id'], name='member_area_ref_idx'),
+            # অ্যাডমিনে ফোন/ইমেইল দিয়ে সরাসরি খোঁজা (`pages.admin`)
+            models.Index(fields=['phone'], name='member_phone_idx'),
+            models.Index(fields=['email'], name='member_email_idx'),
+            # `gc_media`: ডিস্কের ফাইলের নামগুলো chunk ধরে রেফারেন্সের সাথে মেলানো
+            models.Index(fields=['image'], name='member_image_idx'),
+        ]
 
     def __str__(self):
         """
@@ -93,42 +261,320 @@ class Member(models.Model):
         if self.image and hasattr(self.image, 'url'):
             return self.image.url
         # একটি ডিফল্ট অ্যাভাটার ইমেজ প্রদান করা হয়েছে
-        return 'https://images.unsplash.com/photo-1506794778202-cad84cf45f1d?q=80&w=200&h=200&auto=format&fit=crop&crop=faces'
+        return DEFAULT_AVATAR_URL
+
+    @property
+    def fragment_version(self):
+        """`updated_at` এর মাইক্রোসেকেন্ড — বিস্তারিত fragment এর cache key ও URL এর `v`।"""
+        return int(self.updated_at.timestamp() * 1_000_000) if self.updated_at else 0
+
+    def get_fragment_url(self):
+        """
+        তালিকা পেজের মডালের জন্য বিস্তারিত HTML fragment এর URL। `?v=` এ `updated_at` থাকে,
+        তাই সদস্য বদলালে URL বদলায় এবং ব্রাউজারের cache করা পুরনো কপি আর ব্যবহার হয় না।
+        """
+        return f"{reverse('pages:sodosso-fragment', args=[self.pk])}?v={self.fragment_version}"
+
+    def needs_derivatives(self):
+        """ছবি প্রস্তুত কিন্তু derivative manifest পুরনো/নেই (কোনো IO ছাড়া)।"""
+        return bool(self.image) and self.image_status == self.IMAGE_READY and not derivatives_are_current(self)
+
+    def get_avatar_variants(self, key='sizes'):
+        """
+        srcset এর জন্য ছবির derivative গুলো: `[(width, url), ...]` (ছোট থেকে বড়)।
+        derivative এখনো তৈরি না হলে খালি লিস্ট — তখন মূল ছবিই দেখানো হয়। পড়ার পথে কোনো
+        টাস্ক পাঠানো হয় না; derivative তৈরি হয় ছবি সংরক্ষণের টাস্কে (`process_member_image`)
+        বা `backfill_derivatives` কমান্ডে। `key='avif'`: `reencode_media --avif` এর AVIF সংস্করণ।
+        """
+        if not self.image or self.image_status != self.IMAGE_READY:
+            return []
+        if not derivatives_are_current(self):
+            return []
+        return derivative_variants(self, key)
     
-    # count of all active members
+    @classmethod
+    def rank_for_role(cls, role):
+        """পদবির ক্রম (`role_rank`) — bulk create/update এও একই মান বসানোর জন্য।"""
+        return cls.ROLE_RANKS.get(role, len(cls.ROLE_CHOICES))
 
+    @classmethod
+    def assign_role_ranks(cls, members):
+        """`save()` ছাড়া লেখা সদস্যদের (bulk create/update) `role_rank` বসায়।"""
+        for member in members:
+            member.role_rank = cls.rank_for_role(member.role)
+        return members
+
+    @classmethod
+    def active_count(cls):
+        """সক্রিয় সদস্যের মোট সংখ্যা — সারাংশ টেবিল (`MemberStat`) থেকে, full scan ছাড়া।"""
+        from .stats import get_stats
+        return get_stats()['active']
+
+
+    # --- পরিবর্তন ট্র্যাকিং ---
+    # ডাটাবেস থেকে লোড করা মানগুলো মনে রাখা হয়, যাতে save() শুধু পরিবর্তিত কলামগুলো লেখে
+    # এবং ছবি না বদলালে ইমেজ প্রসেসিং না চলে।
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: copy.deepcopy(value) for name, value in zip(field_names, values) if value is not models.DEFERRED
+        }
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # deferred ফিল্ড প্রথমবার পড়লে (বা refresh করলে) সেগুলোও এখন লোড করা মান
+        if hasattr(self, '_loaded_values'):
+            self._loaded_values.update(self._current_values(
+                field.attname for field in self._meta.concrete_fields
+                if field.attname in self.__dict__
+                and (fields is None or field.name in fields or field.attname in fields)
+            ))
+
+    def _current_values(self, attnames):
+        values = {}
+        for attname in attnames:
+            value = getattr(self, attname)
+            # FileField এর ক্ষেত্রে শুধু ফাইলের নাম তুলনা করা হয়; JSONField এর dict/list এর কপি,
+            # যাতে জায়গায় বদলানো (`member.image_derivatives['sizes'] = ...`) ধরা পড়ে
+            if isinstance(value, models.fields.files.FieldFile):
+                value = value.name
+            elif isinstance(value, (dict, list)):
+                value = copy.deepcopy(value)
+            values[attname] = value
+        return values
+
+    def get_dirty_fields(self):
+        """
+        লোড হওয়ার পর থেকে যে ফিল্ডগুলো বদলেছে তাদের নাম (set)।
+        ডাটাবেস থেকে লোড না হলে (নতুন বা হাতে তৈরি instance) `None`।
+        """
+        loaded = getattr(self, '_loaded_values', None)
+        if loaded is None:
+            return None
+        current = self._current_values(loaded)
+        # লোডের সময় deferred (`only()`/`defer()`) কিন্তু পরে বসানো ফিল্ডও পরিবর্তিত
+        return {
+            field.name for field in self._meta.concrete_fields
+            if (field.attname in loaded and current[field.attname] != loaded[field.attname])
+            or (field.attname not in loaded and field.attname in self.__dict__)
+        }
+
+    def _image_upload_is_duplicate(self):
+        """
+        নতুন আপলোড করা ফাইলটি আগের ছবির সাথে হুবহু এক কিনা (sha256 দিয়ে)।
+        নতুন ফাইলের hash `image_hash` এ বসানো হয়।
+        """
+        digest = hashlib.sha256()
+        for chunk in self.image.chunks():
+            digest.update(chunk)
+        previous_hash = self.image_hash
+        self.image_hash = digest.hexdigest()
+        return bool(previous_hash) and previous_hash == self.image_hash
+
+    # ইমেজ কনভার্সন (WEBP) রিকোয়েস্টের বাইরে ব্যাকগ্রাউন্ড টাস্কে করা হয় (`pages.tasks`)।
+    def save(self, *args, process_image=True, **kwargs):
+        """
+        সদস্য save করে এবং নতুন ছবি আপলোড হলে WEBP কনভার্সনের টাস্ক কিউতে পাঠায়।
+        কনভার্সন শেষ না হওয়া পর্যন্ত `image_status` = pending এবং মূল ছবিটিই দেখানো হয়।
+        worker নিজে `process_image=False` দিয়ে save করে।
+
+        ডাটাবেস থেকে লোড করা instance এর ক্ষেত্রে শুধু পরিবর্তিত কলামগুলো
+        (`update_fields`) লেখা হয়, এবং ছবি না বদলালে PIL বা ফাইলসিস্টেমে হাত দেওয়া হয় না।
+        """
+        adding = self._state.adding
+        dirty = None if adding else self.get_dirty_fields()
+        image_changed = adding or dirty is None or 'image' in dirty
+        if self.image and not self.image._committed:
+            if self._image_upload_is_duplicate() and not adding and self._loaded_values.get('image'):
+                # একই ছবি আবার আপলোড হয়েছে — আগের প্রসেস করা ফাইলটিই থাকবে
+                self.image = self._loaded_values['image']
+                image_changed = False
+            else:
+                image_changed = True
+        elif image_changed and not self.image:
+            self.image_hash = ''
+            self.image_status = self.IMAGE_READY
+
+        update_fields = kwargs.get('update_fields')
+        if adding or dirty is None or 'area' in dirty or self.area_ref_id is None:
+            # এলাকার নাম normalized এলাকায় রূপান্তর (বানান ভিন্ন হলেও একই এলাকা)
+            self.area_ref = Area.objects.get_for_name(self.area)
+            self.area = self.area_ref.name
+            if update_fields is not None and 'area' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'area_ref'}
+
+        if adding or dirty is None or 'role' in dirty:
+            self.role_rank = self.rank_for_role(self.role)
+            if update_fields is not None and 'role' in update_fields:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'role_rank'}
+
+        enqueue_image = process_image and image_changed and bool(self.image)
+        if enqueue_image:
+            self.image_status = self.IMAGE_PENDING
+
+        if dirty is not None and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            # শুধু পরিবর্তিত কলামগুলো (এবং updated_at) লেখা হবে
+            kwargs['update_fields'] = self.get_dirty_fields() | {'updated_at'}
+        elif kwargs.get('update_fields') is not None and enqueue_image:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'image_status', 'image_hash'}
 
-    # ইমেজ কনভার্সন এবং সাইজ কমানোর জন্য save মেথড ওভাররাইড করা হয়েছে
-    def save(self, *args, **kwargs):
-        # প্রথমে instance টি normal ভাবে save করুন
         super().save(*args, **kwargs)
+        self._loaded_values = self._current_values(field.attname for field in self._meta.concrete_fields)
+
+        if enqueue_image:
+            from .tasks import enqueue, process_member_image
+            enqueue(process_member_image, self.pk)
+
+
+# --- সদস্য পরিসংখ্যান ---
+
+class MemberStat(models.Model):
+    """
+    (role, area, is_active) অনুযায়ী সদস্য সংখ্যার সারাংশ টেবিল (`pages.stats`)।
+    সদস্য save/delete এবং bulk আপডেটে incremental ভাবে বদলায়, তাই ড্যাশবোর্ড বা
+    ফিল্টারের সংখ্যার জন্য সদস্য টেবিল scan করতে হয় না।
+    `python manage.py rebuild_member_stats` সদস্য টেবিল থেকে নতুন করে গণনা করে।
+    """
+    role = models.CharField(max_length=50, verbose_name='Role')
+    area = models.CharField(max_length=100, verbose_name='Area')
+    is_active = models.BooleanField(verbose_name='Active')
+    count = models.IntegerField(default=0, verbose_name='Members')
+
+    class Meta:
+        verbose_name = 'Member Statistic'
+        verbose_name_plural = 'Member Statistics'
+        constraints = [
+            models.UniqueConstraint(fields=['role', 'area', 'is_active'], name='member_stat_key'),
+        ]
+        indexes = [
+            # অ্যাডমিনের এলাকা autocomplete এর prefix (range) খোঁজা
+            models.Index(fields=['area'], name='member_stat_area_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.role} / {self.area} / {'active' if self.is_active else 'inactive'}: {self.count}"
 
-        # এখন image থাকলে কনভার্ট করুন
-        if self.image:
-            img_path = self.image.path
-            img = Image.open(img_path)
 
-            # WEBP ফরম্যাটে কনভার্ট করা
-            webp_io = BytesIO()
-            img.save(webp_io, format='WEBP', quality=85)
+# --- ব্যাকগ্রাউন্ড টাস্ক কিউ ---
+
+class Task(models.Model):
+    """
+    ডাটাবেস ভিত্তিক টাস্ক কিউ এর একটি টাস্ক (`pages.tasks` দেখুন)।
+    `python manage.py run_tasks` worker pending টাস্কগুলো চালায়।
+    """
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    name = models.CharField(max_length=200, verbose_name='Task') # রেজিস্টার করা টাস্কের নাম
+    args = models.JSONField(default=list, blank=True, verbose_name='Arguments')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING, verbose_name='Status')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='Attempts')
+    last_error = models.TextField(blank=True, verbose_name='Last Error')
+    run_after = models.DateTimeField(default=timezone.now, verbose_name='Run After') # এর আগে চালানো হবে না
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
+    started_at = models.DateTimeField(blank=True, null=True, verbose_name='Started At')
+    finished_at = models.DateTimeField(blank=True, null=True, verbose_name='Finished At')
+
+    class Meta:
+        ordering = ['-id']
+        verbose_name = 'Background Task'
+        verbose_name_plural = 'Background Tasks'
+        indexes = [
+            # worker এর "due pending টাস্ক" কোয়েরির জন্য
+            models.Index(fields=['status', 'run_after'], name='task_status_run_after_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.id} - {self.name} - {self.status}"
 
-            # filename rename: username + timestamp
-            timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-            username = self.name.replace(" ", "_")
-            new_filename = f"{username}_{timestamp}.webp"
 
-            # final path: members/<role>/<filename>
-            upload_path = f"members/{self.role}/{new_filename}"
+class MemberBulkUpdate(models.Model):
+    """
+    অ্যাডমিন থেকে অনেক সদস্যকে একসাথে সক্রিয়/নিষ্ক্রিয় করার একটি ব্যাকগ্রাউন্ড জব।
+    সদস্যদের id এর তালিকা নয়, selection টি রাখা হয়: `Member` এর ORM lookup (`filters`), সার্চ
+    টার্ম এবং জব তৈরির সময়ের সবচেয়ে বড় id (`last_pk`) — পরে যোগ হওয়া সদস্য বাদ পড়ে।
+    `pages.tasks.run_member_bulk_update` pk এর ক্রমে ছোট ছোট chunk এ আপডেট করে এবং প্রতিটি
+    chunk এর পরে `cursor` (শেষ আপডেট হওয়া id) ও `processed` বাড়ায় — তাই অগ্রগতি দেখা যায়
+    এবং retry হলে সেখান থেকেই চলে।
+    """
+    filters = models.JSONField(default=dict, blank=True, verbose_name='Filters') # `Member.objects.filter(**filters)`
+    search = models.CharField(max_length=200, blank=True, verbose_name='Search') # সার্চ ব্যাকএন্ডের টার্ম (`search_members`)
+    last_pk = models.BigIntegerField(default=0, verbose_name='Last Member ID')
+    cursor = models.BigIntegerField(default=0, verbose_name='Cursor')
+    is_active = models.BooleanField(verbose_name='Set Active') # সদস্যদের নতুন অবস্থা
+    total = models.PositiveIntegerField(default=0, verbose_name='Total')
+    processed = models.PositiveIntegerField(default=0, verbose_name='Processed')
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES, default=Task.PENDING, verbose_name='Status')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='Created At')
+    finished_at = models.DateTimeField(blank=True, null=True, verbose_name='Finished At')
 
-            # image save
-            self.image.save(upload_path, ContentFile(webp_io.getvalue()), save=False)
+    class Meta:
+        ordering = ['-id']
+        verbose_name = 'Member Bulk Update'
+        verbose_name_plural = 'Member Bulk Updates'
+
+    def __str__(self):
+        action = 'activate' if self.is_active else 'deactivate'
+        return f"{self.id} - {action} {self.processed}/{self.total} - {self.status}"
 
-            # আগের ফাইল ডিলিট (optional)
-            try:
-                if os.path.exists(img_path):
-                    os.remove(img_path)
-            except Exception:
-                pass
+    @property
+    def progress(self):
+        """শতকরা অগ্রগতি (0-100)।"""
+        return 100 if not self.total else min(100, self.processed * 100 // self.total)
 
-            super().save(*args, **kwargs)
 
+# --- ফুল-টেক্সট সার্চ ইনডেক্স (SQLite FTS5) ---
+
+class FTSDocumentField(models.TextField):
+    """
+    FTS5 টেবিলের hidden কলাম (যার নাম টেবিলের নামের সমান)।
+    শুধুমাত্র `__match` lookup এর জন্য ব্যবহৃত হয়।
+    """
+
+
+@FTSDocumentField.register_lookup
+class FTSMatch(Lookup):
+    """`search_entry__document__match='...'` -> `"pages_member_fts"."pages_member_fts" MATCH %s`"""
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class MemberSearchEntry(models.Model):
+    """
+    `Member` এর সার্চ ইনডেক্স — একটি FTS5 virtual table (migration এ তৈরি হয়)।
+    rowid = Member.id, তাই join টি primary key দিয়ে হয়।
+    এই মডেল শুধু পড়ার জন্য; লেখা হয় `pages.search` ব্যাকএন্ডের মাধ্যমে।
+    """
+    member = models.OneToOneField(
+        Member,
+        primary_key=True,
+        db_column='rowid',
+        db_constraint=False,
+        on_delete=models.DO_NOTHING,
+        related_name='search_entry',
+    )
+    name = models.TextField()
+    role = models.TextField()
+    area = models.TextField()
+    bio = models.TextField()
+    document = FTSDocumentField(db_column='pages_member_fts')
+    rank = models.FloatField(db_column='rank')
+
+    class Meta:
+        managed = False
+        db_table = 'pages_member_fts'
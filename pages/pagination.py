@@ -0,0 +1,305 @@
+# pages/pagination.py
+"""
+Keyset (cursor) pagination।
+
+OFFSET/COUNT এর বদলে একটি স্থির অর্ডারিং কী (ডিফল্ট: `Member.ORDERING`) এর উপর seek করা হয়,
+তাই যেকোনো পেজের খরচ প্রথম পেজের সমান। cursor হলো শেষ/প্রথম সারির কী-এর
+একটি opaque (base64 JSON) টোকেন।
+
+অ্যাডমিন changelist এর জন্য আছে `EstimatedCountPaginator` — পেজ নম্বর থাকে, কিন্তু
+পুরো `COUNT(*)` ছাড়া।
+"""
+import base64
+import binascii
+import json
+from functools import cached_property, reduce
+import operator
+
+from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .models import Member
+
+
+class InvalidCursor(ValueError):
+    """cursor টোকেন পড়া না গেলে বা অর্ডারিং কী এর সাথে না মিললে।"""
+
+
+# cursor এর কী সবসময় `Member.ORDERING` — অন্য ক্রম (ordering, সার্চের relevance) এর সাথে
+# মেলানো যায় না, তাই এগুলোর সাথে `cursor` দিলে চুপচাপ ক্রম না বদলে 400 দেওয়া হয়।
+CURSOR_CONFLICTING_PARAMS = ('ordering', 'search')
+CURSOR_CONFLICT_MESSAGE = 'The cursor parameter cannot be combined with ordering or search.'
+
+
+def cursor_conflicts(params, cursor_param='cursor'):
+    """`params` এ cursor এর সাথে `ordering`/`search` (খালি নয়) দেওয়া আছে কিনা।"""
+    return cursor_param in params and any(params.get(name) for name in CURSOR_CONFLICTING_PARAMS)
+
+
+def encode_cursor(values, reverse=False):
+    payload = json.dumps({'k': list(values), 'r': int(reverse)}, cls=DjangoJSONEncoder, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token, key_length):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, reverse = payload['k'], bool(payload['r'])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursor(token)
+    if not isinstance(values, list) or len(values) != key_length:
+        raise InvalidCursor(token)
+    return values, reverse
+
+
+class KeysetPage:
+    """
+    এক পেজের ফলাফল। টেমপ্লেটে Django `Page` এর মতোই iterate করা যায়
+    (`has_next`, `has_previous`, `has_other_pages`) এবং পরের/আগের পেজের cursor দেয়।
+    """
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """
+    `queryset` কে `ordering` কী অনুযায়ী keyset পেজে ভাগ করে।
+    `ordering` এর শেষ ফিল্ডটি অবশ্যই unique হতে হবে (যেমন `id`), নাহলে ক্রম স্থির থাকে না।
+    """
+
+    # approximate total গণনার সর্বোচ্চ সীমা — এর বেশি হলে "N+" হিসেবে দেখানো হয়।
+    total_cap = 1000
+
+    def __init__(self, queryset, per_page, ordering=Member.ORDERING):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = tuple(ordering)
+        self.fields = [field.lstrip('-') for field in self.ordering]
+
+    def _seek_filter(self, values, reverse):
+        """কী `values` এর পরের (reverse হলে আগের) সারিগুলোর জন্য Q এক্সপ্রেশন।"""
+        clauses = []
+        for position, field in enumerate(self.ordering):
+            descending = field.startswith('-')
+            lookup = 'lt' if descending != reverse else 'gt'
+            condition = {name: value for name, value in zip(self.fields[:position], values)}
+            condition[f'{self.fields[position]}__{lookup}'] = values[position]
+            clauses.append(Q(**condition))
+        # প্রথম ফিল্ডের অতিরিক্ত সীমা (`>=`/`<=`): OR এর শাখাগুলো আলাদা ইনডেক্স খোঁজা
+        # (MULTI-INDEX OR) হয়ে আবার sort না হয়ে একটি ইনডেক্স range এ seek হয়
+        lookup = 'lte' if self.ordering[0].startswith('-') != reverse else 'gte'
+        return Q(**{f'{self.fields[0]}__{lookup}': values[0]}) & reduce(operator.or_, clauses)
+
+    def _row_key(self, obj):
+        if isinstance(obj, dict):
+            return [obj[field] for field in self.fields]
+        return [getattr(obj, field) for field in self.fields]
+
+    def _page_queryset(self, cursor):
+        """`cursor` অনুযায়ী seek করা ও সাজানো queryset (একটি বাড়তি সারিসহ) এবং দিক।"""
+        reverse = False
+        queryset = self.queryset
+        if cursor:
+            values, reverse = decode_cursor(cursor, len(self.fields))
+            try:
+                queryset = queryset.filter(self._seek_filter(values, reverse))
+            except (ValueError, TypeError):
+                # কী এর মানের ধরন ভুল (যেমন অর্ডারিং বদলানোর আগের cursor)
+                raise InvalidCursor(cursor)
+
+        if reverse:
+            ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in self.ordering]
+        else:
+            ordering = self.ordering
+
+        # একটি বাড়তি সারি আনা হয় — সেটি থাকলে ঐ দিকে আরও পেজ আছে।
+        return queryset.order_by(*ordering)[:self.per_page + 1], reverse
+
+    def _make_page(self, rows, cursor, reverse):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or reverse:
+                next_cursor = encode_cursor(self._row_key(rows[-1]))
+            if (has_more and reverse) or (cursor and not reverse):
+                previous_cursor = encode_cursor(self._row_key(rows[0]), reverse=True)
+        return KeysetPage(rows, next_cursor, previous_cursor)
+
+    def get_page(self, cursor=None):
+        """
+        `cursor` টোকেন অনুযায়ী একটি `KeysetPage` ফেরত দেয়। `cursor` না থাকলে প্রথম পেজ।
+        ভুল টোকেন হলে `InvalidCursor` raise করে।
+        """
+        queryset, reverse = self._page_queryset(cursor)
+        return self._make_page(list(queryset), cursor, reverse)
+
+    async def aget_page(self, cursor=None):
+        """`get_page` এর async সংস্করণ (async ORM দিয়ে)।"""
+        queryset, reverse = self._page_queryset(cursor)
+        return self._make_page([row async for row in queryset], cursor, reverse)
+
+    def cursor_for_page(self, number):
+        """
+        পুরনো পেজ নম্বরের (`?page=N`, ১ থেকে) keyset cursor: আগের পেজের শেষ সারির কী, একবার
+        OFFSET দিয়ে খোঁজা। ভুল নম্বর বা প্রথম পেজে `None`; শেষ পেজের পরের নম্বরে শেষ পেজ
+        (Django `Paginator.get_page` এর মতো)।
+        """
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return None
+        if number <= 1:
+            return None
+        rows = self.queryset.order_by(*self.ordering).values_list(*self.fields)
+        offset = (number - 1) * self.per_page - 1
+        row = rows[offset:offset + 1].first()
+        if row is None:
+            count = self.queryset.count()
+            if count <= self.per_page:
+                return None
+            offset = (count - 1) // self.per_page * self.per_page - 1
+            row = rows[offset:offset + 1].first()
+        return encode_cursor(row)
+
+    def _total_queryset(self):
+        # COUNT একটি LIMIT করা subquery তে চলে
+        return self.queryset.order_by()[:self.total_cap + 1]
+
+    def _cap_total(self, count):
+        if count > self.total_cap:
+            return self.total_cap, False
+        return count, True
+
+    def approximate_total(self):
+        """
+        মোট সংখ্যা, কিন্তু `total_cap` পর্যন্ত সীমিত। `(count, is_exact)` ফেরত দেয়।
+        """
+        return self._cap_total(self._total_queryset().count())
+
+    async def aapproximate_total(self):
+        return self._cap_total(await self._total_queryset().acount())
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    মোট সংখ্যার জন্য full scan ছাড়া Django `Paginator`।
+    - `count` দেওয়া থাকলে (যেমন সারাংশ টেবিল থেকে জানা সংখ্যা) সেটিই ব্যবহার হয়।
+    - না থাকলে LIMIT করা subquery তে `count_cap` পর্যন্ত গোনা হয়; এর বেশি হলে
+      `count_cap` ধরা হয় এবং `count_is_exact` False হয় (পরের পেজগুলোর জন্য ফিল্টার/সার্চ লাগে)।
+    """
+
+    count_cap = 10000
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, count=None):
+        super().__init__(object_list, per_page, orphans, allow_empty_first_page)
+        self.known_count = count
+        self.count_is_exact = True
+
+    @cached_property
+    def count(self):
+        if self.known_count is not None:
+            return self.known_count
+        count = self.object_list.order_by()[:self.count_cap + 1].count()
+        if count > self.count_cap:
+            self.count_is_exact = False
+            return self.count_cap
+        return count
+
+
+def cursor_link(request, cursor, param='cursor'):
+    """বর্তমান URL এ `param` বদলে পরের/আগের পেজের সম্পূর্ণ লিংক (`total` বাদ দিয়ে)।"""
+    if cursor is None:
+        return None
+    url = remove_query_param(request.build_absolute_uri(), 'total')
+    return replace_query_param(url, param, cursor)
+
+
+class MemberCursorPagination(BasePagination):
+    """
+    `/api/members/` এর জন্য keyset pagination।
+    শুধুমাত্র `?cursor=` প্যারামিটার থাকলে চালু হয় (প্রথম পেজের জন্য খালি `?cursor=`),
+    যাতে পুরনো ক্লায়েন্টরা আগের মতো পুরো তালিকা পায়।
+    `?total=1` দিলে approximate মোট সংখ্যাও দেওয়া হয়।
+    `?ordering=` বা `?search=` এর সাথে `cursor` দিলে 400 (`CURSOR_CONFLICTING_PARAMS`)।
+    """
+    cursor_query_param = 'cursor'
+    page_size = 8
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = Member.ORDERING
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return None
+        if cursor_conflicts(request.query_params, self.cursor_query_param):
+            raise ParseError(CURSOR_CONFLICT_MESSAGE)
+        self.request = request
+        self.paginator = KeysetPaginator(queryset, self.get_page_size(request), self.ordering)
+        try:
+            self.page = self.paginator.get_page(request.query_params[self.cursor_query_param])
+        except InvalidCursor:
+            raise NotFound('Invalid cursor')
+        return list(self.page)
+
+    def _link(self, cursor):
+        return cursor_link(self.request, cursor, self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self._link(self.page.next_cursor),
+            'previous': self._link(self.page.previous_cursor),
+        }
+        if self.request.query_params.get('total'):
+            count, exact = self.paginator.approximate_total()
+            payload['count'] = count
+            payload['count_is_exact'] = exact
+        payload['results'] = data
+        return Response(payload)
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'count': {'type': 'integer'},
+                'count_is_exact': {'type': 'boolean'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,295 @@
+# pages/prerender.py
+"""
+মার্কেটিং পেজগুলোর (হোম, About, Services, ...) আগে থেকে রেন্ডার করা HTML।
+
+এই পেজগুলোর টেমপ্লেট নির্দিষ্ট, কোনো ডায়নামিক context নেই — তবু প্রতিটি হিটে context
+processor চলত এবং `home.html` ও তার partial গুলো রেন্ডার হত। এখন:
+
+- `build()` (বা `python manage.py prerender_pages`) প্রতিটি পেজ তার নিজের ভিউ দিয়ে একবার
+  রেন্ডার করে — তাই `{% static %}` এর hash করা নাম (প্রোডাকশনের manifest) HTML এ বসে যায় —
+  এবং `PRERENDER_ROOT` এ content hash নামে HTML, `.gz` ও (`brotli` থাকলে) `.br` লেখে;
+  তালিকা ও strong ETag `manifest.json` এ।
+- `PrerenderedPageMiddleware` (`pages.middleware`) ফাইলগুলো মেমোরিতে রেখে URL মিললে
+  ভিউ/URL resolver/context processor ছাড়াই সরাসরি পাঠায় — `Accept-Encoding` অনুযায়ী
+  ভ্যারিয়েন্ট, `If-None-Match` এ 304।
+- dirty-check: প্রজেক্টের টেমপ্লেট ডিরেক্টরির ফাইলগুলোর mtime/আকার এবং static manifest
+  থেকে একটি fingerprint; `PRERENDER_CHECK_INTERVAL` সেকেন্ড পরপর মেলানো হয়। বদলালে
+  পুরনো HTML আর পাঠানো হয় না (রিকোয়েস্ট সাধারণ ভিউতে যায়) এবং নতুন build হয়।
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.template import engines
+from django.urls import resolve, reverse
+from django.utils.http import http_date, parse_etags
+
+from .storage import iter_files
+
+try:
+    import brotli
+except ImportError:  # brotli ঐচ্ছিক; না থাকলে শুধু gzip
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# যে পেজগুলো আগে থেকে রেন্ডার হয় (URL নাম) — সবগুলো নির্দিষ্ট টেমপ্লেট, context ছাড়া
+PAGES = (
+    'pages:home', 'pages:about', 'pages:services', 'pages:portfolio',
+    'pages:ownership', 'pages:blog-products', 'pages:contact',
+)
+
+MANIFEST_NAME = 'manifest.json'
+
+# ব্রাউজার যা চায় তার মধ্যে প্রথম যেটি আছে: (manifest এর কী, Content-Encoding)
+ENCODINGS = (('br', 'br'), ('gzip', 'gzip'))
+
+
+def prerender_root():
+    return Path(getattr(settings, 'PRERENDER_ROOT', settings.BASE_DIR / 'run' / 'prerendered'))
+
+
+def template_dirs():
+    """প্রজেক্টের টেমপ্লেট ডিরেক্টরি (`TEMPLATES[...]['DIRS']`) — পেজগুলোর টেমপ্লেট এখানেই।"""
+    return [directory for engine in engines.all() for directory in getattr(engine, 'dirs', ())]
+
+
+def source_fingerprint():
+    """
+    পেজগুলোর আউটপুট যেসব জিনিসের উপর নির্ভর করে তার fingerprint: টেমপ্লেট ফাইলগুলোর নাম,
+    mtime ও আকার (ফাইল না পড়ে, শুধু `stat`), static manifest (`collectstatic` এর পরে
+    hash করা নাম বদলায়), `STATIC_URL` এবং পেজের তালিকা।
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([PAGES, settings.STATIC_URL]).encode())
+    for directory in template_dirs():
+        entries = sorted(iter_files(str(directory)), key=lambda entry: entry.path)
+        for entry in entries:
+            stat_result = entry.stat(follow_symlinks=False)
+            digest.update(f'{entry.path}:{stat_result.st_mtime_ns}:{stat_result.st_size}\n'.encode())
+    manifest_name = getattr(staticfiles_storage, 'manifest_name', None)
+    if manifest_name:
+        try:
+            stat_result = os.stat(staticfiles_storage.path(manifest_name))
+            digest.update(f'static:{stat_result.st_mtime_ns}:{stat_result.st_size}'.encode())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def render_page(path):
+    """পেজটি তার নিজের ভিউ দিয়ে রেন্ডার করে (middleware ছাড়া) এবং HTML bytes ফেরত দেয়।"""
+    match = resolve(path)
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    request.resolver_match = match
+    response = match.func(request, *match.args, **match.kwargs)
+    if response.status_code != 200:
+        raise ValueError(f'{path} rendered with status {response.status_code}')
+    return response.content
+
+
+def _write(root, name, content):
+    path = root / name
+    if not path.exists():
+        temp_path = path.with_name(f'.{name}.tmp')
+        temp_path.write_bytes(content)
+        os.replace(temp_path, path)
+    return name
+
+
+def build(root=None):
+    """
+    সব পেজ রেন্ডার করে ফাইলগুলো ও `manifest.json` লেখে; manifest এ নেই এমন পুরনো
+    ফাইল মুছে দেয়। যে পেজ রেন্ডার হয় না সেটি manifest এ থাকে না। নতুন manifest ফেরত দেয়।
+    """
+    root = Path(root or prerender_root())
+    root.mkdir(parents=True, exist_ok=True)
+    # রেন্ডারের আগে — রেন্ডারের মাঝে টেমপ্লেট বদলালে পরের check এ আবার build হবে
+    fingerprint = source_fingerprint()
+    pages = {}
+    for name in PAGES:
+        path = reverse(name)
+        try:
+            body = render_page(path)
+        except Exception:
+            # একটি ভাঙা পেজের জন্য বাকিগুলো আটকায় না — এটি সাধারণ ভিউ দিয়েই চলবে
+            logger.exception('Could not pre-render %s', path)
+            continue
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        files = {'identity': _write(root, f'{etag}.html', body)}
+        compressed = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(compressed) < len(body):
+            files['gzip'] = _write(root, f'{etag}.html.gz', compressed)
+        if brotli is not None:
+            compressed = brotli.compress(body, mode=brotli.MODE_TEXT)
+            if len(compressed) < len(body):
+                files['br'] = _write(root, f'{etag}.html.br', compressed)
+        pages[path] = {'name': name, 'etag': etag, 'files': files}
+
+    manifest = {'fingerprint': fingerprint, 'built': int(time.time()), 'pages': pages}
+    temp_path = root / f'.{MANIFEST_NAME}.tmp'
+    temp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(temp_path, root / MANIFEST_NAME)
+
+    keep = {MANIFEST_NAME} | {filename for page in pages.values() for filename in page['files'].values()}
+    for entry in os.scandir(root):
+        if entry.is_file() and entry.name not in keep and not entry.name.startswith('.'):
+            os.remove(entry.path)
+    return manifest
+
+
+def load_manifest(root=None):
+    try:
+        return json.loads((Path(root or prerender_root()) / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+class Page:
+    """মেমোরিতে রাখা একটি পেজ: প্রতিটি encoding এর bytes এবং ETag।"""
+
+    def __init__(self, etag, bodies, last_modified):
+        self.etag = etag
+        self.bodies = bodies
+        self.last_modified = last_modified
+
+    def etag_for(self, encoding):
+        # strong ETag প্রতিটি representation এর জন্য আলাদা
+        return f'"{self.etag}"' if encoding == 'identity' else f'"{self.etag}-{encoding}"'
+
+    def choose_encoding(self, accept_encoding):
+        accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+        for key, coding in ENCODINGS:
+            if key in self.bodies and coding in accepted:
+                return key
+        return 'identity'
+
+    def respond(self, request):
+        encoding = self.choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        headers = {
+            'ETag': self.etag_for(encoding),
+            'Last-Modified': http_date(self.last_modified),
+            'Vary': 'Accept-Encoding',
+            'Cache-Control': f'max-age={getattr(settings, "PRERENDER_CACHE_MAX_AGE", 0)}, must-revalidate',
+            # ভিউতে গেলে XFrameOptionsMiddleware যা দিত
+            'X-Frame-Options': getattr(settings, 'X_FRAME_OPTIONS', 'DENY'),
+        }
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            # যে কোনো encoding এর কপি থাকলেই — কনটেন্ট একই
+            etags = parse_etags(if_none_match)
+            if '*' in etags or any(self.etag_for(key) in etags for key in self.bodies):
+                response = HttpResponseNotModified()
+                for header in ('ETag', 'Vary', 'Cache-Control'):
+                    response[header] = headers[header]
+                return response
+        body = self.bodies[encoding]
+        response = HttpResponse(b'' if request.method == 'HEAD' else body, content_type='text/html; charset=utf-8', headers=headers)
+        response['Content-Length'] = str(len(body))
+        if encoding != 'identity':
+            response['Content-Encoding'] = encoding
+        return response
+
+
+def load_pages(manifest, root=None):
+    """manifest এর ফাইলগুলো মেমোরিতে পড়ে `{path: Page}`; কোনো ফাইল না থাকলে `None`।"""
+    root = Path(root or prerender_root())
+    pages = {}
+    try:
+        for path, page in manifest['pages'].items():
+            bodies = {encoding: (root / filename).read_bytes() for encoding, filename in page['files'].items()}
+            pages[path] = Page(page['etag'], bodies, manifest['built'])
+    except (OSError, KeyError):
+        return None
+    return pages
+
+
+# --- প্রসেসের পেজগুলো ---
+
+_pages = {}
+_fingerprint = None
+_attempted = None  # শেষ যে fingerprint এর build চেষ্টা হয়েছে (ব্যর্থ হলে প্রতি রিকোয়েস্টে আবার নয়)
+_checked_at = None
+_check_lock = threading.Lock()
+_rebuilding = False
+
+
+def _install(manifest):
+    global _pages, _fingerprint
+    pages = load_pages(manifest)
+    if pages is None:
+        return False
+    _pages, _fingerprint = pages, manifest['fingerprint']
+    return True
+
+
+def _rebuild(fingerprint):
+    global _rebuilding
+    try:
+        _install(build())
+    except Exception:
+        logger.exception('Could not pre-render pages (fingerprint %s)', fingerprint)
+    finally:
+        _rebuilding = False
+
+
+def schedule_rebuild(fingerprint):
+    """
+    নতুন build — `PRERENDER_BACKGROUND_REBUILD` (ডিফল্ট True) হলে ব্যাকগ্রাউন্ড thread এ;
+    ততক্ষণ রিকোয়েস্টগুলো সাধারণ ভিউতে যায়। একসাথে একটিই build চলে।
+    """
+    global _rebuilding, _attempted
+    with _check_lock:
+        if _rebuilding or _attempted == fingerprint:
+            return
+        _rebuilding, _attempted = True, fingerprint
+    if getattr(settings, 'PRERENDER_BACKGROUND_REBUILD', True):
+        threading.Thread(target=_rebuild, args=(fingerprint,), daemon=True).start()
+    else:
+        _rebuild(fingerprint)
+
+
+def check():
+    """
+    dirty-check: fingerprint বদলালে পেজগুলো সরিয়ে দেয় এবং নতুন build শুরু করে। অন্য
+    প্রসেস (বা `prerender_pages` কমান্ড) আগেই build করে থাকলে শুধু সেই manifest পড়ে।
+    """
+    global _pages, _fingerprint
+    fingerprint = source_fingerprint()
+    if fingerprint == _fingerprint:
+        return
+    manifest = load_manifest()
+    if manifest and manifest.get('fingerprint') == fingerprint and _install(manifest):
+        return
+    _pages, _fingerprint = {}, None
+    schedule_rebuild(fingerprint)
+
+
+def get_page(path):
+    """
+    `path` এর আগে থেকে রেন্ডার করা `Page`, অথবা `None` (পেজ নয় বা হালনাগাদ নয়)।
+    `PRERENDER_CHECK_INTERVAL` (ডিফল্ট ২ সেকেন্ড; `None` = শুধু প্রথমবার) পরপর dirty-check।
+    """
+    global _checked_at
+    interval = getattr(settings, 'PRERENDER_CHECK_INTERVAL', 2)
+    now = time.monotonic()
+    if _checked_at is None or (interval is not None and now - _checked_at >= interval):
+        _checked_at = now
+        check()
+    return _pages.get(path)
+
+
+def reset():
+    """প্রসেসের পেজগুলো ফেলে দেয় (পরের রিকোয়েস্টে আবার check হয়)।"""
+    global _pages, _fingerprint, _attempted, _checked_at
+    _pages, _fingerprint, _attempted, _checked_at = {}, None, None, None
@@ -0,0 +1,145 @@
+# pages/search.py
+"""
+সদস্য ডিরেক্টরির জন্য প্লাগেবল সার্চ ব্যাকএন্ড।
+
+`settings.MEMBER_SEARCH_BACKEND` এ ব্যাকএন্ড ক্লাসের dotted path দেওয়া যায়।
+কিছু দেওয়া না থাকলে SQLite এ FTS5 ইনডেক্স, অন্য ডাটাবেসে পুরনো icontains
+ভিত্তিক সার্চ ব্যবহার হবে।
+"""
+from functools import reduce
+import operator
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from .models import Member, MemberSearchEntry
+
+# যে ফিল্ডগুলো ইনডেক্স/সার্চ করা হয় (FTS টেবিলের কলামের ক্রম একই)।
+SEARCH_FIELDS = ('name', 'role', 'area', 'bio')
+
+
+class BaseSearchBackend:
+    """
+    সব সার্চ ব্যাকএন্ডের বেস ক্লাস।
+    `search()` একটি ফিল্টার করা (এবং সম্ভব হলে rank অনুযায়ী সাজানো) queryset ফেরত দেয়।
+    """
+
+    # True হলে `search()` এর ফলাফল relevance অনুযায়ী সাজানো থাকে।
+    ranked = False
+
+    def search(self, queryset, query):
+        raise NotImplementedError
+
+    def index(self, member):
+        """একজন সদস্যকে ইনডেক্সে যোগ/আপডেট করে।"""
+
+    def index_many(self, members):
+        """একাধিক সদস্যকে একসাথে ইনডেক্স করে (bulk create/update এর জন্য)।"""
+        for member in members:
+            self.index(member)
+
+    def remove(self, pk):
+        """একজন সদস্যকে ইনডেক্স থেকে মুছে দেয়।"""
+
+    def rebuild(self):
+        """পুরো ইনডেক্স নতুন করে তৈরি করে। ইনডেক্স করা সদস্যের সংখ্যা ফেরত দেয়।"""
+        return 0
+
+
+class IContainsSearchBackend(BaseSearchBackend):
+    """
+    আগের আচরণ: প্রতিটি শব্দের জন্য সব ফিল্ডে `icontains` এর OR।
+    কোনো ইনডেক্স লাগে না, তাই যেকোনো ডাটাবেসে চলে (কিন্তু full table scan)।
+    """
+
+    def search(self, queryset, query):
+        for term in query.split():
+            queryset = queryset.filter(
+                reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in SEARCH_FIELDS))
+            )
+        return queryset
+
+
+class SQLiteFTSSearchBackend(BaseSearchBackend):
+    """
+    SQLite FTS5 shadow table (`pages_member_fts`) ভিত্তিক সার্চ।
+    প্রতিটি শব্দ prefix হিসেবে মেলানো হয় এবং ফলাফল bm25 rank অনুযায়ী সাজানো থাকে।
+    ইনডেক্স `pages.signals` এর মাধ্যমে save/delete এ সিঙ্ক থাকে।
+    """
+
+    ranked = True
+    table = MemberSearchEntry._meta.db_table
+
+    @staticmethod
+    def build_match_expression(query):
+        """
+        ইউজারের ইনপুটকে নিরাপদ FTS5 MATCH এক্সপ্রেশনে রূপান্তর করে।
+        প্রতিটি শব্দ quote করা হয় (যাতে FTS অপারেটর হিসেবে না ধরে) এবং prefix (*) হিসেবে মেলানো হয়।
+        """
+        terms = [term.replace('"', '""') for term in query.split()]
+        return ' '.join(f'"{term}"*' for term in terms if term)
+
+    def search(self, queryset, query):
+        expression = self.build_match_expression(query)
+        if not expression:
+            return queryset
+        return queryset.filter(search_entry__document__match=expression).order_by('search_entry__rank')
+
+    def index(self, member):
+        self.index_many([member])
+
+    def index_many(self, members):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT OR REPLACE INTO {self.table} (rowid, name, role, area, bio) VALUES (%s, %s, %s, %s, %s)',
+                [[member.pk, member.name, member.role, member.area, member.bio] for member in members],
+            )
+
+    def remove(self, pk):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table} WHERE rowid = %s', [pk])
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {self.table}')
+            cursor.execute(
+                f'INSERT INTO {self.table} (rowid, name, role, area, bio) '
+                f'SELECT id, name, role, area, bio FROM {Member._meta.db_table}'
+            )
+            return cursor.rowcount
+
+
+_backend = None
+
+
+def get_search_backend():
+    """কনফিগার করা সার্চ ব্যাকএন্ডের (cached) instance ফেরত দেয়।"""
+    global _backend
+    if _backend is None:
+        path = getattr(settings, 'MEMBER_SEARCH_BACKEND', None)
+        if path:
+            backend_class = import_string(path)
+        elif connection.vendor == 'sqlite':
+            backend_class = SQLiteFTSSearchBackend
+        else:
+            backend_class = IContainsSearchBackend
+        _backend = backend_class()
+    return _backend
+
+
+def reset_search_backend(*, setting, **kwargs):
+    """টেস্টে `override_settings` দিয়ে ব্যাকএন্ড বদলালে cached instance বাদ দেয়।"""
+    global _backend
+    if setting == 'MEMBER_SEARCH_BACKEND':
+        _backend = None
+
+
+setting_changed.connect(reset_search_backend)
+
+
+def search_members(queryset, query):
+    """কনফিগার করা ব্যাকএন্ড দিয়ে `queryset` এ সার্চ চালায়।"""
+    return get_search_backend().search(queryset, query)
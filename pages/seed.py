@@ -0,0 +1,110 @@
+# pages/seed.py
+"""
+বেঞ্চমার্ক এবং লোড টেস্টের জন্য কৃত্রিম (কিন্তু বাস্তবসম্মত) সদস্য ডেটা তৈরি।
+বাংলা ও ইংরেজি মেশানো নাম, এলাকা এবং বায়ো থাকে, যাতে সার্চ ইনডেক্স (unicode tokenizer)
+আসল ডেটার মতো আচরণ করে। `python manage.py seed_members` থেকে ব্যবহার হয়।
+"""
+from itertools import islice
+import random
+
+from django.db import connection, transaction
+
+from .areas import assign_areas
+from .cache import bump_generation
+from .models import Area, Member, MemberStat
+from .search import get_search_backend
+from .stats import add_members
+
+FIRST_NAMES_BN = [
+    'মোঃ রহিম', 'আব্দুল করিম', 'মোঃ জসিম', 'নুরুল ইসলাম', 'আনোয়ার', 'কামরুল', 'সাইফুল', 'মাহবুব',
+    'ফাতেমা', 'নুসরাত', 'সালমা', 'রোকসানা', 'শাহনাজ', 'তাসলিমা', 'মরিয়ম', 'সুমাইয়া',
+]
+LAST_NAMES_BN = ['উদ্দিন', 'হোসেন', 'আক্তার', 'ইসলাম', 'রহমান', 'চৌধুরী', 'খাতুন', 'বেগম', 'মিয়া', 'সরকার']
+FIRST_NAMES_EN = ['Rahim', 'Karim', 'Jasim', 'Anwar', 'Fatema', 'Nusrat', 'Salma', 'Tanvir', 'Rafiq', 'Shirin']
+LAST_NAMES_EN = ['Uddin', 'Hossain', 'Akter', 'Islam', 'Rahman', 'Chowdhury', 'Khatun', 'Miah', 'Sarker']
+
+AREAS = [
+    'মিরপুর', 'উত্তরা', 'ধানমন্ডি', 'মোহাম্মদপুর', 'বাড্ডা', 'যাত্রাবাড়ী', 'সাভার', 'গাজীপুর',
+    'Mirpur-10', 'Uttara Sector 7', 'Gulshan', 'Banani', 'Mohakhali', 'Old Dhaka', 'Narayanganj',
+]
+
+BIO_PARTS = [
+    'সমিতির একজন নিয়মিত সদস্য।', 'ক্ষুদ্র ব্যবসায়ী, স্থানীয় বাজারে দোকান আছে।',
+    'সঞ্চয় ও ঋণ কার্যক্রমে সক্রিয়ভাবে অংশগ্রহণ করেন।', 'শিক্ষকতা পেশায় নিয়োজিত।',
+    'কৃষি ও মৎস্য চাষের সাথে জড়িত।', 'Runs a small tailoring business.',
+    'Active in the monthly savings scheme.', 'Volunteers for community events.',
+    'Retired government employee.', 'ছাত্র-ছাত্রীদের বৃত্তি কমিটির সাথে কাজ করেন।',
+]
+
+# পদবির বণ্টন — বাস্তবের মতো বেশিরভাগই সাধারণ সদস্য
+ROLE_WEIGHTS = [
+    ('President', 1),
+    ('Secretary', 3),
+    ('Treasurer', 3),
+    ('Committee', 60),
+    ('Member', 933),
+]
+
+# সাইজ প্রিসেট (`--size`)
+SIZES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+
+DEFAULT_BATCH_SIZE = 5000
+
+
+def generate_members(count, seed=0):
+    """`count` টি সেভ না করা `Member` instance (generator) — একই `seed` এ একই ডেটা।"""
+    rng = random.Random(seed)
+    roles = [role for role, _ in ROLE_WEIGHTS]
+    weights = [weight for _, weight in ROLE_WEIGHTS]
+    for index in range(count):
+        if rng.random() < 0.7:
+            name = f'{rng.choice(FIRST_NAMES_BN)} {rng.choice(LAST_NAMES_BN)}'
+            email = None
+        else:
+            first, last = rng.choice(FIRST_NAMES_EN), rng.choice(LAST_NAMES_EN)
+            name = f'{first} {last}'
+            email = f'{first.lower()}.{last.lower()}{index}@example.com'
+        yield Member(
+            name=name,
+            role=rng.choices(roles, weights)[0],
+            area=rng.choice(AREAS),
+            phone=f'+8801{rng.randrange(300000000, 999999999)}',
+            email=email,
+            bio=' '.join(rng.sample(BIO_PARTS, rng.randint(1, 3))),
+            is_active=rng.random() < 0.95,
+        )
+
+
+def clear_members():
+    """সব সদস্য মুছে দেয় (একটি DELETE, সিগন্যাল ছাড়া) — শুধু বেঞ্চমার্ক ডাটাবেসের জন্য।"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {Member._meta.db_table}')
+        deleted = cursor.rowcount
+    get_search_backend().rebuild()
+    MemberStat.objects.all().delete()
+    Area.objects.filter(aliases=None).delete()
+    bump_generation()
+    return deleted
+
+
+def seed_members(count, seed=0, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+    """
+    `count` জন সদস্য batch আকারে `bulk_create` করে, তারপর সার্চ ইনডেক্স একবারে নতুন করে
+    তৈরি করে এবং cache অকেজো করে। তৈরি হওয়া সদস্যের সংখ্যা ফেরত দেয়।
+    `progress(created)` প্রতি batch এর পরে কল হয়।
+    """
+    members = generate_members(count, seed)
+    created = 0
+    while True:
+        batch = list(islice(members, batch_size))
+        if not batch:
+            break
+        with transaction.atomic():
+            Member.objects.bulk_create(Member.assign_role_ranks(assign_areas(batch)), batch_size=batch_size)
+            add_members(batch)
+        created += len(batch)
+        if progress:
+            progress(created)
+    get_search_backend().rebuild()
+    bump_generation()
+    return created
@@ -1,8 +1,29 @@
 # pages/serializers.py
+from django.core.files.storage import FileSystemStorage
+from django.utils.encoding import filepath_to_uri
 from rest_framework import serializers
-from .models import Member
+from .metrics import track
+from .models import DEFAULT_AVATAR_URL, Member
 
-class MemberSerializer(serializers.ModelSerializer):
+
+def build_avatar_srcset(obj, request):
+    """
+    সদস্যের ছবির derivative গুলো থেকে `srcset` স্ট্রিং তৈরি করে (সম্পূর্ণ URL সহ)।
+    derivative না থাকলে খালি স্ট্রিং।
+    """
+    variants = obj.get_avatar_variants()
+    if request:
+        variants = [(width, request.build_absolute_uri(url)) for width, url in variants]
+    return ', '.join(f'{url} {width}w' for width, url in variants)
+
+class TimedRepresentationMixin:
+    """সিরিয়ালাইজ করার সময় রিকোয়েস্টের মেট্রিকে (`pages.metrics`) যোগ করে।"""
+
+    def to_representation(self, instance):
+        with track('serializer'):
+            return super().to_representation(instance)
+
+class MemberSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     """
     `Member` মডেলের জন্য একটি সম্পূর্ণ সিরিয়ালাইজার। 
     API-এর মাধ্যমে সদস্য তৈরি (Create) এবং আপডেট (Update) করার জন্য এটি ব্যবহৃত হয়।
@@ -10,17 +31,18 @@ class MemberSerializer(serializers.ModelSerializer):
     """
     # `get_avatar_url` মডেলের মেথড থেকে পাওয়া URL এখানে যুক্ত করা হয়েছে।
     avatar_url = serializers.SerializerMethodField()
+    avatar_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Member
         # API-তে কোন কোন ফিল্ড দেখানো হবে তা এখানে নির্দিষ্ট করা হয়েছে।
         fields = [
             'id', 'name', 'role', 'area', 'phone', 
-            'email', 'bio', 'avatar_url', 'joined_date', 
+            'email', 'bio', 'avatar_url', 'avatar_srcset', 'image_status', 'joined_date', 
             'is_active', 'created_at', 'updated_at'
         ]
         # এই ফিল্ডগুলো শুধুমাত্র পড়া যাবে, এডিট করা যাবে না।
-        read_only_fields = ['id', 'created_at', 'updated_at', 'joined_date']
+        read_only_fields = ['id', 'image_status', 'created_at', 'updated_at', 'joined_date']
     
     def get_avatar_url(self, obj):
         """
@@ -36,18 +58,23 @@ class MemberSerializer(serializers.ModelSerializer):
         # না হলে avatar  ফেরত দেওয়া হয়।
         return avatar
 
-class MemberListSerializer(serializers.ModelSerializer):
+    def get_avatar_srcset(self, obj):
+        """ছবির responsive derivative গুলোর `srcset` (সম্পূর্ণ URL সহ)।"""
+        return build_avatar_srcset(obj, self.context.get('request'))
+
+class MemberListSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     """
     সদস্যদের তালিকা দেখানোর জন্য একটি সংক্ষিপ্ত সিরিয়ালাইজার।
     API-এর `list` ভিউতে এটি ব্যবহার করা হয়, যাতে শুধুমাত্র প্রয়োজনীয় তথ্য (যেমন নাম, পদবি) লোড হয়।
     এর ফলে API রেসপন্স দ্রুত হয়।
     """
     avatar_url = serializers.SerializerMethodField()
+    avatar_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Member
         # শুধুমাত্র তালিকা দেখানোর জন্য প্রয়োজনীয় ফিল্ডগুলো এখানে রাখা হয়েছে।
-        fields = ['id', 'name', 'role', 'area', 'avatar_url']
+        fields = ['id', 'name', 'role', 'area', 'avatar_url', 'avatar_srcset']
     
     def get_avatar_url(self, obj):
         """
@@ -59,17 +86,26 @@ class MemberListSerializer(serializers.ModelSerializer):
             return request.build_absolute_uri(avatar)
         return avatar
 
-class MemberDetailSerializer(serializers.ModelSerializer):
+    def get_avatar_srcset(self, obj):
+        """ছবির responsive derivative গুলোর `srcset` (সম্পূর্ণ URL সহ)।"""
+        return build_avatar_srcset(obj, self.context.get('request'))
+
+class MemberDetailSerializer(TimedRepresentationMixin, serializers.ModelSerializer):
     """
     একজন নির্দিষ্ট সদস্যের বিস্তারিত তথ্য দেখানোর জন্য এই সিরিয়ালাইজারটি ব্যবহৃত হয়।
     API-এর `retrieve` (detail) ভিউতে এটি ব্যবহার করা হয়।
-    `__all__` ব্যবহারের মাধ্যমে মডেলের সমস্ত ফিল্ড অন্তর্ভুক্ত করা হয়েছে।
+    ফিল্ডগুলো নির্দিষ্ট করে দেওয়া — ভেতরের কলামগুলো (`image_status`, `image_hash`,
+    `image_derivatives`, `role_rank`, `area_ref`) পাবলিক API তে আসে না।
     """
     avatar_url = serializers.SerializerMethodField()
+    avatar_srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Member
-        fields = '__all__' # মডেলের সব ফিল্ড অন্তর্ভুক্ত করা হয়েছে।
+        fields = [
+            'id', 'name', 'role', 'area', 'phone', 'email', 'bio', 'image',
+            'joined_date', 'is_active', 'created_at', 'updated_at', 'avatar_url', 'avatar_srcset',
+        ]
     
     def get_avatar_url(self, obj):
         """
@@ -80,3 +116,66 @@ class MemberDetailSerializer(serializers.ModelSerializer):
         if avatar and request and not avatar.startswith('http'):
             return request.build_absolute_uri(avatar)
         return avatar
+
+    def get_avatar_srcset(self, obj):
+        """ছবির responsive derivative গুলোর `srcset` (সম্পূর্ণ URL সহ)।"""
+        return build_avatar_srcset(obj, self.context.get('request'))
+
+
+class MemberListRowSerializer:
+    """
+    `MemberListSerializer` এর হুবহু একই আউটপুট, কিন্তু `values()` সারি (dict) থেকে তৈরি —
+    প্রতি সদস্যের জন্য মডেল instance, `FieldFile` বা `build_absolute_uri` তৈরি হয় না।
+    media এর সম্পূর্ণ base URL রিকোয়েস্ট প্রতি একবারই বানানো হয়।
+    API এর `list` এর মতো hot path এ ব্যবহারের জন্য।
+    """
+    # queryset.values(*value_fields) দিয়ে সারিগুলো আনতে হবে
+    value_fields = ('id', 'name', 'role', 'role_rank', 'area', 'image', 'image_status', 'image_derivatives')
+
+    def __init__(self, request=None):
+        self.request = request
+        self.storage = Member._meta.get_field('image').storage
+        self.media_base = None
+        if isinstance(self.storage, FileSystemStorage):
+            # FileSystemStorage.url() = base_url + quoted name; তাই base একবার absolute করে
+            # প্রতিটি সারিতে শুধু নাম জোড়া লাগানো হয়।
+            base_url = self.storage.base_url
+            if request and not base_url.startswith('http'):
+                base_url = request.build_absolute_uri(base_url)
+            self.media_base = base_url
+
+    def file_url(self, name):
+        """storage এর একটি ফাইলের URL (request থাকলে সম্পূর্ণ URL)।"""
+        if self.media_base is not None:
+            return self.media_base + filepath_to_uri(name).lstrip('/')
+        url = self.storage.url(name)
+        if self.request and not url.startswith('http'):
+            url = self.request.build_absolute_uri(url)
+        return url
+
+    def get_avatar_srcset(self, row):
+        """`Member.get_avatar_variants` এর মতোই — পুরনো manifest হলে খালি স্ট্রিং।"""
+        image = row['image']
+        if not image or row['image_status'] != Member.IMAGE_READY:
+            return ''
+        manifest = row['image_derivatives'] or {}
+        if manifest.get('source') != image:
+            return ''
+        variants = sorted((int(width), name) for width, name in manifest.get('sizes', {}).items())
+        return ', '.join(f'{self.file_url(name)} {width}w' for width, name in variants)
+
+    def to_representation(self, row):
+        image = row['image']
+        return {
+            'id': row['id'],
+            'name': row['name'],
+            'role': row['role'],
+            'area': row['area'],
+            'avatar_url': self.file_url(image) if image else DEFAULT_AVATAR_URL,
+            'avatar_srcset': self.get_avatar_srcset(row),
+        }
+
+    def serialize(self, rows):
+        rows = list(rows)  # কোয়েরির সময় সিরিয়ালাইজারের সময়ে ধরা হয় না
+        with track('serializer'):
+            return [self.to_representation(row) for row in rows]
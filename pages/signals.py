@@ -0,0 +1,110 @@
+# pages/signals.py
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import metrics, suggest
+from .cache import bump_generation
+from .db import apply_pragmas
+from .models import AreaAlias, Member
+from .search import SEARCH_FIELDS, get_search_backend
+from .stats import STAT_FIELDS, apply_deltas, change_deltas, stat_key
+
+
+# --- সার্চ ইনডেক্স সিঙ্ক ---
+# সদস্য save/delete হলে সার্চ ইনডেক্সও আপডেট করা হয়।
+
+@receiver(post_save, sender=Member, dispatch_uid='member_search_index_save')
+def update_member_search_index(sender, instance, update_fields=None, **kwargs):
+    """সদস্য save হলে তার সার্চ ইনডেক্স এন্ট্রি আপডেট করে।"""
+    if update_fields is not None and not set(update_fields) & set(SEARCH_FIELDS):
+        # ইনডেক্স করা কোনো ফিল্ড বদলায়নি (যেমন শুধু is_active টগল)
+        return
+    get_search_backend().index(instance)
+
+
+@receiver(post_delete, sender=Member, dispatch_uid='member_search_index_delete')
+def remove_member_search_index(sender, instance, **kwargs):
+    """সদস্য ডিলেট হলে তার সার্চ ইনডেক্স এন্ট্রি মুছে দেয়।"""
+    get_search_backend().remove(instance.pk)
+
+
+# --- cache invalidation ---
+# যেকোনো সদস্য বদলালে versioned cache এর generation বাড়ানো হয় (`pages.cache`)।
+
+@receiver(post_save, sender=Member, dispatch_uid='member_cache_save')
+@receiver(post_delete, sender=Member, dispatch_uid='member_cache_delete')
+@receiver(post_save, sender=AreaAlias, dispatch_uid='area_alias_cache_save')
+@receiver(post_delete, sender=AreaAlias, dispatch_uid='area_alias_cache_delete')
+def invalidate_member_cache(sender, **kwargs):
+    """সদস্য (বা এলাকার alias — `?area=` এর ফলাফল বদলায়) save/delete হলে cached ডিরেক্টরি ডেটা অকেজো করে।"""
+    bump_generation()
+
+
+# --- typeahead ইনডেক্স (`pages.suggest`) ---
+# cache invalidation এর পরে চলে (রিসিভারের ক্রম), যাতে ইনডেক্স নতুন generation এর সাথে মেলে।
+
+@receiver(post_save, sender=Member, dispatch_uid='member_suggest_save')
+def update_member_suggestions(sender, instance, **kwargs):
+    suggest.member_changed(instance)
+
+
+@receiver(post_delete, sender=Member, dispatch_uid='member_suggest_delete')
+def remove_member_suggestions(sender, instance, **kwargs):
+    suggest.member_changed(instance, deleted=True)
+
+
+# --- সদস্য পরিসংখ্যান (`pages.stats`) ---
+# save এর আগে সদস্যের আগের (role, area, is_active) মনে রাখা হয়, পরে পার্থক্যটুকু সারাংশে যোগ হয়।
+
+def _stored_stat_key(instance):
+    """ডাটাবেসে থাকা অবস্থার key — লোড করা মান থেকে, না থাকলে একটি কোয়েরি দিয়ে।"""
+    loaded = getattr(instance, '_loaded_values', None)
+    if loaded and all(field in loaded for field in STAT_FIELDS):
+        return stat_key(loaded)
+    row = Member.objects.filter(pk=instance.pk).values(*STAT_FIELDS).first()
+    return stat_key(row) if row else None
+
+
+@receiver(pre_save, sender=Member, dispatch_uid='member_stats_pre_save')
+def remember_member_stat_key(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(STAT_FIELDS):
+        instance._stat_key_before = stat_key(instance)  # key বদলাচ্ছে না
+    elif instance._state.adding:
+        instance._stat_key_before = None
+    else:
+        instance._stat_key_before = _stored_stat_key(instance)
+
+
+@receiver(post_save, sender=Member, dispatch_uid='member_stats_save')
+def update_member_stats(sender, instance, created, **kwargs):
+    """সদস্য তৈরি হলে বা role/area/is_active বদলালে সারাংশ টেবিল আপডেট করে।"""
+    before = None if created else getattr(instance, '_stat_key_before', None)
+    apply_deltas(change_deltas([(before, stat_key(instance))]))
+
+
+@receiver(post_delete, sender=Member, dispatch_uid='member_stats_delete')
+def remove_member_stats(sender, instance, **kwargs):
+    loaded = getattr(instance, '_loaded_values', None)
+    key = stat_key(loaded) if loaded and all(field in loaded for field in STAT_FIELDS) else stat_key(instance)
+    apply_deltas({key: -1})
+
+
+# --- SQLite connection টিউনিং ---
+# alias এর `PRAGMAS` (প্রোডাকশন প্রোফাইল, `config/settings.py`) নতুন connection এ বসানো হয়।
+# persistent connection (CONN_MAX_AGE) হলে এটি প্রতি connection এ একবারই চলে।
+
+@receiver(connection_created, dispatch_uid='sqlite_connection_pragmas')
+def configure_sqlite_connection(sender, connection, **kwargs):
+    pragmas = connection.settings_dict.get('PRAGMAS')
+    if connection.vendor == 'sqlite' and pragmas:
+        apply_pragmas(connection.connection, pragmas)
+
+
+# --- রিকোয়েস্ট মেট্রিক ---
+# প্রতিটি নতুন connection এ মেট্রিকের execute wrapper বসানো হয় (sync ও async দুই ভিউয়ের জন্যই)।
+
+@receiver(connection_created, dispatch_uid='metrics_execute_wrapper')
+def install_metrics_execute_wrapper(sender, connection, **kwargs):
+    """রিকোয়েস্ট মেট্রিকের SQL গণনা (`pages.metrics.execute_wrapper`)।"""
+    metrics.install_execute_wrapper(connection)
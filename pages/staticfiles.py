@@ -0,0 +1,150 @@
+# pages/staticfiles.py
+"""
+`collectstatic` এর সময় static ফাইলের অপটিমাইজেশন (`OptimizedStaticFilesStorage`)।
+
+WhiteNoise এর `CompressedManifestStaticFilesStorage` এর উপরে:
+- ছবি: PNG/GIF lossless ভাবে ছোট করা (`optimize=True`, ছোট হলে তবেই বদলায়); JPEG/PNG এর
+  পাশে `.webp` এবং সবগুলোর `.avif` বিকল্প (আগে থেকে থাকলে আবার তৈরি হয় না)।
+  কাজগুলো CPU-bound, তাই ফাইল ধরে `ProcessPoolExecutor` এ। এগুলো hash করার আগে
+  STATIC_ROOT এর কপিতে হয়, আর `paths` এ ছবিগুলোর উৎস STATIC_ROOT করে দেওয়া হয় (Django
+  hash করা ফাইল উৎস storage থেকে পড়ে), তাই hash করা ফাইল ও নাম অপটিমাইজ করা কনটেন্টের।
+- প্রতিটি ছবির আসল মাপ ও বিকল্পগুলো manifest (`staticfiles.json`) এর `images` এ —
+  `{% static_image %}` ট্যাগ (`pages.templatetags.static_images`) এখান থেকে
+  `<picture>` এবং `width`/`height` দেয়, ছবির ফাইল না খুলেই।
+- Brotli (`brotli` প্যাকেজ থাকলে) ও gzip ভ্যারিয়েন্ট WhiteNoise নিজেই তৈরি করে
+  (thread pool এ); মিডলওয়্যার ব্রাউজারের `Accept-Encoding` দেখে সেগুলো পাঠায়।
+"""
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import json
+import logging
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from .images import AVIF_QUALITY, WEBP_QUALITY
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')
+
+# বিকল্প ফরম্যাট: (extension, MIME type, PIL format, quality) — <picture> এ এই ক্রমে
+ALTERNATE_FORMATS = (
+    ('.avif', 'image/avif', 'AVIF', AVIF_QUALITY),
+    ('.webp', 'image/webp', 'WEBP', WEBP_QUALITY),
+)
+
+
+def optimize_image(path, skip=()):
+    """
+    একটি ছবি (worker প্রসেসে): lossless অপটিমাইজেশন, বিকল্প ফরম্যাট তৈরি।
+    `skip` = যে বিকল্প ফাইলগুলো আগে থেকেই আছে বা অন্য worker তৈরি করছে।
+    ফেরত দেয় `{'size': [w, h], 'saved': bytes, 'alternates': {mime: path}}`।
+    """
+    stem, extension = os.path.splitext(path)
+    extension = extension.lower()
+    saved = 0
+    alternates = {}
+    with Image.open(path) as img:
+        size = list(ImageOps.exif_transpose(img).size) if extension in ('.jpg', '.jpeg') else list(img.size)
+        if extension in ('.png', '.gif') and not getattr(img, 'is_animated', False):
+            buffer = BytesIO()
+            img.save(buffer, format=img.format, optimize=True)
+            original_size = os.path.getsize(path)
+            if buffer.tell() < original_size:
+                with open(path, 'wb') as output:
+                    output.write(buffer.getvalue())
+                saved = original_size - buffer.tell()
+        if getattr(img, 'is_animated', False):
+            return {'size': size, 'saved': saved, 'alternates': alternates}
+        for alt_extension, mime, format, quality in ALTERNATE_FORMATS:
+            if alt_extension == extension:
+                continue
+            alt_path = stem + alt_extension
+            current = os.path.exists(alt_path) and os.path.getmtime(alt_path) >= os.path.getmtime(path)
+            if alt_path not in skip and not current:  # আগের collectstatic এর ফাইল হালনাগাদ থাকলে আবার নয়
+                image = ImageOps.exif_transpose(img)
+                if image.mode not in ('RGB', 'RGBA'):
+                    image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+                image.save(alt_path, format=format, quality=quality)
+            alternates[mime] = alt_path
+    return {'size': size, 'saved': saved, 'alternates': alternates}
+
+
+class OptimizedStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    `CompressedManifestStaticFilesStorage` + ছবি অপটিমাইজেশন, বিকল্প ফরম্যাট এবং manifest এ
+    ছবির মাপ। `image_info(name)` টেমপ্লেট ট্যাগের জন্য।
+    `STATIC_IMAGE_WORKERS` setting: worker প্রসেসের সংখ্যা (ডিফল্ট CPU core)।
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.image_sizes = {}
+        super().__init__(*args, **kwargs)
+
+    def load_manifest(self):
+        content = self.read_manifest()
+        if content is not None:
+            try:
+                self.image_sizes = json.loads(content).get('images', {})
+            except (ValueError, AttributeError):
+                pass
+        return super().load_manifest()
+
+    def save_manifest(self):
+        super().save_manifest()
+        payload = json.loads(self.read_manifest())
+        payload['images'] = self.image_sizes
+        self.manifest_storage.delete(self.manifest_name)
+        self.manifest_storage._save(self.manifest_name, ContentFile(json.dumps(payload).encode()))
+
+    def image_info(self, name):
+        """`{'size': [w, h], 'alternates': {mime: name}}` অথবা `None`।"""
+        return self.image_sizes.get(name)
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            self.optimize_images(paths)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+    def optimize_images(self, paths):
+        """
+        সংগ্রহ করা ছবিগুলো (STATIC_ROOT এ) সমান্তরালে অপটিমাইজ করে; ছবিগুলোর উৎস `paths` এ
+        STATIC_ROOT এ বদলায় এবং নতুন বিকল্পগুলো যোগ হয়।
+        """
+        names = sorted(name for name in paths if name.lower().endswith(IMAGE_EXTENSIONS))
+        # প্রতিটি বিকল্প ফাইল একটি worker ই লেখে (যেমন `a.jpg` ও `a.webp` দুটোরই `a.avif`)
+        claimed = {self.path(name) for name in names}
+        jobs = {}
+        for name in names:
+            path = self.path(name)
+            targets = [os.path.splitext(path)[0] + extension for extension, *_ in ALTERNATE_FORMATS]
+            jobs[name] = (path, tuple(target for target in targets if target in claimed))
+            claimed.update(targets)
+
+        workers = getattr(settings, 'STATIC_IMAGE_WORKERS', None) or os.cpu_count() or 1
+        saved = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {name: executor.submit(optimize_image, *job) for name, job in jobs.items()}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except (OSError, ValueError, SyntaxError) as exc:
+                    logger.warning('Could not optimise %s: %s', name, exc)
+        for name, result in results.items():
+            saved += result['saved']
+            # `HashedFilesMixin` hash করা কপি `paths[name]` এর storage থেকে পড়ে — উৎস ফোল্ডার
+            # (STATICFILES_DIRS) নয়, অপটিমাইজ করা STATIC_ROOT এর ফাইল থেকে
+            paths[name] = (self, name)
+            alternates = {}
+            for mime, alt_path in result['alternates'].items():
+                if os.path.exists(alt_path):
+                    alt_name = os.path.relpath(alt_path, self.location).replace(os.sep, '/')
+                    paths.setdefault(alt_name, (self, alt_name))
+                    alternates[mime] = alt_name
+            self.image_sizes[name] = {'size': result['size'], 'alternates': alternates}
+        logger.info('Optimised %d static images (%d bytes saved).', len(names), saved)
@@ -0,0 +1,193 @@
+# pages/stats.py
+"""
+সদস্য পরিসংখ্যান — (role, area, is_active) অনুযায়ী সদস্য সংখ্যা, `MemberStat` সারাংশ টেবিলে।
+
+টেবিলটি incremental ভাবে বদলায়:
+- `Member.save()` / delete: `pages.signals` এর রিসিভার (আগের ও নতুন key এর পার্থক্য)
+- `queryset.update()` (অ্যাডমিন অ্যাকশন): `update_members()`
+- bulk create/update (`pages.bulk`): `add_members()` / `apply_deltas()`
+
+পড়া হয় `get_stats()` দিয়ে — কয়েক ডজন সারির ছোট টেবিলে একটি কোয়েরি, ফলাফল versioned
+cache এ (`pages.cache`)। কোনো কারণে গরমিল হলে (raw SQL, ক্র্যাশ) `rebuild_member_stats`
+কমান্ড সদস্য টেবিল থেকে মিলিয়ে নেয়।
+"""
+from collections import Counter
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+from .cache import aget_or_build, bump_generation, get_or_build
+from .models import Member, MemberStat
+
+# সারাংশের key এর ফিল্ডগুলো (ক্রম অনুযায়ী)
+STAT_FIELDS = ('role', 'area', 'is_active')
+
+
+def stat_key(values):
+    """dict বা instance থেকে `(role, area, is_active)`।"""
+    if isinstance(values, dict):
+        role, area, is_active = (values[field] for field in STAT_FIELDS)
+    else:
+        role, area, is_active = (getattr(values, field) for field in STAT_FIELDS)
+    return role, area, bool(is_active)
+
+
+def apply_deltas(deltas):
+    """`{(role, area, is_active): পরিবর্তন}` সারাংশ টেবিলে যোগ করে (`count = count + n`)।"""
+    for key, delta in deltas.items():
+        if not delta:
+            continue
+        lookup = dict(zip(STAT_FIELDS, key))
+        if MemberStat.objects.filter(**lookup).update(count=F('count') + delta):
+            continue
+        try:
+            with transaction.atomic():
+                MemberStat.objects.create(count=delta, **lookup)
+        except IntegrityError:
+            # অন্য একটি রিকোয়েস্ট একই সময়ে সারিটি তৈরি করেছে
+            MemberStat.objects.filter(**lookup).update(count=F('count') + delta)
+
+
+def add_members(members, sign=1):
+    """নতুন (`sign=-1` হলে মুছে ফেলা) সদস্যদের সারাংশে যোগ করে।"""
+    apply_deltas({key: sign * count for key, count in Counter(map(stat_key, members)).items()})
+
+
+def change_deltas(changes):
+    """`[(আগের key, নতুন key), ...]` থেকে deltas (`None` = সারি নেই)।"""
+    deltas = Counter()
+    for old, new in changes:
+        if old == new:
+            continue
+        if old is not None:
+            deltas[old] -= 1
+        if new is not None:
+            deltas[new] += 1
+    return deltas
+
+
+def update_members(queryset, **values):
+    """
+    `queryset.update(**values)`, কিন্তু role/area/is_active বদলালে সারাংশ টেবিলও একই
+    transaction এ আপডেট হয় (প্রতি key গ্রুপের জন্য একটি GROUP BY, সদস্য প্রতি কিছু নয়)।
+    `values` এ সরাসরি মান থাকতে হবে (F() expression নয়)। আপডেট হওয়া সারির সংখ্যা ফেরত দেয়।
+    `role` বদলালে `role_rank` ও একসাথে বসে।
+    """
+    if 'role' in values:
+        values['role_rank'] = Member.rank_for_role(values['role'])
+    if not set(values) & set(STAT_FIELDS):
+        return queryset.update(**values)
+    with transaction.atomic():
+        deltas = Counter()
+        for group in queryset.order_by().values(*STAT_FIELDS).annotate(members=Count('pk')):
+            old = stat_key(group)
+            new = stat_key({field: values.get(field, group[field]) for field in STAT_FIELDS})
+            if old != new:
+                deltas[old] -= group['members']
+                deltas[new] += group['members']
+        count = queryset.update(**values)
+        apply_deltas(deltas)
+    return count
+
+
+def count_members():
+    """সদস্য টেবিল থেকে সরাসরি `{key: সংখ্যা}` (full scan — শুধু rebuild এর জন্য)।"""
+    rows = Member.objects.order_by().values(*STAT_FIELDS).annotate(members=Count('pk'))
+    return {stat_key(row): row['members'] for row in rows}
+
+
+def rebuild(dry_run=False):
+    """
+    সদস্য টেবিল থেকে সারাংশ নতুন করে তৈরি করে।
+    গরমিলগুলো `{key: (সারাংশে ছিল, আসল সংখ্যা)}` হিসেবে ফেরত দেয়; `dry_run` হলে কিছু লেখে না।
+    """
+    with transaction.atomic():
+        actual = count_members()
+        stored = {stat_key(stat): stat.count for stat in MemberStat.objects.all()}
+        drift = {
+            key: (stored.get(key, 0), actual.get(key, 0))
+            for key in stored.keys() | actual.keys()
+            if stored.get(key, 0) != actual.get(key, 0)
+        }
+        if dry_run or not (drift or len(stored) != len(actual)):
+            return drift
+        MemberStat.objects.all().delete()
+        MemberStat.objects.bulk_create(
+            MemberStat(count=count, **dict(zip(STAT_FIELDS, key))) for key, count in actual.items()
+        )
+    bump_generation()
+    return drift
+
+
+# --- পড়া ---
+
+STAT_COLUMNS = STAT_FIELDS + ('count',)
+
+
+def _summarize(rows):
+    total = active = 0
+    roles = {value: {'active': 0, 'inactive': 0} for value, _ in Member.ROLE_CHOICES}
+    areas = {}
+    for role, area, is_active, count in rows:
+        status = 'active' if is_active else 'inactive'
+        roles.setdefault(role, {'active': 0, 'inactive': 0})[status] += count
+        areas.setdefault(area, {'active': 0, 'inactive': 0})[status] += count
+        total += count
+        if is_active:
+            active += count
+    return {
+        'total': total,
+        'active': active,
+        'inactive': total - active,
+        'roles': roles,
+        'areas': dict(sorted(areas.items())),
+    }
+
+
+def _stat_rows():
+    return MemberStat.objects.filter(count__gt=0).values_list(*STAT_COLUMNS)
+
+
+def get_stats():
+    """
+    `{'total', 'active', 'inactive', 'roles': {role: {'active', 'inactive'}}, 'areas': {...}}`।
+    সারাংশ টেবিল থেকে, cache সহ — সদস্য টেবিলে কোনো কোয়েরি নেই।
+    """
+    return get_or_build('stats', (), lambda: _summarize(_stat_rows()))
+
+
+async def aget_stats():
+    async def build():
+        return _summarize([row async for row in _stat_rows()])
+    return await aget_or_build('stats', (), build)
+
+
+def active_count(stats, role=None):
+    """`get_stats()` এর ফলাফল থেকে সক্রিয় সদস্যের সংখ্যা (`role` দিলে শুধু সেই পদবির)।"""
+    if not role:
+        return stats['active']
+    return stats['roles'].get(role, {}).get('active', 0)
+
+
+def filtered_count(role=None, area=None, is_active=None):
+    """
+    নির্দিষ্ট role/area/is_active এর সদস্য সংখ্যা, সারাংশ টেবিল থেকে (`None` = সব)।
+    কোনো ফিল্টার না থাকলে cache করা `get_stats()` এর মোট সংখ্যা।
+    """
+    lookup = {field: value for field, value in zip(STAT_FIELDS, (role, area, is_active)) if value is not None}
+    if not lookup:
+        return get_stats()['total']
+    return MemberStat.objects.filter(**lookup).aggregate(members=Coalesce(Sum('count'), 0))['members']
+
+
+def search_areas(prefix='', limit=20):
+    """
+    `prefix` দিয়ে শুরু হওয়া এলাকাগুলো (নাম অনুযায়ী), প্রতিটির সদস্য সংখ্যাসহ: `[(area, সংখ্যা), ...]`।
+    LIKE এর বদলে range (`area >= prefix AND area < prefix + U+10FFFF`), তাই `area` ইনডেক্স ব্যবহার হয়।
+    """
+    queryset = MemberStat.objects.filter(count__gt=0)
+    if prefix:
+        queryset = queryset.filter(area__gte=prefix, area__lt=prefix + '\U0010ffff')
+    rows = queryset.values('area').annotate(members=Sum('count')).order_by('area')[:limit]
+    return [(row['area'], row['members']) for row in rows]
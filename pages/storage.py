@@ -0,0 +1,117 @@
+# pages/storage.py
+"""
+সদস্যের ছবির content-addressed storage।
+
+ফাইলের নাম তার কনটেন্টের sha256 থেকে: `members/<hash[:2]>/<hash><ext>` — আপলোডের নাম বা
+পদ (role) থেকে নয়। তাই একই ছবি যতবারই আপলোড হোক ডিস্কে একবারই থাকে, নাম কখনো
+বদলায় না (`pages.media` এ immutable cache), আর আগের মতো `members/members/...` ধরনের নেস্টেড
+পাথ বা `razon_7BCO6y4.webp` ধরনের কপি তৈরি হয় না।
+
+একই নাম = একই কনটেন্ট, তাই একটি ফাইল একাধিক সদস্যের হতে পারে — ফাইল মোছার কাজ
+রেফারেন্স মিলিয়ে `gc_media` কমান্ড করে।
+"""
+import hashlib
+import os
+import posixpath
+import tempfile
+
+from django.core.files.storage import FileSystemStorage
+
+from .images import DERIVATIVE_DIR
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    `FileSystemStorage`, কিন্তু `save()` এর নাম কনটেন্টের hash থেকে। ফাইলটি একবার পড়ে একই
+    সাথে hash করা হয় এবং অস্থায়ী ফাইলে লেখা হয়; তারপর atomic rename — একই ছবি একসাথে
+    দুইবার আপলোড হলেও অর্ধেক লেখা ফাইল দেখা যায় না।
+
+    `preserved_prefixes` এর নিচের নাম (derivative — নাম আগে থেকেই উৎস ছবির hash থেকে)
+    যেমন আছে তেমনই থাকে।
+    """
+    prefix = 'members'
+    preserved_prefixes = (DERIVATIVE_DIR + '/',)
+
+    def content_name(self, digest, name):
+        extension = os.path.splitext(name)[1].lower()
+        return f'{self.prefix}/{digest[:2]}/{digest}{extension}'
+
+    def get_available_name(self, name, max_length=None):
+        # নাম `_save` এ কনটেন্ট থেকে ঠিক হয়; একই নাম মানে একই কনটেন্ট, তাই suffix লাগে না
+        return name
+
+    def _save(self, name, content):
+        name = name.replace('\\', '/')
+        directory = self.path(self.prefix)
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        try:
+            digest = hashlib.sha256()
+            with os.fdopen(descriptor, 'wb') as temp_file:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks(CHUNK_SIZE):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+            if not name.startswith(self.preserved_prefixes):
+                name = self.content_name(digest.hexdigest(), name)
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                # একই কনটেন্ট আগে থেকেই আছে
+                return name
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+            os.replace(temp_path, full_path)
+            temp_path = None
+            return name
+        finally:
+            if temp_path is not None:
+                os.unlink(temp_path)
+
+
+member_image_storage = ContentAddressedStorage()
+
+
+def get_member_image_storage():
+    """`Member.image` এর storage (callable, যাতে migration এ নির্দিষ্ট পাথ না বসে)।"""
+    return member_image_storage
+
+
+def is_sha256(value):
+    return len(value) == 64 and all(char in '0123456789abcdef' for char in value)
+
+
+def is_content_addressed(name):
+    """
+    নামটি এই storage এর hash লেআউটে কিনা: `members/<hh>/<sha256><ext>` অথবা derivative
+    `members/derivatives/<hh>/<sha256>_<width>.<ext>` (`pages.images.derivative_name`, উৎস ছবির hash)।
+    এমন নামের কনটেন্ট কখনো বদলায় না।
+    """
+    directory, filename = posixpath.split(name)
+    stem = os.path.splitext(filename)[0]
+    if directory.startswith(DERIVATIVE_DIR + '/'):
+        digest, _, width = stem.rpartition('_')
+        return directory == f'{DERIVATIVE_DIR}/{digest[:2]}' and is_sha256(digest) and width.isdigit()
+    return directory == f'{ContentAddressedStorage.prefix}/{stem[:2]}' and is_sha256(stem)
+
+
+def iter_files(root):
+    """
+    `root` এর নিচের সব সাধারণ ফাইলের `os.DirEntry` — `os.scandir` দিয়ে, একটি একটি করে
+    (পুরো তালিকা মেমোরিতে নয়)। symlink অনুসরণ করা হয় না।
+    """
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
@@ -0,0 +1,332 @@
+# pages/suggest.py
+"""
+সদস্য খোঁজার typeahead (`GET /api/members/suggest/?q=`) — প্রসেসের ভেতরে একটি prefix ইনডেক্স।
+
+প্রতিটি টাইপে পুরো পেজ রিলোড বা FTS কোয়েরির বদলে সক্রিয় সদস্যদের `name` ও `area` এর শব্দগুলো
+মেমোরিতে রাখা হয়:
+- শব্দগুলো (`normalize_area_name` — বাংলা/লাতিন, NFKC, casefold, অঙ্ক ASCII) একটি sorted list এ;
+  prefix এর পরিসর `bisect` দিয়ে পাওয়া যায়।
+- প্রতিটি শব্দের posting list একটি `array('I')`; প্রতিটি এন্ট্রি `role_rank << 28 | সারি`, সাজানো
+  তালিকার ক্রমে (`Member.ORDERING`: role_rank, name, id)। সেরা k টি ফলাফলের জন্য posting গুলো
+  `heapq.merge` করে প্রথম k টি নিলেই হয়, আর বহু-শব্দের কোয়েরিতে বাকি শব্দগুলো `bisect` দিয়ে
+  যাচাই হয়। ক্রমে তৈরি ইনডেক্সে সারির ক্রমই নামের ক্রম; পরে যোগ হওয়া সদস্য `bisect` দিয়ে
+  (role_rank, name, id) অনুযায়ী নিজের জায়গায় বসে, তাই পুরো তালিকার মতো একই ক্রম থাকে।
+- সদস্য প্রতি আলাদা object/dict নেই: id, পদ ও এলাকা parallel `array` তে, নাম একটি list এ,
+  এলাকার নাম একবারই। ১০ লাখ সদস্যে মোটামুটি ১০০-১৫০ MB (`bench_suggest` কমান্ড মাপে)।
+
+ইনডেক্স প্রথম রিকোয়েস্টে তৈরি হয় এবং `Member` save/delete সিগন্যালে (commit এর পরে)
+incremental ভাবে বদলায়। bulk আপডেট বা অন্য প্রসেসের পরিবর্তন সিগন্যালে আসে না — সেটি
+cache এর generation (`pages.cache`) মিলিয়ে ধরা হয় এবং ইনডেক্স ব্যাকগ্রাউন্ড thread এ নতুন
+করে তৈরি হয়; ততক্ষণ আগের ইনডেক্স থেকেই উত্তর আসে।
+"""
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import islice
+import heapq
+import threading
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .cache import get_generation
+from .models import Member, normalize_area_name
+
+DEFAULT_LIMIT = 8
+MAX_LIMIT = 20
+
+# বহু-শব্দের কোয়েরিতে সর্বোচ্চ কতজন প্রার্থী যাচাই হবে (বাকি শব্দগুলো মেলে কিনা) — latency এর
+# উপরের সীমা; এর পরে মেলা সদস্য থাকলেও typeahead এ আসে না (পুরো সার্চে আসে)
+SCAN_LIMIT = 256
+SCAN_BATCH = 64
+
+# মুছে ফেলা (বা আপডেটে বদলানো) সারি এর বেশি এবং মোটের এই অনুপাতের বেশি হলে ইনডেক্স নতুন করে তৈরি হয়
+MAX_DELETED_ROWS = 1000
+MAX_DELETED_RATIO = 0.25
+
+# posting list এ prefix এর শেষ সীমা
+LAST_CHAR = '\U0010ffff'
+
+NO_ROW = -1
+
+# posting এন্ট্রি: উপরের ৪ bit এ role_rank, নিচের ২৮ bit এ সারি
+ROW_BITS = 28
+ROW_MASK = (1 << ROW_BITS) - 1
+MAX_RANK = (1 << (32 - ROW_BITS)) - 1
+
+
+@lru_cache(maxsize=100_000)
+def _normalize_word(word):
+    return tuple(normalize_area_name(word).split())
+
+
+def tokenize(text):
+    """
+    টেক্সটের normalized শব্দগুলো (এলাকার নামের মতো একই নিয়মে)। নামের শব্দ অনেক বার আসে
+    (রহিম, করিম, উদ্দিন...), তাই শব্দ প্রতি normalization cache করা হয়।
+    """
+    return [token for word in (text or '').split() for token in _normalize_word(word)]
+
+
+class PrefixIndex:
+    """
+    সদস্যদের নাম ও এলাকার শব্দের prefix ইনডেক্স। সারি (row) = ইনডেক্সে যোগ হওয়ার ক্রম;
+    মুছে ফেলা সারি posting list এ থেকে যায় (ক্রম ঠিক রাখতে নামও) এবং পড়ার সময় বাদ পড়ে।
+    """
+    __slots__ = (
+        'generation', '_ids', '_names', '_ranks', '_areas', '_area_names', '_area_rows', '_area_terms',
+        '_row_of', '_terms', '_term_ids', '_postings', '_deleted', '_lock',
+    )
+
+    def __init__(self, generation=None):
+        self.generation = generation
+        self._ids = array('q')  # সারি -> সদস্যের id
+        self._names = []  # সারি -> নাম
+        self._ranks = array('B')  # সারি -> role_rank
+        self._areas = array('I')  # সারি -> এলাকার index
+        self._area_names = []  # এলাকার index -> নাম
+        self._area_rows = {}  # এলাকার নাম -> index
+        self._area_terms = []  # এলাকার index -> শব্দের id গুলো (এলাকা প্রতি একবার tokenize)
+        self._row_of = array('i')  # সদস্যের id -> সারি (`NO_ROW` = নেই)
+        self._terms = []  # sorted, unique শব্দ
+        self._term_ids = {}  # শব্দ -> id
+        self._postings = []  # শব্দের id -> array('I') এন্ট্রি (`role_rank << ROW_BITS | সারি`), `_sort_key` ক্রমে
+        self._deleted = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, rows, generation=None):
+        """
+        `(id, name, area, role_rank)` সারিগুলো থেকে ইনডেক্স (`Member.ORDERING` ক্রমে দিলে
+        posting list গুলো আলাদা sort ছাড়াই সাজানো থাকে)।
+        """
+        index = cls(generation)
+        ordered, previous = True, None
+        for member_id, name, area, role_rank in rows:
+            entry, term_ids = index._append(member_id, name, area, role_rank, sort_terms=False)
+            for term_id in term_ids:
+                index._postings[term_id].append(entry)
+            current = (min(role_rank, MAX_RANK), name, member_id)
+            ordered = ordered and (previous is None or previous < current)
+            previous = current
+        if not ordered:
+            for position, posting in enumerate(index._postings):
+                index._postings[position] = array('I', sorted(posting, key=index._sort_key))
+        index._terms.sort()
+        return index
+
+    def __len__(self):
+        return len(self._ids) - self._deleted
+
+    @property
+    def terms(self):
+        """ইনডেক্স করা সব শব্দ (sorted)।"""
+        return self._terms
+
+    @property
+    def needs_compaction(self):
+        return self._deleted > max(MAX_DELETED_ROWS, MAX_DELETED_RATIO * len(self._ids))
+
+    def _sort_key(self, entry):
+        """posting এন্ট্রির ক্রম: `(role_rank, name, id)` — `Member.ORDERING` এর মতো।"""
+        row = entry & ROW_MASK
+        return entry >> ROW_BITS, self._names[row], self._ids[row]
+
+    def _is_live(self, row):
+        return self._row_of[self._ids[row]] == row
+
+    def _term_id(self, term, sort_terms):
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = self._term_ids[term] = len(self._postings)
+            self._postings.append(array('I'))
+            if sort_terms:
+                self._terms.insert(bisect_left(self._terms, term), term)
+            else:
+                self._terms.append(term)  # `build` শেষে একবারে sort হয়
+        return term_id
+
+    def _append(self, member_id, name, area, role_rank, sort_terms=True):
+        """নতুন সারি যোগ করে; `(posting এন্ট্রি, শব্দের id গুলো)` ফেরত দেয় (posting এ বসানো হয় না)।"""
+        row = len(self._ids)
+        if row > ROW_MASK:
+            raise OverflowError('Too many rows for the suggest index.')
+        area_row = self._area_rows.get(area)
+        if area_row is None:
+            area_row = self._area_rows[area] = len(self._area_names)
+            self._area_names.append(area)
+            self._area_terms.append(tuple({self._term_id(term, sort_terms) for term in tokenize(area)}))
+        rank = min(role_rank, MAX_RANK)
+        self._ids.append(member_id)
+        self._names.append(name)
+        self._ranks.append(rank)
+        self._areas.append(area_row)
+        if member_id >= len(self._row_of):
+            self._row_of.extend([NO_ROW] * (member_id + 1 - len(self._row_of)))
+        self._row_of[member_id] = row
+        term_ids = {self._term_id(term, sort_terms) for term in tokenize(name)}
+        return rank << ROW_BITS | row, term_ids.union(self._area_terms[area_row])
+
+    def add(self, member_id, name, area, role_rank):
+        """সদস্য যোগ বা আপডেট (আগের সারি মুছে নতুন সারি)।"""
+        with self._lock:
+            self._remove(member_id)
+            entry, term_ids = self._append(member_id, name, area, role_rank)
+            key = self._sort_key(entry)
+            for term_id in term_ids:
+                posting = self._postings[term_id]
+                posting.insert(bisect_left(posting, key, key=self._sort_key), entry)
+
+    def remove(self, member_id):
+        with self._lock:
+            self._remove(member_id)
+
+    def _remove(self, member_id):
+        if member_id >= len(self._row_of) or self._row_of[member_id] == NO_ROW:
+            return
+        self._row_of[member_id] = NO_ROW
+        self._deleted += 1
+
+    def _matching_postings(self, prefix):
+        """`prefix` দিয়ে শুরু হওয়া শব্দগুলোর posting list।"""
+        start = bisect_left(self._terms, prefix)
+        end = bisect_left(self._terms, prefix + LAST_CHAR, lo=start)
+        postings = [self._postings[self._term_ids[term]] for term in self._terms[start:end]]
+        return sorted(postings, key=len, reverse=True)  # যাচাইয়ের সময় বড় posting আগে — আগে মেলে
+
+    def _keep_matching(self, entries, postings):
+        """`entries` (sorted) এর যেগুলো `postings` এর কোনো একটিতে আছে।"""
+        kept = []
+        for entry in entries:
+            key = self._sort_key(entry)
+            for posting in postings:
+                position = bisect_left(posting, key, key=self._sort_key)
+                if position < len(posting) and posting[position] == entry:
+                    kept.append(entry)
+                    break
+        return kept
+
+    def search(self, query, limit=DEFAULT_LIMIT):
+        """
+        `query` এর সব শব্দ (শেষেরটি সহ, prefix হিসেবে) যাদের নাম বা এলাকায় আছে এমন সেরা
+        `limit` জন সদস্য, পদের ক্রমে: `[{'id', 'name', 'role', 'area'}, ...]`।
+        """
+        prefixes = list(dict.fromkeys(tokenize(query)))
+        if not prefixes:
+            return []
+        with self._lock:
+            matches = sorted((self._matching_postings(prefix) for prefix in prefixes), key=lambda p: sum(map(len, p)))
+            # সবচেয়ে কম প্রার্থীর শব্দটি দিয়ে খোঁজা; বাকিগুলো প্রার্থীদের ছোট ছোট ব্যাচে bisect দিয়ে যাচাই
+            driver, others = matches[0], matches[1:]
+            candidates = heapq.merge(*driver, key=self._sort_key)
+            results, previous, scanned = [], None, 0
+            while len(results) < limit and scanned < SCAN_LIMIT:
+                batch = list(islice(candidates, SCAN_BATCH))
+                if not batch:
+                    break
+                scanned += len(batch)
+                entries = []
+                for entry in batch:
+                    if entry != previous and self._is_live(entry & ROW_MASK):
+                        entries.append(entry)
+                    previous = entry
+                for postings in others:
+                    entries = self._keep_matching(entries, postings)
+                results.extend(entries[:limit - len(results)])
+            return [self._result(entry & ROW_MASK) for entry in results]
+
+    def _result(self, row):
+        rank = self._ranks[row]
+        role = Member.ROLE_CHOICES[rank][0] if rank < len(Member.ROLE_CHOICES) else ''
+        return {'id': self._ids[row], 'name': self._names[row], 'role': role, 'area': self._area_names[self._areas[row]]}
+
+
+# --- প্রসেসের ইনডেক্স ---
+
+_index = None
+_build_lock = threading.Lock()
+_rebuilding = False
+
+
+def load_index(generation=None):
+    """ডাটাবেসের সক্রিয় সদস্যদের থেকে নতুন ইনডেক্স (একটি streaming কোয়েরি)।"""
+    rows = (
+        Member.objects.filter(is_active=True).order_by(*Member.ORDERING)
+        .values_list('id', 'name', 'area', 'role_rank').iterator(chunk_size=5000)
+    )
+    return PrefixIndex.build(rows, generation)
+
+
+def _rebuild(generation):
+    global _index, _rebuilding
+    try:
+        _index = load_index(generation)
+    finally:
+        _rebuilding = False
+
+
+def _rebuild_in_background(generation):
+    try:
+        _rebuild(generation)
+    finally:
+        connection.close()
+
+
+def schedule_rebuild(generation):
+    """
+    ইনডেক্স নতুন করে তৈরি করে — `MEMBER_SUGGEST_BACKGROUND_REBUILD` (ডিফল্ট True) হলে
+    ব্যাকগ্রাউন্ড thread এ, যাতে রিকোয়েস্ট অপেক্ষা না করে। একসাথে একটিই rebuild চলে।
+    """
+    global _rebuilding
+    with _build_lock:
+        if _rebuilding:
+            return
+        _rebuilding = True
+    if getattr(settings, 'MEMBER_SUGGEST_BACKGROUND_REBUILD', True):
+        threading.Thread(target=_rebuild_in_background, args=(generation,), daemon=True).start()
+    else:
+        _rebuild(generation)
+
+
+def get_index():
+    """
+    প্রসেসের ইনডেক্স। প্রথমবার রিকোয়েস্টেই তৈরি হয়; পরে generation না মিললে (bulk আপডেট,
+    অন্য প্রসেস) বা অনেক সারি মুছে গেলে নতুন করে তৈরি হয়।
+    """
+    global _index
+    generation = get_generation()
+    if _index is None:
+        with _build_lock:
+            if _index is None:
+                _index = load_index(generation)
+    elif _index.generation != generation or _index.needs_compaction:
+        schedule_rebuild(generation)
+    return _index
+
+
+def suggest(query, limit=DEFAULT_LIMIT):
+    return get_index().search(query, max(1, min(limit, MAX_LIMIT)))
+
+
+def reset():
+    """প্রসেসের ইনডেক্স ফেলে দেয় (পরের রিকোয়েস্টে নতুন করে তৈরি হয়)।"""
+    global _index
+    _index = None
+
+
+def member_changed(member, deleted=False):
+    """
+    `Member` save/delete সিগন্যাল থেকে (cache এর generation বাড়ানোর পরে): commit এর পরে
+    ইনডেক্সে সদস্যকে যোগ/আপডেট/মুছে দেয়। এর মাঝে অন্য কোনো পরিবর্তন না হলে ইনডেক্স
+    নতুন generation এর সাথে মিলে যায়, তাই rebuild লাগে না।
+    """
+    index = _index
+    if index is None:
+        return
+    if index.generation is not None and get_generation() == index.generation + 1:
+        index.generation += 1
+    member_id, values = member.pk, (member.name, member.area, member.role_rank)
+    if deleted or not member.is_active:
+        transaction.on_commit(lambda: index.remove(member_id))
+    else:
+        transaction.on_commit(lambda: index.add(member_id, *values))
@@ -0,0 +1,262 @@
+# pages/tasks.py
+"""
+ডাটাবেস ভিত্তিক ব্যাকগ্রাউন্ড টাস্ক কিউ (কোনো external broker লাগে না)।
+
+- `@task` দিয়ে ফাংশন রেজিস্টার করা হয়।
+- `enqueue(func, *args)` টাস্ক টেবিলে (`Task`) একটি সারি যোগ করে।
+- `python manage.py run_tasks` worker টাস্কগুলো thread pool এ চালায়।
+
+`settings.TASKS_ALWAYS_EAGER = True` হলে টাস্ক কিউতে না গিয়ে transaction commit এর
+পরেই একই প্রসেসে চলে (worker ছাড়া ডেভেলপমেন্টের জন্য)।
+"""
+from datetime import timedelta
+import logging
+import traceback
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Count, F, Max
+from django.utils import timezone
+
+from .cache import bump_generation
+from .images import convert_member_image, generate_derivatives
+from .models import Member, MemberBulkUpdate, Task
+from .search import search_members
+from .stats import update_members
+
+logger = logging.getLogger(__name__)
+
+# ব্যর্থ হলে একটি টাস্ক সর্বোচ্চ কতবার চেষ্টা করা হবে।
+DEFAULT_MAX_ATTEMPTS = 3
+
+# bulk সক্রিয়/নিষ্ক্রিয় জবে প্রতি transaction এ কতজন সদস্য আপডেট হবে।
+DEFAULT_BULK_CHUNK_SIZE = 500
+
+# রেজিস্টার করা টাস্ক: নাম -> ফাংশন
+registry = {}
+
+
+def task(func):
+    """ফাংশনকে টাস্ক হিসেবে রেজিস্টার করে। `func.task_name` এ কিউ-এর নাম থাকে।"""
+    func.task_name = f'{func.__module__}.{func.__name__}'
+    registry[func.task_name] = func
+    return func
+
+
+def enqueue(func, *args, delay=None):
+    """
+    টাস্ক কিউতে যোগ করে এবং `Task` instance ফেরত দেয়।
+    eager মোডে commit এর পরে সরাসরি চালায় এবং `None` ফেরত দেয়।
+    """
+    if getattr(settings, 'TASKS_ALWAYS_EAGER', False):
+        transaction.on_commit(lambda: func(*args))
+        return None
+    run_after = timezone.now() + delay if delay else timezone.now()
+    return Task.objects.create(name=func.task_name, args=list(args), run_after=run_after)
+
+
+def claim(task_id):
+    """
+    atomic UPDATE দিয়ে টাস্কটি নিজের করে নেয় — একাধিক worker প্রসেস থাকলেও
+    একটি টাস্ক একবারই চলে। সফল হলে True।
+    """
+    return Task.objects.filter(pk=task_id, status=Task.PENDING).update(
+        status=Task.RUNNING,
+        started_at=timezone.now(),
+        attempts=F('attempts') + 1,
+    ) == 1
+
+
+def execute(task_id):
+    """
+    claim করা একটি টাস্ক চালায় এবং ফলাফল (done/failed/retry) টেবিলে লিখে রাখে।
+    """
+    job = Task.objects.get(pk=task_id)
+    func = registry.get(job.name)
+    try:
+        if func is None:
+            raise LookupError(f'Unknown task: {job.name}')
+        func(*job.args)
+    except Exception:
+        logger.exception('Task %s (%s) failed', job.pk, job.name)
+        max_attempts = getattr(settings, 'TASKS_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS)
+        retry = func is not None and job.attempts < max_attempts
+        Task.objects.filter(pk=job.pk).update(
+            status=Task.PENDING if retry else Task.FAILED,
+            # exponential backoff: 2, 4, 8 ... সেকেন্ড
+            run_after=timezone.now() + timedelta(seconds=2 ** job.attempts),
+            last_error=traceback.format_exc(),
+            finished_at=None if retry else timezone.now(),
+        )
+        if not retry and hasattr(func, 'on_failure'):
+            func.on_failure(*job.args)
+    else:
+        Task.objects.filter(pk=job.pk).update(status=Task.DONE, finished_at=timezone.now(), last_error='')
+
+
+def execute_in_thread(task_id):
+    """worker thread থেকে `execute` চালায় এবং শেষে এই thread এর DB connection বন্ধ করে।"""
+    try:
+        execute(task_id)
+    finally:
+        connections.close_all()
+
+
+def due_task_ids(limit):
+    """এখন চালানোর যোগ্য pending টাস্কগুলোর id (পুরনোগুলো আগে)।"""
+    return list(
+        Task.objects.filter(status=Task.PENDING, run_after__lte=timezone.now())
+        .order_by('run_after', 'id')
+        .values_list('id', flat=True)[:limit]
+    )
+
+
+def requeue_stale(older_than=timedelta(minutes=10)):
+    """crash করা worker এর আটকে থাকা RUNNING টাস্কগুলো আবার pending করে।"""
+    return Task.objects.filter(status=Task.RUNNING, started_at__lt=timezone.now() - older_than).update(
+        status=Task.PENDING
+    )
+
+
+def run_pending(limit=100):
+    """
+    বর্তমান থ্রেডে due টাস্কগুলো একে একে চালায় (টেস্ট এবং `run_tasks --workers 0` এর জন্য)।
+    কয়টি টাস্ক চালানো হলো তা ফেরত দেয়।
+    """
+    count = 0
+    for task_id in due_task_ids(limit):
+        if claim(task_id):
+            execute(task_id)
+            count += 1
+    return count
+
+
+# ==============================================
+# ================ টাস্কসমূহ =================
+# ==============================================
+
+@task
+def process_member_image(member_id):
+    """
+    সদস্যের আপলোড করা ছবি WEBP তে কনভার্ট করে।
+    কনভার্সন শেষ না হওয়া পর্যন্ত মূল ছবিটিই দেখানো হয়।
+
+    কনভার্সনের মাঝে সদস্য নতুন ছবি আপলোড করলে ফলাফল লেখা হয় না — সারিটি transaction এ
+    lock করে আবার পড়া হয় এবং ছবি তখনো একই থাকলেই আপডেট হয় (নতুন ছবির নিজের টাস্ক আছে)।
+    মূল আপলোড ফাইলটি মোছা হয় না; কেউ ব্যবহার না করলে `gc_media` সেটি মুছে দেয়।
+    """
+    member = Member.objects.filter(pk=member_id).first()
+    if member is None or not member.image:
+        return
+    source = member.image.name
+    Member.objects.filter(pk=member_id, image=source).update(image_status=Member.IMAGE_PROCESSING)
+    bump_generation()
+    convert_member_image(member)
+    derivatives = generate_derivatives(member)
+    with transaction.atomic():
+        current = Member.objects.select_for_update().filter(pk=member_id, image=source).first()
+        if current is None:
+            return
+        current.image = member.image.name
+        current.image_derivatives = derivatives
+        current.image_status = Member.IMAGE_READY
+        current.save(update_fields=['image', 'image_status', 'image_derivatives', 'updated_at'], process_image=False)
+
+
+def _mark_member_image_failed(member_id):
+    Member.objects.filter(pk=member_id).update(image_status=Member.IMAGE_FAILED)
+    bump_generation()
+
+
+process_member_image.on_failure = _mark_member_image_failed
+
+
+@task
+def generate_member_derivatives(member_id):
+    """সদস্যের ছবির responsive derivative (96/256/768 px) তৈরি করে manifest সংরক্ষণ করে।"""
+    member = Member.objects.filter(pk=member_id).first()
+    if member is None or not member.image:
+        return
+    member.image_derivatives = generate_derivatives(member)
+    member.save(update_fields=['image_derivatives', 'updated_at'], process_image=False)
+
+
+def enqueue_missing_derivatives(chunk_size=1000):
+    """
+    যেসব সদস্যের ছবি প্রস্তুত কিন্তু derivative manifest পুরনো/নেই (যেমন derivative চালুর আগের
+    ছবি), তাদের জন্য `generate_member_derivatives` টাস্ক পাঠায়; কতগুলো পাঠানো হলো ফেরত দেয়।
+    পড়ার পথ (API/টেমপ্লেট) টাস্ক পাঠায় না — এটি `backfill_derivatives` কমান্ড থেকে চলে।
+    """
+    queryset = (
+        Member.objects.filter(image_status=Member.IMAGE_READY).exclude(image='').exclude(image__isnull=True)
+        .only('id', 'image', 'image_status', 'image_derivatives').order_by('pk')
+    )
+    count, last = 0, 0
+    while True:
+        members = list(queryset.filter(pk__gt=last)[:chunk_size])
+        if not members:
+            return count
+        for member in members:
+            if member.needs_derivatives():
+                enqueue(generate_member_derivatives, member.pk)
+                count += 1
+        last = members[-1].pk
+
+
+def bulk_update_queryset(job):
+    """জবের selection: `filters` ও `search` এর সদস্যরা, `last_pk` পর্যন্ত।"""
+    queryset = Member.objects.filter(pk__lte=job.last_pk, **job.filters)
+    if job.search:
+        queryset = search_members(queryset, job.search)
+    return queryset
+
+
+def start_member_bulk_update(filters, is_active, search=''):
+    """
+    `Member.objects.filter(**filters)` (এবং `search` থাকলে সার্চের) সদস্যদের `is_active`
+    বদলানোর একটি `MemberBulkUpdate` জব তৈরি করে ব্যাকগ্রাউন্ড টাস্ক কিউতে পাঠায়।
+    `filters` JSON এ রাখা যায় এমন lookup হতে হবে। মোট সংখ্যা ও সবচেয়ে বড় id একটি কোয়েরিতে।
+    """
+    job = MemberBulkUpdate(filters=filters, search=search, is_active=is_active)
+    queryset = Member.objects.filter(**filters)
+    if search:
+        queryset = search_members(queryset, search)
+    selection = queryset.order_by().aggregate(total=Count('pk'), last_pk=Max('pk'))
+    job.total, job.last_pk = selection['total'], selection['last_pk'] or 0
+    job.save()
+    enqueue(run_member_bulk_update, job.pk)
+    return job
+
+
+@task
+def run_member_bulk_update(job_id):
+    """
+    জবের সদস্যদের pk এর ক্রমে `MEMBER_BULK_CHUNK_SIZE` করে আপডেট করে (`pages.stats.update_members`);
+    প্রতিটি chunk এর id গুলো `cursor` এর পর থেকে keyset দিয়ে পড়া হয়। প্রতিটি chunk ও তার
+    অগ্রগতি একই transaction এ লেখা হয়, তাই ব্যর্থ হলে retry আগের chunk গুলো আবার করে না।
+    প্রতিটি chunk এর পরে cache অকেজো করা হয়।
+    """
+    job = MemberBulkUpdate.objects.filter(pk=job_id).first()
+    if job is None or job.status == Task.DONE:
+        return
+    MemberBulkUpdate.objects.filter(pk=job.pk).update(status=Task.RUNNING)
+    size = getattr(settings, 'MEMBER_BULK_CHUNK_SIZE', DEFAULT_BULK_CHUNK_SIZE)
+    queryset = bulk_update_queryset(job)
+    cursor, processed = job.cursor, job.processed
+    while True:
+        chunk = list(queryset.filter(pk__gt=cursor).order_by('pk').values_list('pk', flat=True)[:size])
+        if not chunk:
+            break
+        cursor, processed = chunk[-1], processed + len(chunk)
+        with transaction.atomic():
+            update_members(Member.objects.filter(pk__in=chunk), is_active=job.is_active, updated_at=timezone.now())
+            MemberBulkUpdate.objects.filter(pk=job.pk).update(cursor=cursor, processed=processed)
+        bump_generation()
+    MemberBulkUpdate.objects.filter(pk=job.pk).update(status=Task.DONE, finished_at=timezone.now())
+
+
+def _mark_member_bulk_update_failed(job_id):
+    MemberBulkUpdate.objects.filter(pk=job_id).update(status=Task.FAILED)
+
+
+run_member_bulk_update.on_failure = _mark_member_bulk_update_failed
@@ -0,0 +1,47 @@
+# pages/templatetags/member_images.py
+from django import template
+from django.utils.html import format_html
+
+register = template.Library()
+
+
+@register.filter
+def member_srcset(member):
+    """
+    সদস্যের ছবির derivative গুলোর `srcset` স্ট্রিং, যেমন: "/media/..._96.webp 96w, /media/..._256.webp 256w"।
+    derivative না থাকলে খালি স্ট্রিং।
+    ব্যবহার: <img srcset="{{ member|member_srcset }}" ...>
+    """
+    return ', '.join(f'{url} {width}w' for width, url in member.get_avatar_variants())
+
+
+@register.simple_tag
+def member_avatar(member, size=96, css_class='avatar'):
+    """
+    সদস্যের অ্যাভাটার `<img>` ট্যাগ — `srcset` সহ, যাতে ব্রাউজার প্রদর্শনের সাইজ
+    (`size` px) অনুযায়ী সবচেয়ে ছোট উপযুক্ত ফাইলটি নামায়।
+    derivative না থাকলে পুরো ছবি (`get_avatar_url`) ব্যবহার হয়; AVIF সংস্করণ থাকলে
+    `<picture>` এ একটি AVIF `<source>` সহ।
+    ব্যবহার: {% member_avatar member 96 "avatar mx-auto mb-3" %}
+    """
+    variants = member.get_avatar_variants()
+    if not variants:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" width="{}" height="{}" loading="lazy" decoding="async">',
+            member.get_avatar_url(), member.name, css_class, size, size,
+        )
+    # fallback src: প্রদর্শনের সাইজের চেয়ে বড় সবচেয়ে ছোট derivative
+    src = next((url for width, url in variants if width >= size), variants[-1][1])
+    srcset = ', '.join(f'{url} {width}w' for width, url in variants)
+    img = format_html(
+        '<img src="{}" srcset="{}" sizes="{}px" alt="{}" class="{}" width="{}" height="{}" loading="lazy" decoding="async">',
+        src, srcset, size, member.name, css_class, size, size,
+    )
+    avif = member.get_avatar_variants('avif')
+    if not avif:
+        return img
+    # AVIF (`reencode_media --avif`) সমর্থন করা ব্রাউজারের জন্য; বাকিরা WEBP এর <img> নেয়
+    return format_html(
+        '<picture><source type="image/avif" srcset="{}" sizes="{}px">{}</picture>',
+        ', '.join(f'{url} {width}w' for width, url in avif), size, img,
+    )
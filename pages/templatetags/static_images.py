@@ -0,0 +1,37 @@
+# pages/templatetags/static_images.py
+from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from pages.staticfiles import ALTERNATE_FORMATS
+
+register = template.Library()
+
+
+@register.simple_tag
+def static_image(path, **attrs):
+    """
+    static ছবির `<img>` — `collectstatic` এর manifest এ (`pages.staticfiles`) মাপ ও AVIF/WEBP
+    বিকল্প থাকলে `<picture>` এর ভেতরে `width`/`height` সহ (layout shift হয় না)।
+    manifest না থাকলে (ডেভেলপমেন্ট) সাধারণ `<img>`। `data_aos` ধরনের নাম `data-aos` হয়।
+    ব্যবহার: {% static_image 'assets/img/about.webp' alt="About" class="img-fluid" %}
+    """
+    attrs = {name.replace('_', '-'): value for name, value in attrs.items()}
+    attrs.setdefault('alt', '')
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+
+    info = getattr(staticfiles_storage, 'image_info', lambda name: None)(path)
+    if info:
+        attrs['width'], attrs['height'] = info['size']
+    img = format_html(
+        '<img src="{}"{}>', static(path), format_html_join('', ' {}="{}"', attrs.items()),
+    )
+    if not info or not info['alternates']:
+        return img
+    sources = format_html_join(
+        '', '<source srcset="{}" type="{}">',
+        ((static(info['alternates'][mime]), mime) for _, mime, *_ in ALTERNATE_FORMATS if mime in info['alternates']),
+    )
+    return format_html('<picture>{}{}</picture>', sources, img)
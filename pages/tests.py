@@ -1,3 +1,1303 @@
-from django.test import TestCase
+import csv
+from io import BytesIO, StringIO
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse, reverse_lazy
+from PIL import Image
+
+from . import media, metrics, prerender, suggest, tasks
+from .benchmarks import run_benchmarks
+from .cache import bump_generation
+from .db import ReadOnlyRouter, apply_pragmas, read_only_request
+from .models import Area, AreaAlias, Member, MemberBulkUpdate, MemberStat, Task
+from .seed import seed_members
+from .serializers import MemberListRowSerializer, MemberListSerializer
+from .stats import count_members, get_stats, rebuild, update_members
+
+
+def make_member(**kwargs):
+    """টেস্টের জন্য একজন সদস্য তৈরি করে।"""
+    data = {'name': 'Test Member', 'role': 'Member', 'area': 'Mirpur', 'phone': '+8801900000000'}
+    data.update(kwargs)
+    return Member.objects.create(**data)
+
+
+def make_image(name='photo.png', size=(64, 64), color='red', format='PNG'):
+    """টেস্টের জন্য একটি ছোট আপলোড করা ইমেজ ফাইল।"""
+    buffer = BytesIO()
+    Image.new('RGB', size, color).save(buffer, format=format)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type=f'image/{format.lower()}')
+
+
+class MemberTestCase(TestCase):
+    """
+    প্রতিটি টেস্টের আগে cache খালি করা হয়, যাতে আগের টেস্টের cached রেসপন্স না আসে;
+    একই কারণে প্রসেসের typeahead ইনডেক্সও ফেলে দেওয়া হয়।
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        suggest.reset()
+
+
+class TempMediaMixin:
+    """প্রতিটি টেস্ট ক্লাসের জন্য আলাদা অস্থায়ী MEDIA_ROOT।"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._media_root = tempfile.mkdtemp()
+        cls._media_override = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls._media_override.disable()
+        shutil.rmtree(cls._media_root, ignore_errors=True)
+
+
+class MemberSearchTests(MemberTestCase):
+    """ইনডেক্স ভিত্তিক সদস্য সার্চ।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.karim = make_member(name='Abdul Karim', area='Mirpur 10', bio='Electrician')
+        cls.rahim = make_member(name='Rahim Uddin', area='Dhanmondi', bio='Works with Karim')
+        cls.bangla = make_member(name='মোহাম্মদ বায়াজীদ', area='খুলনা')
+
+    def test_ranked_by_relevance(self):
+        response = self.client.get(reverse('pages:member-api-list'), {'search': 'karim'})
+        self.assertEqual([row['id'] for row in response.json()], [self.karim.pk, self.rahim.pk])
+
+    def test_prefix_and_bangla(self):
+        response = self.client.get(reverse('pages:member-api-list'), {'search': 'বায়া'})
+        self.assertEqual([row['id'] for row in response.json()], [self.bangla.pk])
+        response = self.client.get(reverse('pages:sodosso'), {'search': 'dhan'})
+        self.assertEqual(list(response.context['members']), [self.rahim])
+
+    def test_index_follows_save_and_delete(self):
+        self.karim.name = 'Abdul Jabbar'
+        self.karim.save()
+        response = self.client.get(reverse('pages:member-api-list'), {'search': 'jabbar'})
+        self.assertEqual([row['id'] for row in response.json()], [self.karim.pk])
+        self.karim.delete()
+        response = self.client.get(reverse('pages:member-api-list'), {'search': 'jabbar'})
+        self.assertEqual(response.json(), [])
+
+    @override_settings(MEMBER_SEARCH_BACKEND='pages.search.IContainsSearchBackend')
+    def test_icontains_fallback(self):
+        response = self.client.get(reverse('pages:member-api-list'), {'search': 'arim'})
+        self.assertEqual({row['id'] for row in response.json()}, {self.karim.pk, self.rahim.pk})
+
+
+class MemberKeysetPaginationTests(MemberTestCase):
+    """`?cursor=` ভিত্তিক keyset pagination (API এবং টেমপ্লেট)।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(20):
+            make_member(name=f'Member {index:02d}', role='Committee' if index % 3 else 'Member')
+        cls.expected = list(
+            Member.objects.filter(is_active=True).order_by(*Member.ORDERING).values_list('id', flat=True)
+        )
+
+    def test_api_walks_forward_and_back(self):
+        url = reverse('pages:member-api-list')
+        response = self.client.get(url, {'cursor': '', 'page_size': 6, 'total': 1}).json()
+        self.assertEqual(response['count'], 20)
+        self.assertIsNone(response['previous'])
+        seen, pages = [], [response]
+        while True:
+            seen += [row['id'] for row in response['results']]
+            if not response['next']:
+                break
+            response = self.client.get(response['next']).json()
+            pages.append(response)
+        self.assertEqual(seen, self.expected)
+        back = self.client.get(pages[-1]['previous']).json()
+        self.assertEqual(back['results'], pages[-2]['results'])
+
+    def test_api_without_cursor_is_unpaginated(self):
+        response = self.client.get(reverse('pages:member-api-list'))
+        self.assertEqual(len(response.json()), 20)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('pages:member-api-list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_cursor_with_ordering_or_search_is_rejected(self):
+        for url in (reverse('pages:member-api-list'), reverse('pages:member-async-list')):
+            for params in ({'ordering': '-name'}, {'search': 'Member'}):
+                response = self.client.get(url, {'cursor': '', **params})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('cannot be combined', response.json()['detail'])
+            # খালি মান কোনো ক্রম বদলায় না
+            response = self.client.get(url, {'cursor': '', 'search': '', 'page_size': 20})
+            self.assertEqual([row['id'] for row in response.json()['results']], self.expected)
+
+    def test_template_view_uses_cursor(self):
+        response = self.client.get(reverse('pages:sodosso'))
+        page = response.context['members']
+        self.assertEqual([member.pk for member in page], self.expected[:8])
+        response = self.client.get(reverse('pages:sodosso'), {'cursor': page.next_cursor})
+        self.assertEqual([member.pk for member in response.context['members']], self.expected[8:16])
+
+    def test_legacy_page_numbers_redirect_to_cursor(self):
+        for url in (reverse('pages:sodosso'), reverse('pages:sodosso-async')):
+            response = self.client.get(url, {'page': 2, 'role': 'Committee'}, follow=True)
+            self.assertEqual(response.redirect_chain[0][1], 302)
+            self.assertIn('role=Committee', response.redirect_chain[0][0])
+            committee = list(
+                Member.objects.filter(role='Committee').order_by(*Member.ORDERING).values_list('id', flat=True)
+            )
+            self.assertContains(response, Member.objects.get(pk=committee[8]).name)
+            self.assertNotContains(response, Member.objects.get(pk=committee[7]).name)
+
+            # সীমার বাইরে হলে শেষ পেজ, ভুল নম্বরে প্রথম পেজ
+            response = self.client.get(url, {'page': 99}, follow=True)
+            self.assertContains(response, Member.objects.get(pk=self.expected[16]).name)
+            self.assertNotContains(response, Member.objects.get(pk=self.expected[15]).name)
+            response = self.client.get(url, {'page': 'x'})
+            self.assertRedirects(response, url, fetch_redirect_response=False)
+
+        # সার্চের ফলাফলে পেজ নম্বরই চলে
+        response = self.client.get(reverse('pages:sodosso'), {'search': 'Member', 'page': 2})
+        self.assertEqual(response.status_code, 200)
+
+
+class MemberImageTaskTests(TempMediaMixin, MemberTestCase):
+    """ছবির WEBP কনভার্সন ব্যাকগ্রাউন্ড টাস্কে হয়।"""
+
+    def test_conversion_is_queued_and_processed(self):
+        member = make_member(name='Photo Person', image=make_image())
+        original = member.image.name
+        self.assertEqual(member.image_status, Member.IMAGE_PENDING)
+        self.assertTrue(original.endswith('.png'))
+        self.assertEqual(Task.objects.filter(status=Task.PENDING).count(), 1)
+
+        self.assertEqual(tasks.run_pending(), 1)
+        member.refresh_from_db()
+        self.assertEqual(member.image_status, Member.IMAGE_READY)
+        self.assertRegex(member.image.name, r'^members/[0-9a-f]{2}/[0-9a-f]{64}\.webp$')
+        self.assertEqual(Task.objects.get().status, Task.DONE)
+        # মূল আপলোড টাস্ক মোছে না — `gc_media` এর কাজ
+        self.assertTrue(member.image.storage.exists(original))
+        call_command('gc_media', '--min-age=0', '--delete', stdout=StringIO())
+        self.assertFalse(member.image.storage.exists(original))
+
+    def test_new_upload_during_conversion_is_kept(self):
+        member = make_member(image=make_image())
+
+        def upload_meanwhile(instance):
+            Member.objects.filter(pk=instance.pk).update(image='members/ab/newer.png')
+            return {}
+
+        with mock.patch.object(tasks, 'generate_derivatives', side_effect=upload_meanwhile):
+            tasks.run_pending()
+        member.refresh_from_db()
+        self.assertEqual(member.image.name, 'members/ab/newer.png')
+
+    def test_identical_uploads_share_one_file(self):
+        first = make_member(name='First', role='President', image=make_image(name='razon.png'))
+        second = make_member(name='Second', image=make_image(name='members/members/razon.png'))
+        self.assertEqual(first.image.name, second.image.name)
+        original = first.image.name
+        self.assertRegex(original, r'^members/[0-9a-f]{2}/[0-9a-f]{64}\.png$')
+        tasks.run_pending()
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertEqual(first.image_derivatives['hash'], first.image.name.split('/')[-1].split('.')[0])
+        # মূল ফাইলটি দুইজনেরই ছিল — কনভার্সনের পরে আর কেউ ব্যবহার করে না, তাই gc মোছে
+        call_command('gc_media', '--min-age=0', '--delete', stdout=StringIO())
+        self.assertFalse(first.image.storage.exists(original))
+        self.assertTrue(first.image.storage.exists(first.image.name))
+
+    def test_gc_reports_and_deletes_orphans(self):
+        member = make_member(image=make_image(size=(120, 120)))
+        tasks.run_pending()
+        member.refresh_from_db()
+        storage = member.image.storage
+        legacy = make_member(name='Legacy', image='members/members/members/legacy.png')
+        legacy_path = os.path.join(self._media_root, 'members', 'members', 'members', 'legacy.png')
+        os.makedirs(os.path.dirname(legacy_path), exist_ok=True)
+        with open(legacy_path, 'wb') as handle:
+            handle.write(make_image(color='green').read())
+        orphan = os.path.join(self._media_root, 'members', 'Committee', 'members', 'Committee', 'old.webp')
+        os.makedirs(os.path.dirname(orphan))
+        with open(orphan, 'wb') as handle:
+            handle.write(b'old')
+        make_member(name='Gone', image='members/ab/missing.png')
+
+        output = StringIO()
+        call_command('gc_media', '--min-age=0', '--missing', '--chunk-size=2', stdout=output)
+        self.assertIn('orphan: members/Committee/members/Committee/old.webp', output.getvalue())
+        self.assertIn('missing: member', output.getvalue())
+        # আগের টেস্টগুলোর (rollback হওয়া সারির) ফাইলও orphan; ব্যবহৃত ফাইলগুলো নয়
+        for name in [member.image.name, legacy.image.name, *member.image_derivatives['sizes'].values()]:
+            self.assertNotIn(name, output.getvalue())
+        self.assertTrue(os.path.exists(orphan))
+
+        version = Member.objects.get(pk=legacy.pk).fragment_version
+        output = StringIO()
+        call_command('gc_media', '--min-age=0', '--rehash', '--delete', stdout=output)
+        self.assertIn('1 member images moved', output.getvalue())
+        legacy.refresh_from_db()
+        self.assertGreater(legacy.fragment_version, version)
+        self.assertTrue(legacy.image.name.startswith('members/'))
+        self.assertTrue(storage.exists(legacy.image.name))
+        self.assertFalse(os.path.exists(legacy_path))
+        self.assertFalse(os.path.exists(os.path.join(self._media_root, 'members', 'Committee')))
+        self.assertTrue(storage.exists(member.image.name))
+        for name in member.image_derivatives['sizes'].values():
+            self.assertTrue(storage.exists(name))
+
+    def test_reencode_media_command(self):
+        member = make_member(image=make_image(name='blog.jpg', size=(300, 200), format='JPEG'))
+        Task.objects.all().delete()
+        static_dir = os.path.join(self._media_root, 'static-img')
+        os.makedirs(static_dir)
+        Image.new('RGB', (40, 30), 'blue').save(os.path.join(static_dir, 'hero.jpg'))
+        progress = os.path.join(self._media_root, 'progress.json')
+        options = ['--workers=2', '--avif', f'--progress={progress}', f'--static-dir={static_dir}']
+
+        version = member.fragment_version
+        output = StringIO()
+        call_command('reencode_media', *options, stdout=output)
+        self.assertIn('2 images re-encoded', output.getvalue())
+        member.refresh_from_db()
+        self.assertGreater(member.fragment_version, version)
+        self.assertRegex(member.image.name, r'^members/[0-9a-f]{2}/[0-9a-f]{64}\.webp$')
+        self.assertEqual(member.image_status, Member.IMAGE_READY)
+        self.assertEqual(sorted(member.image_derivatives['sizes'], key=int), ['96', '256', '300'])
+        self.assertTrue(all(name.endswith('.avif') for name in member.image_derivatives['avif'].values()))
+        self.assertTrue(os.path.exists(os.path.join(static_dir, 'hero.webp')))
+        self.assertTrue(os.path.exists(os.path.join(static_dir, 'hero.avif')))
+
+        output = StringIO()
+        call_command('reencode_media', *options, stdout=output)
+        self.assertIn('0 images re-encoded, 0 unchanged, 2 already done', output.getvalue())
+
+        # AVIF derivative গুলো ব্যবহার হয় (`<picture>`) এবং gc সেগুলো মোছে না
+        html = Template('{% load member_images %}{% member_avatar member 96 %}').render(Context({'member': member}))
+        self.assertIn('<source type="image/avif"', html)
+        call_command('gc_media', '--min-age=0', '--delete', stdout=StringIO())
+        for name in member.image_derivatives['avif'].values():
+            self.assertTrue(member.image.storage.exists(name))
+
+    def test_failure_marks_member(self):
+        member = make_member(image=SimpleUploadedFile('broken.png', b'not an image'))
+        with self.settings(TASKS_MAX_ATTEMPTS=1), self.assertLogs('pages.tasks', 'ERROR'):
+            tasks.run_pending()
+        member.refresh_from_db()
+        self.assertEqual(member.image_status, Member.IMAGE_FAILED)
+        self.assertEqual(Task.objects.get().status, Task.FAILED)
+
+    def test_unrelated_save_skips_image_and_writes_changed_columns(self):
+        member = make_member(image=make_image())
+        tasks.run_pending()
+        member = Member.objects.get(pk=member.pk)
+        image_name = member.image.name
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('pages:member-api-toggle-active', args=[member.pk]))
+        self.assertEqual(response.status_code, 200)
+        update = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "pages_member" ')]
+        self.assertEqual(len(update), 1)
+        self.assertNotIn('"bio"', update[0])
+        self.assertIn('"is_active"', update[0])
+
+        member.refresh_from_db()
+        self.assertEqual(member.image.name, image_name)
+        self.assertEqual(member.image_status, Member.IMAGE_READY)
+        self.assertFalse(Task.objects.filter(status=Task.PENDING).exists())
+
+    def test_deferred_and_mutated_json_fields_are_saved(self):
+        member = make_member(bio='Old bio')
+        member = Member.objects.only('id', 'name').get(pk=member.pk)
+        member.bio = 'New bio'
+        member.save()
+        self.assertEqual(Member.objects.get(pk=member.pk).bio, 'New bio')
+
+        member = Member.objects.get(pk=member.pk)
+        member.image_derivatives['sizes'] = {'96': 'members/derivatives/x_96.webp'}
+        member.save()
+        self.assertEqual(Member.objects.get(pk=member.pk).image_derivatives['sizes'], {'96': 'members/derivatives/x_96.webp'})
+
+    def test_same_upload_is_not_reprocessed(self):
+        member = make_member(image=make_image())
+        tasks.run_pending()
+        member = Member.objects.get(pk=member.pk)
+        image_name = member.image.name
+
+        member.image = make_image()
+        member.save()
+        self.assertEqual(member.image.name, image_name)
+        self.assertFalse(Task.objects.filter(status=Task.PENDING).exists())
+
+        member.image = make_image(color='blue')
+        member.save()
+        self.assertEqual(member.image_status, Member.IMAGE_PENDING)
+        self.assertEqual(Task.objects.filter(status=Task.PENDING).count(), 1)
+
+
+class MemberImageDerivativeTests(TempMediaMixin, MemberTestCase):
+    """srcset এর জন্য responsive thumbnail derivative।"""
+
+    def test_derivatives_generated_with_conversion(self):
+        member = make_member(image=make_image(size=(400, 300)))
+        tasks.run_pending()
+        member.refresh_from_db()
+        self.assertEqual(sorted(member.image_derivatives['sizes'], key=int), ['96', '256', '400'])
+
+        row = self.client.get(reverse('pages:member-api-detail', args=[member.pk])).json()
+        self.assertIn('_96.webp 96w', row['avatar_srcset'])
+        self.assertTrue(row['avatar_srcset'].startswith('http://testserver/media/members/derivatives/'))
+
+        response = self.client.get(reverse('pages:sodosso'))
+        self.assertContains(response, 'sizes="96px"', count=1)
+        # মডালের অ্যাভাটার fragment এ
+        self.assertContains(self.client.get(member.get_fragment_url()), 'sizes="96px"', count=1)
+
+    def test_backfill_for_existing_images(self):
+        member = make_member(image=make_image(size=(120, 120)))
+        tasks.run_pending()
+        Member.objects.filter(pk=member.pk).update(image_derivatives={})
+        member.refresh_from_db()
+
+        # পড়ার পথ মূল ছবি দেখায়, কোনো টাস্ক পাঠায় না
+        response = self.client.get(reverse('pages:member-api-list'))
+        self.assertEqual(response.json()[0]['avatar_srcset'], '')
+        self.assertContains(self.client.get(reverse('pages:sodosso')), member.image.url)
+        self.assertFalse(Task.objects.filter(name=tasks.generate_member_derivatives.task_name).exists())
+
+        call_command('backfill_derivatives', stdout=StringIO())
+        self.assertEqual(Task.objects.filter(name=tasks.generate_member_derivatives.task_name).count(), 1)
+        tasks.run_pending()
+        response = self.client.get(reverse('pages:member-api-list'))
+        self.assertIn('_120.webp 120w', response.json()[0]['avatar_srcset'])
+
+
+    def test_row_serializer_matches_list_serializer(self):
+        make_member(name='Ready Photo', image=make_image(size=(300, 300)))
+        tasks.run_pending()
+        stale = make_member(name='Stale Photo', image=make_image(name='stale.png', size=(120, 120)))
+        tasks.run_pending()
+        Member.objects.filter(pk=stale.pk).update(image_derivatives={})
+        make_member(name='Pending Photo', image=make_image(name='pending.png'))
+        make_member(name='No Photo')
+
+        request = RequestFactory().get('/api/members/')
+        queryset = Member.objects.order_by('id')
+        expected = MemberListSerializer(queryset, many=True, context={'request': request}).data
+        rows = queryset.values(*MemberListRowSerializer.value_fields)
+        self.assertEqual(MemberListRowSerializer(request).serialize(rows), expected)
+        self.assertEqual(
+            MemberListRowSerializer().serialize(rows),
+            MemberListSerializer(queryset, many=True).data,
+        )
+        self.assertTrue(expected[0]['avatar_srcset'])
+
+class MediaServingTests(TempMediaMixin, TestCase):
+    """`/media/` সার্ভ করা: Range, conditional GET, immutable cache এবং proxy অফলোড।"""
+
+    def setUp(self):
+        self.hashed = 'members/derivatives/ab/' + 'ab' * 32 + '_96.webp'
+        self.plain = 'members/Member/photo_20250101.webp'
+        for name in (self.hashed, self.plain):
+            path = f'{self._media_root}/{name}'
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as handle:
+                handle.write(bytes(range(200)))
+
+    def test_file_response_with_range_and_conditional_get(self):
+        response = self.client.get('/media/' + self.hashed)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), bytes(range(200)))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+        self.assertNotIn('immutable', self.client.get('/media/' + self.plain)['Cache-Control'])
+
+        # শুধু content-addressed নাম immutable, নামে hex অংশ থাকলেই নয়
+        self.assertTrue(media.is_immutable('members/ab/' + 'ab' * 32 + '.webp'))
+        self.assertFalse(media.is_immutable('members/Member/photo_0123456789abcdef0123.webp'))
+        self.assertFalse(media.is_immutable('members/derivatives/cd/' + 'ab' * 32 + '_96.webp'))
+        self.assertFalse(media.is_immutable('members/derivatives/ab/' + 'ab' * 32 + '.webp'))
+
+        partial = self.client.get('/media/' + self.hashed, HTTP_RANGE='bytes=10-19')
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial['Content-Range'], 'bytes 10-19/200')
+        self.assertEqual(b''.join(partial.streaming_content), bytes(range(10, 20)))
+        suffix = self.client.get('/media/' + self.hashed, HTTP_RANGE='bytes=-5')
+        self.assertEqual(b''.join(suffix.streaming_content), bytes(range(195, 200)))
+        self.assertEqual(self.client.get('/media/' + self.hashed, HTTP_RANGE='bytes=500-').status_code, 416)
+        stale = self.client.get('/media/' + self.hashed, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(stale.status_code, 200)
+
+        self.assertEqual(self.client.get('/media/' + self.hashed, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        cached = self.client.get('/media/' + self.hashed, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(cached.status_code, 304)
+
+        self.assertEqual(self.client.get('/media/../config/settings.py').status_code, 404)
+        self.assertEqual(self.client.get('/media/members/missing.webp').status_code, 404)
+        self.assertEqual(self.client.get('/media/members').status_code, 404)
+
+    def test_offload_to_front_proxy(self):
+        with override_settings(MEDIA_X_ACCEL_REDIRECT='/protected-media/'):
+            response = self.client.get('/media/' + self.plain)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/' + self.plain)
+        self.assertEqual(response['Content-Type'], 'image/webp')
+        self.assertEqual(response.content, b'')
+        with override_settings(MEDIA_X_SENDFILE=True):
+            response = self.client.get('/media/' + self.hashed)
+        self.assertEqual(response['X-Sendfile'], os.path.join(self._media_root, self.hashed))
+        self.assertIn('immutable', response['Cache-Control'])
+
+
+class StaticAssetPipelineTests(TestCase):
+    """`collectstatic` এ ছবি অপটিমাইজেশন, বিকল্প ফরম্যাট, ছবির মাপ ও Brotli/gzip।"""
+
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.source, ignore_errors=True)
+        self.addCleanup(shutil.rmtree, self.root, ignore_errors=True)
+        os.makedirs(os.path.join(self.source, 'img'))
+        os.makedirs(os.path.join(self.source, 'css'))
+        Image.new('RGB', (40, 30), 'blue').save(os.path.join(self.source, 'img', 'blog.jpg'))
+        Image.new('RGB', (20, 10), 'red').save(os.path.join(self.source, 'img', 'hero.webp'))
+        Image.new('RGB', (16, 16), 'green').save(os.path.join(self.source, 'img', 'logo.png'), compress_level=0)
+        with open(os.path.join(self.source, 'css', 'site.css'), 'w') as handle:
+            handle.write('body { background: url("../img/logo.png"); }\n' * 200)
+
+    def test_collectstatic_optimises_images_and_records_sizes(self):
+        original_png = os.path.getsize(os.path.join(self.source, 'img', 'logo.png'))
+        storages = {
+            'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+            'staticfiles': {'BACKEND': 'pages.staticfiles.OptimizedStaticFilesStorage'},
+        }
+        with override_settings(
+            STATIC_ROOT=self.root, STATICFILES_DIRS=[self.source], STORAGES=storages, STATIC_IMAGE_WORKERS=2,
+            STATICFILES_FINDERS=['django.contrib.staticfiles.finders.FileSystemFinder'],
+        ):
+            call_command('collectstatic', '--noinput', verbosity=0)
+            self.assertLess(os.path.getsize(os.path.join(self.root, 'img', 'logo.png')), original_png)
+            for name in ('img/blog.webp', 'img/blog.avif', 'img/hero.avif', 'img/logo.avif', 'css/site.css.gz'):
+                self.assertTrue(os.path.exists(os.path.join(self.root, name)), name)
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                pass
+            else:
+                self.assertTrue(os.path.exists(os.path.join(self.root, 'css', 'site.css.br')))
+
+            with open(os.path.join(self.root, 'staticfiles.json')) as handle:
+                manifest = json.load(handle)
+            images = manifest['images']
+            # {% static %} এর hash করা ফাইলটিও অপটিমাইজ করা
+            hashed_png = os.path.join(self.root, manifest['paths']['img/logo.png'])
+            self.assertEqual(os.path.getsize(hashed_png), os.path.getsize(os.path.join(self.root, 'img', 'logo.png')))
+            self.assertEqual(images['img/blog.jpg']['size'], [40, 30])
+            self.assertEqual(images['img/hero.webp']['alternates'], {'image/avif': 'img/hero.avif'})
+
+            html = Template(
+                "{% load static_images %}{% static_image 'img/blog.jpg' alt='Blog' class='img-fluid' %}"
+            ).render(Context())
+        self.assertRegex(html, r'^<picture><source srcset="/static/img/blog\.[0-9a-f]{12}\.avif" type="image/avif">')
+        self.assertIn('type="image/webp"', html)
+        self.assertIn('width="40" height="30"', html)
+        self.assertIn('class="img-fluid" loading="lazy"', html)
+
+        # manifest ছাড়া (ডেভেলপমেন্ট) সাধারণ <img>
+        html = Template("{% load static_images %}{% static_image 'img/blog.jpg' data_aos='fade' %}").render(Context())
+        self.assertEqual(
+            html, '<img src="/static/img/blog.jpg" data-aos="fade" alt="" loading="lazy" decoding="async">'
+        )
+
+
+class PrerenderedPageTests(TestCase):
+    """মার্কেটিং পেজ আগে থেকে রেন্ডার করা HTML থেকে (`pages.prerender`), ভিউ ছাড়া।"""
+
+    def setUp(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, ignore_errors=True)
+        override = override_settings(
+            PRERENDER_PAGES=True, PRERENDER_ROOT=root,
+            PRERENDER_CHECK_INTERVAL=0, PRERENDER_BACKGROUND_REBUILD=False,
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        prerender.reset()
+        self.addCleanup(prerender.reset)
+
+    def test_pages_are_served_without_the_view(self):
+        call_command('prerender_pages', stdout=StringIO())
+        expected = self.client.get('/about/').content  # প্রথম রিকোয়েস্ট build টি পড়ে নেয়
+        with mock.patch('pages.views.render', side_effect=AssertionError('view called')):
+            response = self.client.get('/about/', HTTP_ACCEPT_ENCODING='gzip, br')
+            self.assertEqual(response['Content-Encoding'], 'br')
+            self.assertEqual(response['Vary'], 'Accept-Encoding')
+            import brotli
+            self.assertEqual(brotli.decompress(response.content), expected)
+            self.assertIn(b'<html', expected)
+
+            plain = self.client.get('/about/')
+            self.assertNotIn('Content-Encoding', plain)
+            self.assertRegex(plain['ETag'], r'^"[0-9a-f]{32}"$')
+            # অন্য encoding এর কপির ETag দিয়েও 304
+            self.assertEqual(self.client.get('/about/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+            self.assertEqual(self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')['Content-Encoding'], 'gzip')
+
+    def test_template_change_triggers_rebuild(self):
+        self.client.get('/')  # manifest নেই — প্রথম check এ build
+        built = prerender.load_manifest()
+        self.assertEqual(len(built['pages']), len(prerender.PAGES))
+
+        template = os.path.join(prerender.template_dirs()[0], 'pages', 'contact.html')
+        stat_result = os.stat(template)
+        os.utime(template, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        self.addCleanup(os.utime, template, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        with self.assertRaises(CommandError):
+            call_command('prerender_pages', '--check')
+
+        self.assertEqual(self.client.get('/contact/').status_code, 200)
+        self.assertNotEqual(prerender.load_manifest()['fingerprint'], built['fingerprint'])
+        call_command('prerender_pages', '--check', stdout=StringIO())
+
+
+class MemberCacheTests(MemberTestCase):
+    """সদস্য ডিরেক্টরির versioned cache এবং invalidation।"""
+
+    def test_api_list_served_from_cache_until_member_changes(self):
+        member = make_member(name='Cached Person')
+        url = reverse('pages:member-api-list')
+        self.client.get(url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).json()[0]['name'], 'Cached Person')
+
+        member.name = 'Renamed Person'
+        member.save()
+        self.assertEqual(self.client.get(url).json()[0]['name'], 'Renamed Person')
+
+    def test_directory_page_cache_and_admin_bulk_action(self):
+        member = make_member(name='Visible Person')
+        self.client.get(reverse('pages:sodosso'))
+        with self.assertNumQueries(0):
+            self.assertContains(self.client.get(reverse('pages:sodosso')), 'Visible Person')
+
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+        self.client.post(reverse('admin:pages_member_changelist'), {
+            'action': 'deactivate_members', '_selected_action': [member.pk],
+        })
+        tasks.run_pending()  # bulk অ্যাকশন ব্যাকগ্রাউন্ড জব হিসেবে চলে
+        self.assertNotContains(self.client.get(reverse('pages:sodosso')), 'Visible Person')
+
+        # প্রতিটি পেজ রিকোয়েস্টে তিনটি lookup: conditional GET এর অবস্থা, রেন্ডার করা HTML এবং সদস্য সংখ্যা;
+        # অ্যাডমিনের paginator ও মোট সংখ্যা cache থেকে পড়ে
+        stats = self.client.get(reverse('pages:member-api-cache-stats')).json()
+        self.assertEqual((stats['hits'], stats['misses']), (3, 6))
+
+
+class MemberConditionalGetTests(MemberTestCase):
+    """ETag / Last-Modified দিয়ে conditional GET।"""
+
+    def test_list_and_directory_return_304_until_changed(self):
+        member = make_member()
+        for url in (reverse('pages:member-api-list'), reverse('pages:sodosso')):
+            response = self.client.get(url)
+            etag = response['ETag']
+            with self.assertNumQueries(0):
+                self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+            response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+            self.assertEqual(response.status_code, 304)
+
+        etag = self.client.get(reverse('pages:member-api-list'))['ETag']
+        make_member(name='Another Member')
+        response = self.client.get(reverse('pages:member-api-list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+
+        response = self.client.get(reverse('pages:member-api-list'), {'role': 'Member'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_retrieve_uses_member_updated_at(self):
+        member = make_member()
+        url = reverse('pages:member-api-detail', args=[member.pk])
+        response = self.client.get(url)
+        etag = response['ETag']
+        # ভেতরের কলামগুলো পাবলিক API তে নেই
+        self.assertFalse({'image_status', 'image_hash', 'image_derivatives', 'role_rank', 'area_ref'} & response.json().keys())
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        member.bio = 'Changed'
+        member.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(self.client.get(reverse('pages:member-api-detail', args=[0])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('pages:member-api-detail', args=['abc'])).status_code, 404)
+
+
+class MemberDetailFragmentTests(MemberTestCase):
+    """তালিকা পেজের মডাল on-demand fragment থেকে; বিস্তারিত পেজের নিজস্ব টেমপ্লেট।"""
+
+    def test_list_page_links_fragments_instead_of_rendering_modals(self):
+        member = make_member(name='Modal Person', bio='A long biography')
+        response = self.client.get(reverse('pages:sodosso'))
+        self.assertContains(response, 'id="memberModal"', count=1)
+        self.assertNotContains(response, f'memberModal{member.pk}')
+        self.assertContains(response, f'data-fragment-url="{member.get_fragment_url()}"')
+
+        response = self.client.get(member.get_fragment_url())
+        self.assertContains(response, 'Modal Person')
+        self.assertContains(response, 'A long biography')
+        self.assertNotContains(response, '<html')
+        self.assertIn('max-age=', response['Cache-Control'])
+        self.assertEqual(self.client.get(member.get_fragment_url(), HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+    def test_fragment_is_cached_per_member_version(self):
+        member = make_member(name='Cached Person')
+        url = reverse('pages:sodosso-fragment', args=[member.pk])
+        self.assertContains(self.client.get(url), 'Cached Person')
+        # updated_at না বদলালে cache করা fragment
+        Member.objects.filter(pk=member.pk).update(name='Renamed Quietly')
+        self.assertContains(self.client.get(url), 'Cached Person')
+        self.assertNotIn('max-age', self.client.get(url).get('Cache-Control', ''))
+
+        member.refresh_from_db()
+        member.name = 'Renamed Person'
+        member.save()
+        self.assertContains(self.client.get(url), 'Renamed Person')
+        detail = self.client.get(reverse('pages:sodosso-detail', args=[member.pk]))
+        self.assertTemplateUsed(detail, 'pages/member-detail.html')
+        self.assertContains(detail, 'Renamed Person')
+
+        member.is_active = False
+        member.save()
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+
+class MemberExportTests(MemberTestCase):
+    """CSV / NDJSON streaming export।"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        make_member(name='করিম, "বড়"', role='Committee', area='Mirpur')
+        make_member(name='Inactive Person', is_active=False)
+
+    def test_csv_export_streams_with_filters(self):
+        response = self.client.get(reverse('pages:member-api-export', args=['csv']), {'is_active': 'all'})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.reader(b''.join(response.streaming_content).decode('utf-8-sig').splitlines()))
+        self.assertEqual(rows[0][:3], ['id', 'name', 'role'])
+        self.assertEqual([row[1] for row in rows[1:]], ['করিম, "বড়"', 'Inactive Person'])
+
+    def test_csv_export_escapes_formulas(self):
+        make_member(name='=HYPERLINK("http://evil.example")', bio='@SUM(A1)', phone='+8801711000000')
+        response = self.client.get(reverse('pages:member-api-export', args=['csv']))
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode('utf-8-sig').splitlines()))
+        row = next(row for row in rows if 'HYPERLINK' in row['name'])
+        self.assertEqual(row['name'], '\'=HYPERLINK("http://evil.example")')
+        self.assertEqual(row['bio'], "'@SUM(A1)")
+        self.assertEqual(row['phone'], "'+8801711000000")
+        # NDJSON স্প্রেডশিটে খোলা হয় না — মান অপরিবর্তিত
+        ndjson = self.client.get(reverse('pages:member-api-export', args=['ndjson']))
+        self.assertIn('"=HYPERLINK', b''.join(ndjson.streaming_content).decode())
+
+    def test_ndjson_export_uses_list_filters(self):
+        response = self.client.get(reverse('pages:member-api-export', args=['ndjson']), {'role': 'Committee'})
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual([row['role'] for row in rows], ['Committee'])
+
+    def test_export_requires_admin(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse('pages:member-api-export', args=['csv'])).status_code, 403)
+
+    def test_command_uses_same_filters_as_api(self):
+        member = Member.objects.get(role='Committee')
+        AreaAlias.objects.create(area=member.area_ref, name='মিরপুর')
+        output = StringIO()
+        with mock.patch('sys.stdout', output):
+            call_command('export_members', '--format', 'ndjson', '--area', 'মিরপুর')
+        api = self.client.get(reverse('pages:member-api-export', args=['ndjson']), {'area': 'মিরপুর'})
+        self.assertEqual(output.getvalue(), b''.join(api.streaming_content).decode())
+        self.assertEqual([json.loads(line)['id'] for line in output.getvalue().splitlines()], [member.pk])
+
+
+class MemberBulkApiTests(MemberTestCase):
+    """bulk create / update এন্ডপয়েন্ট।"""
+
+    url = reverse_lazy('pages:member-api-bulk')
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def test_bulk_requires_admin(self):
+        self.client.logout()
+        row = {'name': 'Anonymous', 'role': 'Member', 'area': 'Mirpur', 'phone': '+8801900000001'}
+        response = self.client.post(self.url, [row], content_type='application/json')
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Member.objects.exists())
+
+    def test_bulk_create_reports_row_errors(self):
+        rows = [
+            {'name': 'Bulk One', 'role': 'Member', 'area': 'Mirpur', 'phone': '+8801900000001'},
+            {'name': 'Bad Phone', 'role': 'Member', 'area': 'Mirpur', 'phone': 'abc'},
+            {'name': 'Bulk Two', 'role': 'Committee', 'area': 'Uttara', 'phone': '+8801900000002'},
+        ]
+        response = self.client.post(self.url, rows, content_type='application/json')
+        self.assertEqual(response.status_code, 207)
+        body = response.json()
+        self.assertEqual(body['count'], 2)
+        self.assertEqual([error['index'] for error in body['errors']], [1])
+        self.assertIn('phone', body['errors'][0]['errors'])
+        self.assertEqual(Member.objects.count(), 2)
+
+        # সার্চ ইনডেক্সও আপডেট হয়েছে
+        found = self.client.get(reverse('pages:member-api-list'), {'search': 'uttara'}).json()
+        self.assertEqual([row['name'] for row in found], ['Bulk Two'])
+
+    def test_bulk_update(self):
+        first, second = make_member(name='First'), make_member(name='Second')
+        self.client.get(reverse('pages:member-api-list'))
+        response = self.client.patch(self.url, [
+            {'id': first.pk, 'area': 'Gulshan'},
+            {'id': 0, 'area': 'Nowhere'},
+        ], content_type='application/json')
+        self.assertEqual(response.status_code, 207)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.area, second.area), ('Gulshan', 'Mirpur'))
+        # cache অকেজো হয়েছে
+        areas = {row['area'] for row in self.client.get(reverse('pages:member-api-list')).json()}
+        self.assertEqual(areas, {'Gulshan', 'Mirpur'})
+
+    def test_bulk_update_accepts_string_ids(self):
+        first, second = make_member(name='First'), make_member(name='Second')
+        response = self.client.patch(self.url, [
+            {'id': str(first.pk), 'area': 'Gulshan'},
+            {'id': f'{second.pk}.5', 'area': 'Nowhere'},
+            {'id': True, 'area': 'Nowhere'},
+            {'id': first.pk, 'area': 'Banani'},
+        ], content_type='application/json')
+        body = response.json()
+        self.assertEqual(body['count'], 1)
+        self.assertEqual([error['index'] for error in body['errors']], [1, 2, 3])
+        self.assertEqual(body['errors'][2]['errors'], {'id': ['Duplicate id.']})
+        self.assertEqual(Member.objects.get(pk=first.pk).area, 'Gulshan')
+
+    def test_bulk_update_rejects_duplicate_ids(self):
+        member = make_member()
+        response = self.client.patch(self.url, [
+            {'id': member.pk, 'is_active': False},
+            {'id': member.pk, 'is_active': False},
+        ], content_type='application/json')
+        self.assertEqual(response.status_code, 207)
+        body = response.json()
+        self.assertEqual(body['count'], 1)
+        self.assertEqual(body['errors'], [{'index': 1, 'errors': {'id': ['Duplicate id.']}}])
+        # পরিসংখ্যানে সদস্যটি একবারই সরেছে
+        self.assertEqual(sorted(MemberStat.objects.values_list('is_active', 'count')), [(False, 1), (True, 0)])
+
+
+class MemberStatsTests(MemberTestCase):
+    """সদস্য পরিসংখ্যানের সারাংশ টেবিল incremental ভাবে সদস্য টেবিলের সাথে মিলে থাকে।"""
+
+    def assertInSync(self):
+        stored = {(s.role, s.area, s.is_active): s.count for s in MemberStat.objects.filter(count__gt=0)}
+        self.assertEqual(stored, count_members())
+
+    def test_save_delete_bulk_and_admin_actions(self):
+        first = make_member(role='President', area='Uttara')
+        second = make_member()
+        self.assertInSync()
+
+        second = Member.objects.get(pk=second.pk)
+        second.role, second.area = 'Secretary', 'Banani'
+        second.save()
+        self.client.post(reverse('pages:member-api-toggle-active', args=[first.pk]))
+        self.assertInSync()
+
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(admin_user)
+        self.client.post(reverse('pages:member-api-bulk'), [
+            {'name': 'Bulk', 'role': 'Member', 'area': 'Mirpur', 'phone': '+8801900000001'},
+        ], content_type='application/json')
+        response = self.client.patch(reverse('pages:member-api-bulk'), [{'id': second.pk, 'is_active': False}],
+                                     content_type='application/json')
+        self.assertEqual(response.json()['count'], 1)
+        self.assertInSync()
+
+        self.client.post(reverse('admin:pages_member_changelist'), {
+            'action': 'activate_members', '_selected_action': list(Member.objects.values_list('pk', flat=True)),
+        })
+        tasks.run_pending()
+        self.assertInSync()
+        first.delete()
+        self.assertInSync()
+
+        with CaptureQueriesContext(connection) as queries:
+            stats = self.client.get(reverse('pages:member-api-stats')).json()
+        self.assertFalse([q for q in queries if '"pages_member"' in q['sql'] and 'updated_at' not in q['sql']])
+        self.assertEqual((stats['total'], stats['active'], stats['inactive']), (2, 2, 0))
+        self.assertEqual(stats['roles']['Secretary'], {'active': 1, 'inactive': 0})
+        self.assertEqual(stats['areas']['Banani'], {'active': 1, 'inactive': 0})
+        self.assertEqual(Member.active_count(), 2)
+
+    def test_rebuild_reconciles_drift(self):
+        make_member(area='Uttara')
+        Member.objects.update(area='Gulshan')  # সিগন্যাল ছাড়া — সারাংশ পুরনো
+        self.assertEqual(rebuild(dry_run=True), {
+            ('Member', 'Uttara', True): (1, 0), ('Member', 'Gulshan', True): (0, 1),
+        })
+        self.assertIn('Uttara', get_stats()['areas'])
+        rebuild()
+        self.assertInSync()
+        self.assertEqual(list(get_stats()['areas']), ['Gulshan'])
+        self.assertEqual(rebuild(), {})
+
+
+class MemberOrderingTests(MemberTestCase):
+    """পদের ক্রম (`role_rank`): সব তালিকা একই ক্রমে, এবং ক্রমটি ইনডেক্স থেকে (sort ছাড়া)।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for role in ('Member', 'Committee', 'Treasurer', 'Secretary', 'President'):
+            make_member(name=f'{role} One', role=role)
+            make_member(name=f'{role} Two', role=role)
+
+    def test_roles_follow_hierarchy_everywhere(self):
+        hierarchy = [role for role, _ in Member.ROLE_CHOICES]
+        response = self.client.get(reverse('pages:member-api-list'))
+        self.assertEqual(list(dict.fromkeys(row['role'] for row in response.json())), hierarchy)
+        response = self.client.get(reverse('pages:member-api-list'), {'ordering': '-role'})
+        self.assertEqual(list(dict.fromkeys(row['role'] for row in response.json())), hierarchy[::-1])
+
+        member = Member.objects.get(name='Member One')
+        member.role = 'President'
+        member.save()
+        update_members(Member.objects.filter(name='Member Two'), role='Secretary')
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        self.client.patch(reverse('pages:member-api-bulk'), [
+            {'id': Member.objects.get(name='Committee One').pk, 'role': 'Treasurer'},
+        ], content_type='application/json')
+        ranks = dict(Member.objects.values_list('name', 'role_rank'))
+        self.assertEqual(
+            (ranks['Member One'], ranks['Member Two'], ranks['Committee One']),
+            (Member.rank_for_role('President'), Member.rank_for_role('Secretary'), Member.rank_for_role('Treasurer')),
+        )
+
+    def test_directory_queries_do_not_sort(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        first = self.client.get(reverse('pages:member-api-list'), {'cursor': '', 'page_size': 3}).json()
+        second = self.client.get(first['next']).json()
+        requests = [
+            (reverse('pages:sodosso'), {}),
+            (reverse('pages:sodosso'), {'role': 'Committee'}),
+            (reverse('pages:member-api-list'), {'cursor': '', 'page_size': 3}),
+            (first['next'], {}),
+            (second['previous'], {}),
+            (reverse('pages:member-api-by-role'), {'role': 'Treasurer'}),
+            (reverse('pages:member-async-list'), {'cursor': '', 'role': 'Secretary'}),
+            (reverse('admin:pages_member_changelist'), {}),
+            (reverse('admin:pages_member_changelist'), {'role__exact': 'President'}),
+        ]
+        for url, params in requests:
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get(url, params).status_code, 200)
+            listed = [q['sql'] for q in queries if q['sql'].startswith('SELECT') and 'FROM "pages_member"' in q['sql']
+                      and 'ORDER BY' in q['sql']]
+            self.assertTrue(listed, url)
+            for sql in listed:
+                with connection.cursor() as cursor:
+                    cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                    plan = ' '.join(row[-1] for row in cursor.fetchall())
+                self.assertNotIn('TEMP B-TREE', plan, (url, params, sql))
+
+
+@override_settings(MEMBER_SUGGEST_BACKGROUND_REBUILD=False)
+class MemberSuggestTests(MemberTestCase):
+    """`/api/members/suggest/`: মেমোরির prefix ইনডেক্স, সিগন্যালে incremental আপডেট।"""
+
+    url = reverse_lazy('pages:member-api-suggest')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.karim = make_member(name='Abdul Karim', role='President', area='Mirpur 10')
+        cls.karima = make_member(name='Karima Begum', area='Uttara')
+        cls.bangla = make_member(name='মোহাম্মদ করিম', area='খুলনা')
+        make_member(name='Karim Inactive', is_active=False)
+
+    def names(self, query, **params):
+        return [row['name'] for row in self.client.get(self.url, {'q': query, **params}).json()]
+
+    def test_prefixes_in_bangla_and_latin_ranked_by_role(self):
+        self.assertEqual(self.names('kar'), ['Abdul Karim', 'Karima Begum'])
+        self.assertEqual(self.names('KARIM'), ['Abdul Karim', 'Karima Begum'])
+        self.assertEqual(self.names('করি'), ['মোহাম্মদ করিম'])
+        self.assertEqual(self.names('খুল'), ['মোহাম্মদ করিম'])
+        self.assertEqual(self.names('abd mirpur-1'), ['Abdul Karim'])
+        self.assertEqual(self.names('kar', limit=1), ['Abdul Karim'])
+        self.assertEqual(self.names(''), [])
+        row = self.client.get(self.url, {'q': 'utt'}).json()[0]
+        self.assertEqual(row, {'id': self.karima.pk, 'name': 'Karima Begum', 'role': 'Member', 'area': 'Uttara'})
+
+    def test_added_members_keep_list_order(self):
+        self.assertEqual(self.names('kar'), ['Abdul Karim', 'Karima Begum'])
+        with self.captureOnCommitCallbacks(execute=True):
+            make_member(name='Aaron Karim')
+            make_member(name='Zakir Karim', role='Secretary')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names('kar'), ['Abdul Karim', 'Zakir Karim', 'Aaron Karim', 'Karima Begum'])
+            self.assertEqual(self.names('kar begum'), ['Karima Begum'])
+
+    def test_index_follows_signals_and_bulk_updates(self):
+        self.assertEqual(self.names('kar'), ['Abdul Karim', 'Karima Begum'])
+        with self.captureOnCommitCallbacks(execute=True):
+            newcomer = make_member(name='Karimullah', role='Secretary')
+            self.karima.name = 'Rokeya Begum'
+            self.karima.save()
+            self.karim.delete()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names('kar'), ['Karimullah'])
+            self.assertEqual(self.names('rok'), ['Rokeya Begum'])
+
+        # queryset.update() এ সিগন্যাল নেই (অ্যাডমিন অ্যাকশনের মতো শুধু generation বাড়ে) —
+        # ইনডেক্সের generation মেলে না, তাই নতুন করে তৈরি হয়
+        update_members(Member.objects.filter(pk=newcomer.pk), is_active=False)
+        bump_generation()
+        self.assertEqual(self.names('kar'), [])
+
+
+class MemberAreaTests(MemberTestCase):
+    """এলাকা normalized `Area` টেবিলে; `?area=` নাম/alias/আংশিক মিলে FK দিয়ে ফিল্টার করে।"""
+
+    def test_spellings_and_aliases_share_one_area(self):
+        first = make_member(name='First', area='Mirpur-10')
+        second = make_member(name='Second', area=' mirpur 10 ')
+        AreaAlias.objects.create(area=first.area_ref, name='মিরপুর ১০')
+        third = make_member(name='Third', area='মিরপুর-১০')
+        make_member(name='Other', area='Uttara')
+        self.assertEqual({first.area_ref_id, second.area_ref_id, third.area_ref_id}, {first.area_ref_id})
+        self.assertEqual({second.area, third.area}, {'Mirpur-10'})
+
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        self.client.post(reverse('pages:member-api-bulk'), [
+            {'name': 'Bulk', 'role': 'Member', 'area': 'MIRPUR10', 'phone': '+8801900000001'},
+        ], content_type='application/json')
+        self.assertEqual(Member.objects.get(name='Bulk').area_ref_id, first.area_ref_id)
+        self.assertEqual(Area.objects.count(), 2)
+
+    def test_area_filter_uses_foreign_key(self):
+        make_member(name='Ten', area='Mirpur 10')
+        make_member(name='Two', area='Mirpur 2')
+        make_member(name='Far', area='Uttara')
+        url = reverse('pages:member-api-list')
+        for area, expected in (('mirpur-10', ['Ten']), ('MIRPUR 2', ['Two']), ('mirpur', ['Ten', 'Two']), ('nowhere', [])):
+            with CaptureQueriesContext(connection) as queries:
+                names = sorted(row['name'] for row in self.client.get(url, {'area': area}).json())
+            self.assertEqual(names, expected, area)
+            member_query = next(q['sql'] for q in queries if q['sql'].startswith('SELECT "pages_member"'))
+            self.assertIn('"area_ref_id" IN', member_query)
+            self.assertNotIn('"pages_member"."area" LIKE', member_query)
+
+        response = self.client.get(reverse('pages:sodosso'), {'area': 'Mirpur-10'})
+        self.assertContains(response, 'Ten')
+        self.assertNotContains(response, 'Uttara')
+
+
+class MemberAdminLargeTableTests(MemberTestCase):
+    """বড় টেবিল মোডের অ্যাডমিন: সদস্য টেবিলে COUNT/DISTINCT/LIKE scan নেই, bulk অ্যাকশন জবে।"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        self.url = reverse('admin:pages_member_changelist')
+
+    def member_table_scans(self, queries):
+        # সদস্য টেবিলে সীমাহীন COUNT, DISTINCT বা LIKE কোয়েরি
+        return [
+            q['sql'] for q in queries if '"pages_member"' in q['sql']
+            and (('COUNT(' in q['sql'] and 'LIMIT' not in q['sql']) or 'DISTINCT' in q['sql'] or ' LIKE ' in q['sql'])
+        ]
+
+    def test_changelist_counts_filters_and_search_use_indexes(self):
+        rahim = make_member(name='Rahim Uddin', area='Uttara', phone='+8801711111111')
+        make_member(name='Karim Mia', area='Uttara Sector 7', is_active=False)
+        make_member(name='Jamal Hossain', area='Banani', role='President')
+        AreaAlias.objects.create(area=rahim.area_ref, name='উত্তরা')
+
+        for params, expected in (
+            ({}, 3), ({'area': 'Uttara'}, 1), ({'area': 'UTTARA'}, 1), ({'area': 'উত্তরা'}, 1),
+            ({'is_active__exact': '0'}, 1),
+            ({'q': 'rahim'}, 1), ({'q': '01711111111'}, 1), ({'q': 'nobody'}, 0),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(self.url, params)
+            self.assertEqual(response.context['cl'].result_count, expected, params)
+            self.assertEqual(self.member_table_scans(queries), [], params)
+        self.assertContains(response, 'area-autocomplete-filter')
+
+        response = self.client.get(reverse('admin:pages_member_area_autocomplete'), {'term': 'Utt'})
+        self.assertEqual([row['id'] for row in response.json()['results']], ['Uttara', 'Uttara Sector 7'])
+
+    def test_small_bulk_deactivate_runs_immediately(self):
+        members = [make_member(name=f'Member {n}') for n in range(3)]
+        response = self.client.post(self.url, {
+            'action': 'deactivate_members', '_selected_action': [m.pk for m in members[:2]],
+        }, follow=True)
+        self.assertContains(response, '2 members deactivated successfully.')
+        self.assertFalse(MemberBulkUpdate.objects.exists())
+        self.assertEqual(Member.objects.filter(is_active=True).count(), 1)
+        self.assertEqual(get_stats()['inactive'], 2)
+
+    @override_settings(MEMBER_BULK_CHUNK_SIZE=2)
+    def test_bulk_deactivate_runs_as_chunked_job(self):
+        members = [make_member(name=f'Member {n}') for n in range(5)]
+        response = self.client.post(self.url, {
+            'action': 'deactivate_members', '_selected_action': [m.pk for m in members],
+        }, follow=True)
+        self.assertContains(response, '5 members will be deactivated in the background')
+        self.assertEqual(Member.objects.filter(is_active=True).count(), 5)
+
+        job = MemberBulkUpdate.objects.get()
+        self.assertEqual((job.total, job.processed, job.status), (5, 0, Task.PENDING))
+        self.assertEqual(job.filters, {'pk__in': [m.pk for m in members]})
+        self.assertEqual(tasks.run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.processed, job.progress, job.status), (5, 100, Task.DONE))
+        self.assertEqual(job.cursor, members[-1].pk)
+        self.assertFalse(Member.objects.filter(is_active=True).exists())
+        self.assertEqual(get_stats()['inactive'], 5)
+
+    @override_settings(MEMBER_BULK_CHUNK_SIZE=2)
+    def test_select_across_job_stores_filters_not_ids(self):
+        members = [make_member(name=f'Member {n}', area='Uttara') for n in range(4)]
+        make_member(name='Elsewhere', area='Mirpur')
+        make_member(name='Committee Uttara', role='Committee', area='Uttara')
+        response = self.client.post(f'{self.url}?role__exact=Member&area=UTTARA&q=member', {
+            'action': 'deactivate_members', 'select_across': '1', '_selected_action': [members[0].pk],
+        }, follow=True)
+        self.assertContains(response, '4 members will be deactivated in the background')
+        job = MemberBulkUpdate.objects.get()
+        self.assertEqual(job.filters, {
+            'role': 'Member', 'role_rank': Member.rank_for_role('Member'), 'area_ref__in': [members[0].area_ref_id],
+        })
+        self.assertEqual((job.search, job.last_pk, job.total), ('member', members[-1].pk, 4))
+
+        # জব তৈরির পরে যোগ হওয়া সদস্য (`last_pk` এর পরে) বাদ পড়ে
+        make_member(name='Member Late', area='Uttara')
+        self.assertEqual(tasks.run_pending(), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.processed, job.status), (4, Task.DONE))
+        self.assertEqual(
+            set(Member.objects.filter(is_active=False).values_list('pk', flat=True)), {m.pk for m in members},
+        )
+
+
+class MemberBenchmarkTests(TempMediaMixin, MemberTestCase):
+    """seed ডেটা এবং বেঞ্চমার্ক suite এর কোয়েরি-সংখ্যা সীমা।"""
+
+    def test_seeded_directory_stays_within_query_budgets(self):
+        self.assertEqual(seed_members(60, seed=1), 60)
+        self.assertTrue(Member.objects.filter(name__regex=r'[\u0980-\u09FF]').exists())
+        User.objects.create_superuser('bench', 'bench@example.com', 'pass')
+
+        report = run_benchmarks(iterations=1)
+        self.assertEqual(report['failures'], [])
+        self.assertEqual({result['status'] for result in report['results'].values()}, {'ok'})
+        self.assertEqual(json.loads(json.dumps(report))['meta']['members'], 60)
+
+
+@override_settings(METRICS_TOKEN='scrape-secret', METRICS_ALLOWED_IPS=[])
+class MetricsTests(MemberTestCase):
+    """ভিউ ভিত্তিক মেট্রিক এবং Prometheus এন্ডপয়েন্ট।"""
+
+    def setUp(self):
+        super().setUp()
+        metrics.registry.reset()
+        make_member()
+
+    def scrape(self):
+        response = self.client.get(reverse('pages:metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response['Content-Type'], metrics.CONTENT_TYPE)
+        return response.content.decode()
+
+    def test_views_are_recorded(self):
+        self.client.get(reverse('pages:sodosso'))
+        self.client.get(reverse('pages:member-api-list'))
+        body = self.scrape()
+        self.assertIn(
+            'somiti_http_requests_total{view="pages:member-api-list",method="GET",status="200"} 1', body
+        )
+        self.assertIn('somiti_http_request_duration_seconds_count{view="pages:sodosso"} 1', body)
+        self.assertIn('somiti_http_request_duration_seconds_bucket{view="pages:sodosso",le="+Inf"} 1', body)
+        self.assertRegex(body, r'somiti_db_queries_total\{view="pages:member-api-list"\} [1-9]')
+        self.assertRegex(body, r'somiti_template_render_seconds_total\{view="pages:sodosso"\} 0\.\d*[1-9]')
+        self.assertRegex(body, r'somiti_serializer_seconds_total\{view="pages:member-api-list"\} 0\.\d*[1-9]')
+
+    @override_settings(METRICS_SLOW_REQUEST_MS=0)
+    def test_slow_request_log_includes_sql(self):
+        with self.assertLogs('pages.metrics.slow', 'WARNING') as logs:
+            self.client.get(reverse('pages:member-api-list'))
+        self.assertIn('pages:member-api-list', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    def test_snapshots_from_worker_processes_are_summed(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        other_worker = {
+            'counters': [['somiti_http_requests_total',
+                          [['view', 'pages:sodosso'], ['method', 'GET'], ['status', '200']], 2]],
+            'histograms': [],
+        }
+        live = f'{directory}/metrics-{os.getppid()}-live.json'
+        # বন্ধ হওয়া প্রসেস, এই PID এর আগের প্রসেস এবং পুরনো নামের snapshot
+        stale = [
+            f'{directory}/metrics-999999999-dead.json', f'{directory}/metrics-{os.getpid()}-previous.json',
+            f'{directory}/metrics-{os.getpid()}.json',
+        ]
+        for path in [live] + stale:
+            with open(path, 'w') as handle:
+                json.dump(other_worker, handle)
+        total = 'somiti_http_requests_total{view="pages:sodosso",method="GET",status="200"} 9'
+        with override_settings(METRICS_DIR=directory):
+            self.client.get(reverse('pages:sodosso'))
+            self.assertIn(total, self.scrape())
+            self.assertTrue(os.path.exists(live))
+            self.assertFalse(any(os.path.exists(path) for path in stale))
+            # মৃত প্রসেসের মান `dead-processes.json` এ থেকে যায় — counter কমে না
+            self.assertIn(total, self.scrape())
+
+    def test_endpoint_requires_token_or_staff(self):
+        url = reverse('pages:metrics')
+        # proxy এর পেছনে সব রিকোয়েস্ট 127.0.0.1 থেকে — সেটি যথেষ্ট নয়
+        self.assertEqual(self.client.get(url, REMOTE_ADDR='127.0.0.1').status_code, 403)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        with override_settings(METRICS_ALLOWED_IPS=['10.0.0.5']):
+            self.assertEqual(self.client.get(url, REMOTE_ADDR='10.0.0.5').status_code, 200)
+        self.client.force_login(User.objects.create_user('staff', password='password', is_staff=True))
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+
+class AsyncMemberViewTests(MemberTestCase):
+    """async (ASGI) ভিউগুলোর আউটপুট DRF ভিউসেটের সমান।"""
+
+    @classmethod
+    def setUpTestData(cls):
+        for index in range(12):
+            make_member(name=f'Async {index:02d}', role='President' if index % 3 == 0 else 'Member', area='Uttara')
+        make_member(name='Inactive', is_active=False)
+
+    async def assertSameJson(self, sync_url, async_url, key=None):
+        expected = (await self.async_client.get(sync_url)).json()
+        response = await self.async_client.get(async_url)
+        self.assertEqual(response.status_code, 200)
+        actual = response.json()
+        if key:
+            expected, actual = expected[key], actual[key]
+        self.assertEqual(actual, expected)
+        return response
+
+    async def test_api_matches_sync_views(self):
+        sync_list, async_list = reverse('pages:member-api-list'), reverse('pages:member-async-list')
+        await self.assertSameJson(sync_list, async_list)
+        await self.assertSameJson(f'{sync_list}?role=President&ordering=-name', f'{async_list}?role=President&ordering=-name')
+        await self.assertSameJson(f'{sync_list}?search=Async', f'{async_list}?search=Async')
+        response = await self.assertSameJson(
+            f'{sync_list}?cursor=&page_size=5&total=1', f'{async_list}?cursor=&page_size=5&total=1', key='results'
+        )
+        page = response.json()
+        self.assertEqual((page['count'], page['count_is_exact']), (12, True))
+        self.assertTrue(page['next'].startswith(f'http://testserver{async_list}?'))
+        second = (await self.async_client.get(page['next'])).json()
+        self.assertEqual(len(second['results']), 5)
+        self.assertEqual((await self.async_client.get(f'{async_list}?cursor=bogus')).status_code, 404)
+
+        member = await Member.objects.aget(name='Async 03')
+        await self.assertSameJson(
+            reverse('pages:member-api-detail', args=[member.pk]), reverse('pages:member-async-detail', args=[member.pk])
+        )
+        await self.assertSameJson(
+            f"{reverse('pages:member-api-by-role')}?role=President", f"{reverse('pages:member-async-by-role')}?role=President"
+        )
+        await self.assertSameJson(reverse('pages:member-api-roles'), reverse('pages:member-async-roles'))
+
+        inactive = await Member.objects.aget(name='Inactive')
+        response = await self.async_client.get(reverse('pages:member-async-detail', args=[inactive.pk]))
+        self.assertEqual(response.status_code, 404)
+        response = await self.async_client.get(reverse('pages:member-async-by-role'))
+        self.assertEqual(response.status_code, 400)
+
+    async def test_conditional_get_and_cache(self):
+        url = reverse('pages:member-async-list')
+        queries_key = ('somiti_db_queries_total', (('view', 'pages:member-async-list'),))
+        metrics.registry.reset()
+        response = await self.async_client.get(url)
+        etag = response['ETag']
+        # async ORM এর কোয়েরিও মেট্রিকে গোনা হয়
+        self.assertGreater(metrics.registry.counters[queries_key], 0)
+        metrics.registry.reset()
+        cached = await self.async_client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(metrics.registry.counters[queries_key], 0)
+
+        await Member.objects.acreate(name='Async new', role='Member', area='Uttara', phone='+8801900000000')
+        response = await self.async_client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Async new', [row['name'] for row in response.json()])
+
+    async def test_directory_page(self):
+        url = reverse('pages:sodosso-async')
+        sync_page = await self.async_client.get(f"{reverse('pages:sodosso')}?search=Async&page=2")
+        cache.clear()
+        response = await self.async_client.get(f'{url}?search=Async&page=2')
+        self.assertEqual(response.content, sync_page.content)
+        response = await self.async_client.get(f'{url}?role=President')
+        self.assertContains(response, 'Async 00')
+        self.assertNotContains(response, 'Async 01')
+        self.assertEqual((await self.async_client.get(f'{url}?search=Async&page=99')).status_code, 200)
+
+
+class ProductionDatabaseProfileTests(TestCase):
+    """প্রোডাকশন SQLite প্রোফাইল: PRAGMA এবং read-only router।"""
+
+    def test_apply_pragmas(self):
+        conn = sqlite3.connect(':memory:')
+        self.addCleanup(conn.close)
+        apply_pragmas(conn, {'cache_size': -4000, 'busy_timeout': 1234})
+        self.assertEqual(conn.execute('PRAGMA cache_size').fetchone()[0], -4000)
+        self.assertEqual(conn.execute('PRAGMA busy_timeout').fetchone()[0], 1234)
+        with self.assertRaises(ValueError):
+            apply_pragmas(conn, {'cache_size; DROP TABLE x': 1})
+
+    def test_router_sends_only_get_member_reads_to_read_only_alias(self):
+        router = ReadOnlyRouter()
+        with mock.patch('pages.db._read_only_alias_available', return_value=True):
+            self.assertIsNone(router.db_for_read(Member))
+            with read_only_request():
+                self.assertEqual(router.db_for_read(Member), 'readonly')
+                self.assertIsNone(router.db_for_read(Task))
+                self.assertEqual(router.db_for_write(Member), 'default')
+        # alias কনফিগার না থাকলে (ডিফল্ট প্রোফাইল) সব default এ
+        with read_only_request():
+            self.assertIsNone(router.db_for_read(Member))
+        self.assertFalse(router.allow_migrate('readonly', 'pages'))
@@ -1,7 +1,7 @@
 # pages/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import async_views, views
 
 # অ্যাপের নাম সেট করা হয়েছে, যাতে টেমপ্লেটে URL সহজে কল করা যায়।
 # যেমন: {% url 'pages:home' %} 
@@ -37,9 +37,24 @@ urlpatterns = [
     # নির্দিষ্ট সদস্যের বিস্তারিত তথ্য দেখানোর জন্য। যেমন: /sodosso/5/
     path('sodosso/<int:pk>/', views.member_detail_view, name='sodosso-detail'),
 
+    # তালিকা পেজের মডালের জন্য সদস্যের বিস্তারিত HTML fragment। যেমন: /sodosso/5/fragment/?v=...
+    path('sodosso/<int:pk>/fragment/', views.member_fragment_view, name='sodosso-fragment'),
+
+    # async (ASGI) সংস্করণ — event loop এই চলে (`pages.async_views`)। যেমন: /sodosso/async/
+    path('sodosso/async/', async_views.sodosso_async_view, name='sodosso-async'),
+
+    # --- মনিটরিং (Prometheus) ---
+    path('metrics/', views.metrics_view, name='metrics'),
+
     # --- API ভিউয়ের জন্য URL ---
     # /api/ এর অধীনে সকল API এন্ডপয়েন্ট অন্তর্ভুক্ত করা হয়েছে।
     # যেমন: /api/members/, /api/members/1/, ইত্যাদি।
+    # async (ASGI) API — `/api/members/` এর hot read এন্ডপয়েন্টগুলোর একই আউটপুট।
+    # router এর আগে রাখা হয়েছে, যাতে `members/<pk>/` প্যাটার্ন এগুলোকে না ধরে।
+    path('api/async/members/', async_views.member_list_view, name='member-async-list'),
+    path('api/async/members/roles/', async_views.member_roles_view, name='member-async-roles'),
+    path('api/async/members/by-role/', async_views.member_by_role_view, name='member-async-by-role'),
+    path('api/async/members/<int:pk>/', async_views.member_detail_api_view, name='member-async-detail'),
     path('api/', include(router.urls)),
 ]
 
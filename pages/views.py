@@ -1,15 +1,31 @@
 # pages/views.py
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse, HttpResponseForbidden, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
 from django.core.paginator import Paginator
-from django.db.models import Q
-from rest_framework import viewsets, filters, status
+from django.utils.cache import patch_cache_control
+from django.utils.crypto import constant_time_compare
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
+from .bulk import MAX_ROWS as BULK_MAX_ROWS, bulk_create_members, bulk_update_members
+from .cache import get_cache_stats, get_or_build, normalize_params
+from .conditional import directory_validators, object_validators, respond_conditionally
+from . import metrics
 from .models import Member
+from .exports import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, stream_export
+from .areas import matching_areas
+from .filters import MemberSearchFilter, MemberOrderingFilter, filter_members, filter_role
+from .pagination import InvalidCursor, KeysetPaginator, MemberCursorPagination
+from .search import search_members
+from .suggest import DEFAULT_LIMIT as SUGGEST_LIMIT, suggest as suggest_members
+from .stats import active_count, get_stats
 from .serializers import (
     MemberSerializer, 
     MemberListSerializer, 
+    MemberListRowSerializer,
     MemberDetailSerializer
 )
 
@@ -50,53 +66,180 @@ def contact_view(request):
 
 # --- সদস্যদের তালিকা এবং বিস্তারিত তথ্যের জন্য ভিউ --- 
 
+# সদস্য তালিকা পেজে প্রতি পেজে কতজন সদস্য দেখানো হবে।
+MEMBERS_PER_PAGE = 8
+
+# যে কোয়েরি প্যারামিটারগুলো সদস্য তালিকা পেজের cache key তে ধরা হয়।
+SODOSSO_CACHE_PARAMS = ('search', 'role', 'area', 'page', 'cursor')
+
 def sodosso_view(request):
     """
     সদস্যদের তালিকা দেখানোর জন্য এই ভিউ ব্যবহার করা হয়।
     এতে সার্চ, ফিল্টারিং এবং পেজিনেশন কার্যকারিতা অন্তর্ভুক্ত রয়েছে।
+    রেন্ডার করা HTML কোয়েরি অনুযায়ী cache করা থাকে; কোনো সদস্য বদলালে cache অকেজো হয় (`pages.cache`)।
+    """
+    redirect = legacy_page_redirect(request)
+    if redirect is not None:
+        return redirect
+    params = normalize_params(request.GET, SODOSSO_CACHE_PARAMS)
+    # ক্লায়েন্টের কাছে থাকা কপি অপরিবর্তিত হলে রেন্ডার ছাড়াই 304 (`pages.conditional`)
+    return respond_conditionally(
+        request,
+        directory_validators('sodosso', params),
+        lambda: HttpResponse(get_or_build('sodosso', params, lambda: render_sodosso_page(request).content)),
+    )
+
+def sodosso_members(request):
+    """
+    সদস্য তালিকা পেজের queryset, সার্চ শব্দ এবং পদবি ফিল্টার: `(members, search_query, role_filter)`।
+    sync এবং async (`pages.async_views`) দুই ভিউই এটি ব্যবহার করে।
     """
     # শুধুমাত্র সক্রিয় সদস্যদের দেখানো হবে।
     members = Member.objects.filter(is_active=True)
     
     # সার্চ কার্যকারিতা: নাম, পদবি, এলাকা বা বায়ো দিয়ে সার্চ করা যাবে।
+    # সার্চ ইনডেক্সের মাধ্যমে হয় (`pages.search`), ফলাফল relevance অনুযায়ী সাজানো।
     search_query = request.GET.get('search', '')
     if search_query:
-        members = members.filter(
-            Q(name__icontains=search_query) |
-            Q(role__icontains=search_query) |
-            Q(area__icontains=search_query) |
-            Q(bio__icontains=search_query)
-        )
+        members = search_members(members, search_query)
     
     # পদবি অনুযায়ী ফিল্টারিং।
     role_filter = request.GET.get('role', '')
     if role_filter:
-        members = members.filter(role=role_filter)
+        members = filter_role(members, role_filter)
 
-    # members = members.order_by('id')  # আইডি অনুযায়ী সাজানো হবে।
-    # members = members.order_by('role', 'id', 'name')  # আইডি, পদবি এবং নাম অনুযায়ী সাজানো হবে।
+    # এলাকা অনুযায়ী ফিল্টারিং (নাম বা alias, `pages.areas`) — সদস্য টেবিলে FK ইনডেক্সে।
+    area_filter = request.GET.get('area', '')
+    if area_filter:
+        members = members.filter(area_ref__in=matching_areas(area_filter))
+    return members, search_query, role_filter, area_filter
 
-    # পেজিনেশন: প্রতি পেজে ৮ জন সদস্য দেখানো হবে।
-    paginator = Paginator(members, 8)
-    page_number = request.GET.get('page', 1)
-    page_obj = paginator.get_page(page_number)
-    
-    context = {
+
+def legacy_page_redirect(request):
+    """
+    পুরনো পেজ নম্বরের লিংক (`/sodosso/?page=N`, সার্চ ছাড়া) কে ঐ পেজের keyset cursor এর লিংকে
+    redirect করে — নাহলে cursor মোডে `page` উপেক্ষিত হয়ে প্রথম পেজ দেখাত। সার্চের ফলাফলে
+    পেজ নম্বরই চলে, তাই তখন `None`। cursor ডেটা বদলালে বদলায়, তাই redirect অস্থায়ী (302)।
+    """
+    if 'page' not in request.GET or 'cursor' in request.GET or request.GET.get('search'):
+        return None
+    members = sodosso_members(request)[0]
+    paginator = KeysetPaginator(members, MEMBERS_PER_PAGE, MemberCursorPagination.ordering)
+    params = request.GET.copy()
+    cursor = paginator.cursor_for_page(params.pop('page')[-1])
+    if cursor:
+        params['cursor'] = cursor
+    query = params.urlencode()
+    return HttpResponseRedirect(f'{request.path}?{query}' if query else request.path)
+
+
+def sodosso_context(page_obj, cursor_pagination, approximate_total, search_query, role_filter, area_filter=''):
+    """সদস্য তালিকা টেমপ্লেটের context।"""
+    return {
         'members': page_obj, # পেজিনেটেড সদস্য তালিকা
+        'cursor_pagination': cursor_pagination, # True হলে Previous/Next cursor লিংক
+        'approximate_total': approximate_total, # (সংখ্যা, সঠিক কিনা) — শুধু cursor মোডে
         'search_query': search_query, # সার্চের জন্য ব্যবহৃত শব্দ
         'role_filter': role_filter, # ফিল্টারিংয়ের জন্য ব্যবহৃত পদবি
+        'area_filter': area_filter, # ফিল্টারিংয়ের জন্য ব্যবহৃত এলাকা
         'role_choices': Member.ROLE_CHOICES, # ফিল্টার ড্রপডাউনের জন্য পদবি তালিকা
     }
+
+
+def render_sodosso_page(request):
+    """
+    সদস্য তালিকা পেজটি ডাটাবেস থেকে তৈরি করে রেন্ডার করে (cache ছাড়া)।
+    """
+    members, search_query, role_filter, area_filter = sodosso_members(request)
+
+    # members = members.order_by('id')  # আইডি অনুযায়ী সাজানো হবে।
+    # members = members.order_by('role', 'id', 'name')  # আইডি, পদবি এবং নাম অনুযায়ী সাজানো হবে।
+
+    # পেজিনেশন: প্রতি পেজে ৮ জন সদস্য দেখানো হবে।
+    # সার্চ না থাকলে keyset (cursor) pagination — গভীর পেজও প্রথম পেজের মতো দ্রুত।
+    # সার্চের ফলাফল relevance অনুযায়ী সাজানো থাকে, তাই সেখানে পেজ নম্বর ভিত্তিক Paginator।
+    cursor_pagination = not search_query
+    approximate_total = None
+    if cursor_pagination:
+        paginator = KeysetPaginator(members, MEMBERS_PER_PAGE, MemberCursorPagination.ordering)
+        try:
+            page_obj = paginator.get_page(request.GET.get('cursor'))
+        except InvalidCursor:
+            page_obj = paginator.get_page()
+        # পদবি ফিল্টারসহ সংখ্যাও সারাংশ টেবিল থেকে (COUNT ছাড়া, সঠিক)
+        if area_filter:
+            # এলাকা ফিল্টারসহ: সীমিত COUNT (এলাকার FK ইনডেক্সে)
+            approximate_total = paginator.approximate_total()
+        else:
+            approximate_total = (active_count(get_stats(), role_filter), True)
+    else:
+        paginator = Paginator(members, MEMBERS_PER_PAGE)
+        page_number = request.GET.get('page', 1)
+        page_obj = paginator.get_page(page_number)
+    
+    context = sodosso_context(page_obj, cursor_pagination, approximate_total, search_query, role_filter, area_filter)
     return render(request, 'pages/sodosso-list.html', context)
 
+# সদস্যের বিস্তারিত fragment এর cache মেয়াদ (সেকেন্ড)। key তে `updated_at` থাকে, তাই
+# সদস্য বদলালে পুরনো fragment আপনা থেকেই বাদ পড়ে — মেয়াদ শুধু মেমোরি ফেরত পাওয়ার জন্য।
+MEMBER_FRAGMENT_TIMEOUT = 24 * 60 * 60
+
 def member_detail_view(request, pk):
     """
-    একজন নির্দিষ্ট সদস্যের বিস্তারিত তথ্য দেখানোর জন্য এই ভিউ।
+    একজন নির্দিষ্ট সদস্যের বিস্তারিত তথ্য দেখানোর জন্য এই ভিউ — নিজস্ব ছোট টেমপ্লেটে, আর
+    বিস্তারিত অংশটি তালিকা পেজের মডালের fragment এর সাথে একই cache এ।
     """
     member = get_object_or_404(Member, pk=pk, is_active=True)
-    context = {'member': member}
-    return render(request, 'pages/sodosso-list.html', context) # Note: আপনি এখানেও sodosso-list.html ব্যবহার করেছেন।
+    context = {'member': member, 'fragment_timeout': MEMBER_FRAGMENT_TIMEOUT}
+    return respond_conditionally(
+        request,
+        object_validators('member-detail', member.pk, member.updated_at),
+        lambda: render(request, 'pages/member-detail.html', context),
+    )
+
+def member_fragment_view(request, pk):
+    """
+    তালিকা পেজের মডালে ক্লিক করার পরে লোড হওয়া সদস্যের বিস্তারিত HTML fragment
+    (`Member.get_fragment_url`)। রেন্ডার করা fragment `pk` ও `updated_at` অনুযায়ী cache এ
+    থাকে; ব্রাউজারের কপি অপরিবর্তিত হলে 304। URL এর `v` বর্তমান সংস্করণের হলে ব্রাউজারও
+    কিছুক্ষণ নিজে cache করে।
+    """
+    member = get_object_or_404(Member, pk=pk, is_active=True)
+    context = {'member': member, 'fragment_timeout': MEMBER_FRAGMENT_TIMEOUT}
+    response = respond_conditionally(
+        request,
+        object_validators('member-fragment', member.pk, member.updated_at),
+        lambda: render(request, 'pages/member-fragment.html', context),
+    )
+    if request.GET.get('v') == str(member.fragment_version):
+        patch_cache_control(response, max_age=getattr(settings, 'MEMBER_CACHE_TIMEOUT', 300))
+    return response
+
+
+# --- মনিটরিং ---
+
+def can_scrape_metrics(request):
+    """
+    স্টাফ ইউজার, `Authorization: Bearer <METRICS_TOKEN>`, অথবা `METRICS_ALLOWED_IPS` এর
+    ঠিকানা (socket peer — proxy এর পেছনে এটি proxy এর ঠিকানা, তাই ডিফল্ট খালি)।
+    """
+    if request.user.is_staff:
+        return True
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    authorization = request.headers.get('Authorization', '')
+    if token and constant_time_compare(authorization, f'Bearer {token}'):
+        return True
+    return request.META.get('REMOTE_ADDR') in getattr(settings, 'METRICS_ALLOWED_IPS', ())
+
 
+def metrics_view(request):
+    """
+    Prometheus text format এ ভিউ ভিত্তিক মেট্রিক (`pages.metrics`)।
+    শুধু token সহ scraper বা স্টাফ ইউজারদের জন্য (`can_scrape_metrics`)।
+    """
+    if not can_scrape_metrics(request):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.render_prometheus(*metrics.collect()), content_type=metrics.CONTENT_TYPE)
 
 # ====================================================
 # ========== API ভিউসেট (DRF API ViewSet) ============
@@ -116,10 +259,11 @@ class MemberViewSet(viewsets.ModelViewSet):
     """
     queryset = Member.objects.filter(is_active=True)
     permission_classes = [AllowAny]  # API অ্যাক্সেসের জন্য অনুমতি ( আপাতত সবার জন্য খোলা )
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter] # সার্চ এবং অর্ডারিং সুবিধা যোগ করা হয়েছে
+    pagination_class = MemberCursorPagination # `?cursor=` দিলে keyset pagination
+    filter_backends = [MemberSearchFilter, MemberOrderingFilter] # ইনডেক্স ভিত্তিক সার্চ এবং অর্ডারিং
     search_fields = ['name', 'role', 'area', 'bio'] # কোন কোন ফিল্ডে সার্চ করা যাবে
     ordering_fields = ['name', 'role', 'joined_date'] # কোন কোন ফিল্ড অনুযায়ী সাজানো যাবে
-    ordering = ['role', 'name'] # ডিফল্ট অর্ডারিং
+    ordering = list(Member.ORDERING) # ডিফল্ট অর্ডারিং (পদের ক্রম, নাম, id — ইনডেক্সের ক্রমে)
     
     def get_serializer_class(self):
         """
@@ -139,19 +283,67 @@ class MemberViewSet(viewsets.ModelViewSet):
         API অনুরোধ অনুযায়ী কোয়েরিসেট ফিল্টার করার জন্য এই মেথডটি ওভাররাইড করা হয়েছে।
         URL প্যারামিটার (e.g., `?role=President`) অনুযায়ী ফিল্টার করা যাবে।
         """
-        queryset = super().get_queryset()
-        
-        # পদবি (`role`) অনুযায়ী ফিল্টার
-        role = self.request.query_params.get('role', None)
-        if role:
-            queryset = queryset.filter(role=role)
-        
-        # এলাকা (`area`) অনুযায়ী ফিল্টার
-        area = self.request.query_params.get('area', None)
-        if area:
-            queryset = queryset.filter(area__icontains=area)
-        
-        return queryset
+        return self.apply_query_filters(super().get_queryset())
+
+    def apply_query_filters(self, queryset):
+        """
+        URL প্যারামিটার (`role`, `area`) অনুযায়ী ফিল্টার প্রয়োগ করে (`pages.filters.filter_members`)।
+        `get_queryset` এবং export দুটোই এটি ব্যবহার করে, যাতে ফিল্টার একই থাকে।
+        """
+        return filter_members(queryset, self.request.query_params)
+    
+    # --- cache (`pages.cache`) ---
+
+    # যে কোয়েরি প্যারামিটারগুলো API রেসপন্সের cache key তে ধরা হয়।
+    cache_query_params = ('search', 'role', 'area', 'ordering', 'cursor', 'page_size', 'total')
+
+    def get_cache_params(self):
+        """
+        রিকোয়েস্টের normalized cache key অংশ: host (সম্পূর্ণ URL এর জন্য) এবং প্রাসঙ্গিক কোয়েরি প্যারামিটার।
+        """
+        return (self.request.build_absolute_uri('/'),) + normalize_params(
+            self.request.query_params, self.cache_query_params
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        সদস্য তালিকা — সিরিয়ালাইজ করা ডেটা কোয়েরি অনুযায়ী cache করা থাকে।
+        """
+        params = self.get_cache_params()
+        return respond_conditionally(
+            request,
+            directory_validators('api:list', params + (request.accepted_renderer.format,)),
+            lambda: Response(get_or_build('api:list', params, lambda: self.list_data(request))),
+        )
+
+    def list_data(self, request):
+        """
+        `list` এর রেসপন্স ডেটা — মডেল instance না বানিয়ে `values()` সারি থেকে
+        `MemberListRowSerializer` দিয়ে তৈরি (আউটপুট `MemberListSerializer` এর সমান)।
+        """
+        serializer = MemberListRowSerializer(request)
+        queryset = self.filter_queryset(self.get_queryset()).values(*serializer.value_fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page)).data
+        return serializer.serialize(queryset)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        একজন সদস্যের বিস্তারিত তথ্য — সদস্যের `updated_at` থেকে ETag/Last-Modified,
+        অপরিবর্তিত থাকলে সিরিয়ালাইজ ছাড়াই 304।
+        """
+        lookup = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        try:
+            updated_at = self.get_queryset().filter(pk=lookup).values_list('updated_at', flat=True).first()
+        except (ValueError, TypeError, ValidationError):
+            updated_at = None  # সংখ্যা নয় এমন pk (`/api/members/abc/`) — DRF এর মতোই 404
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)  # 404
+        validators = object_validators(
+            'api:retrieve', lookup, updated_at, (request.build_absolute_uri('/'), request.accepted_renderer.format)
+        )
+        return respond_conditionally(request, validators, lambda: super(MemberViewSet, self).retrieve(request, *args, **kwargs))
     
     # --- কাস্টম API এন্ডপয়েন্ট --- 
 
@@ -168,18 +360,42 @@ class MemberViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        members = self.get_queryset().filter(role=role)
-        # `get_serializer` ব্যবহার করে সঠিক সিরিয়ালাইজার পাওয়া যায়।
-        serializer = self.get_serializer(members, many=True)
-        return Response(serializer.data)
+        def build():
+            members = filter_role(self.get_queryset(), role)
+            # `get_serializer` ব্যবহার করে সঠিক সিরিয়ালাইজার পাওয়া যায়।
+            serializer = self.get_serializer(members, many=True)
+            return serializer.data
+
+        params = self.get_cache_params()
+        return respond_conditionally(
+            request,
+            directory_validators('api:by-role', params + (request.accepted_renderer.format,)),
+            lambda: Response(get_or_build('api:by-role', params, build)),
+        )
     
+    @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        """
+        সার্চ বক্সের typeahead — নাম বা এলাকার শব্দের শুরু মিললে সেরা কয়েকজন সদস্য, পদের ক্রমে।
+        ডাটাবেস নয়, প্রসেসের মেমোরির prefix ইনডেক্স থেকে (`pages.suggest`)।
+        এন্ডপয়েন্ট: GET /api/members/suggest/?q=kar&limit=8
+        """
+        try:
+            limit = int(request.query_params.get('limit', SUGGEST_LIMIT))
+        except ValueError:
+            limit = SUGGEST_LIMIT
+        return Response(suggest_members(request.query_params.get('q', ''), limit))
+
     @action(detail=False, methods=['get']) 
     def roles(self, request):
         """
         সিস্টেমে উপলব্ধ সকল পদবি তালিকা পাওয়ার জন্য একটি এন্ডপয়েন্ট।
         এন্ডপয়েন্ট: GET /api/members/roles/
         """
-        roles = [{'value': choice[0], 'label': choice[1]} for choice in Member.ROLE_CHOICES]
+        roles = get_or_build(
+            'api:roles', (),
+            lambda: [{'value': choice[0], 'label': choice[1]} for choice in Member.ROLE_CHOICES],
+        )
         return Response(roles)
     
     @action(detail=True, methods=['post'], url_path='toggle-active')
@@ -193,3 +409,90 @@ class MemberViewSet(viewsets.ModelViewSet):
         member.save()
         serializer = self.get_serializer(member)
         return Response(serializer.data)
+    
+    @action(detail=False, methods=['get'])
+    def stats(self, request):
+        """
+        সদস্য সংখ্যা — মোট, সক্রিয়/নিষ্ক্রিয়, পদবি ও এলাকা অনুযায়ী (`pages.stats` সারাংশ টেবিল থেকে)।
+        এন্ডপয়েন্ট: GET /api/members/stats/
+        """
+        return respond_conditionally(
+            request,
+            directory_validators('api:stats', (request.accepted_renderer.format,)),
+            lambda: Response(get_stats()),
+        )
+
+    @action(detail=False, methods=['get'], url_path='cache-stats', permission_classes=[IsAdminUser])
+    def cache_stats(self, request):
+        """
+        সদস্য ডেটা cache এর hit/miss কাউন্টার (শুধু অ্যাডমিনদের জন্য)।
+        এন্ডপয়েন্ট: GET /api/members/cache-stats/
+        """
+        return Response(get_cache_stats())
+    
+    @action(
+        detail=False, methods=['get'], permission_classes=[IsAdminUser],
+        url_path=r'export/(?P<export_format>csv|ndjson)',
+    )
+    def export(self, request, export_format=None):
+        """
+        সদস্য তালিকা CSV বা NDJSON হিসেবে stream করে (শুধু অ্যাডমিনদের জন্য)।
+        মেমোরি স্থির থাকে এবং প্রথম বাইট সাথে সাথে পাঠানো হয়।
+        ফিল্টার: `role`, `area` (তালিকার মতোই) এবং `is_active` (true/false/all, ডিফল্ট true)।
+        এন্ডপয়েন্ট: GET /api/members/export/csv/?role=Committee&is_active=all
+        """
+        queryset = self.apply_query_filters(Member.objects.all())
+        is_active = request.query_params.get('is_active', 'true').lower()
+        if is_active in ('true', '1'):
+            queryset = queryset.filter(is_active=True)
+        elif is_active in ('false', '0'):
+            queryset = queryset.filter(is_active=False)
+
+        try:
+            chunk_size = min(int(request.query_params.get('chunk_size', DEFAULT_CHUNK_SIZE)), 10000)
+        except ValueError:
+            chunk_size = DEFAULT_CHUNK_SIZE
+
+        response = StreamingHttpResponse(
+            stream_export(queryset, export_format, max(chunk_size, 1)),
+            content_type=EXPORT_FORMATS[export_format],
+        )
+        response['Content-Disposition'] = f'attachment; filename="members.{export_format}"'
+        return response
+    
+    @action(detail=False, methods=['post', 'put', 'patch'], url_path='bulk', permission_classes=[IsAdminUser])
+    def bulk(self, request):
+        """
+        একসাথে অনেক সদস্য তৈরি (POST) বা আপডেট (PUT/PATCH, প্রতিটি সারিতে `id` সহ) করার জন্য
+        (শুধু অ্যাডমিনদের জন্য — এক রিকোয়েস্টে হাজারো সারি লেখে)।
+        বডি: সদস্যের JSON লিস্ট। ভুল সারিগুলোর error `index` সহ ফেরত দেওয়া হয়,
+        বাকি সারিগুলো batch আকারে লেখা হয়।
+        এন্ডপয়েন্ট: POST /api/members/bulk/
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response({'error': 'Expected a list of members'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(rows) > BULK_MAX_ROWS:
+            return Response(
+                {'error': f'At most {BULK_MAX_ROWS} members per request'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        context = self.get_serializer_context()
+        if request.method == 'POST':
+            members, errors = bulk_create_members(rows, context)
+            success_status = status.HTTP_201_CREATED
+        else:
+            members, errors = bulk_update_members(rows, context, partial=request.method == 'PATCH')
+            success_status = status.HTTP_200_OK
+
+        if errors and not members:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif errors:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = success_status
+        return Response(
+            {'count': len(members), 'ids': [member.pk for member in members], 'errors': errors},
+            status=response_status,
+        )
@@ -0,0 +1,37 @@
+// ================================
+// ADMIN AREA FILTER (AUTOCOMPLETE)
+// ================================
+// টাইপ করার সাথে সাথে `area-autocomplete/` থেকে মেলানো এলাকাগুলো datalist এ দেখায়;
+// একটি এলাকা বেছে নিলে বা Enter চাপলে ফর্ম submit হয়।
+document.querySelectorAll('.area-autocomplete-filter').forEach(function (form) {
+    const input = form.querySelector('input[type="search"]');
+    const options = form.querySelector('datalist');
+    let timer = null;
+    let controller = null;
+
+    function showSuggestions(results) {
+        options.replaceChildren(...results.map(function (result) {
+            const option = document.createElement('option');
+            option.value = result.id;
+            option.label = result.text;
+            return option;
+        }));
+    }
+
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        if (options.querySelector('option[value="' + CSS.escape(input.value) + '"]')) {
+            form.submit();  // সাজেশন থেকে বেছে নেওয়া হয়েছে
+            return;
+        }
+        timer = setTimeout(function () {
+            if (controller) controller.abort();
+            controller = new AbortController();
+            const url = form.dataset.autocompleteUrl + '?term=' + encodeURIComponent(input.value.trim());
+            fetch(url, { signal: controller.signal, credentials: 'same-origin' })
+                .then(function (response) { return response.ok ? response.json() : { results: [] }; })
+                .then(function (data) { showSuggestions(data.results); })
+                .catch(function () {});
+        }, 200);
+    });
+});
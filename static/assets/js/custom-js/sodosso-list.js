@@ -0,0 +1,102 @@
+// ================================
+// MEMBER SEARCH SUGGESTIONS (TYPEAHEAD)
+// ================================
+// টাইপ করার সাথে সাথে `/api/members/suggest/?q=` থেকে মেলানো সদস্যদের তালিকা দেখায়;
+// একটি সাজেশন বেছে নিলে ঐ নাম দিয়ে সার্চ ফর্ম submit হয়। Enter চাপলে আগের মতোই পুরো সার্চ।
+document.querySelectorAll('.member-suggest').forEach(function (box) {
+    const input = box.querySelector('input[type="search"]');
+    const list = box.querySelector('.member-suggest-results');
+    let timer = null;
+    let controller = null;
+
+    function hide() {
+        list.classList.add('d-none');
+        list.replaceChildren();
+    }
+
+    function showSuggestions(results) {
+        if (!results.length) {
+            hide();
+            return;
+        }
+        list.replaceChildren(...results.map(function (result) {
+            const item = document.createElement('button');
+            item.type = 'button';
+            item.className = 'list-group-item list-group-item-action';
+            const name = document.createElement('div');
+            name.className = 'fw-semibold';
+            name.textContent = result.name;
+            const details = document.createElement('small');
+            details.className = 'text-muted';
+            details.textContent = [result.role, result.area].filter(Boolean).join(' · ');
+            item.append(name, details);
+            item.addEventListener('mousedown', function (event) {
+                event.preventDefault();  // blur এর আগে — তালিকা লুকানোর আগেই বেছে নেওয়া
+                input.value = result.name;
+                input.form.submit();
+            });
+            return item;
+        }));
+        list.classList.remove('d-none');
+    }
+
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        const query = input.value.trim();
+        if (!query) {
+            hide();
+            return;
+        }
+        timer = setTimeout(function () {
+            if (controller) controller.abort();
+            controller = new AbortController();
+            const url = box.dataset.suggestUrl + '?q=' + encodeURIComponent(query);
+            fetch(url, { signal: controller.signal, headers: { Accept: 'application/json' } })
+                .then(function (response) { return response.ok ? response.json() : []; })
+                .then(showSuggestions)
+                .catch(function () {});
+        }, 120);
+    });
+
+    input.addEventListener('blur', hide);
+    input.addEventListener('keydown', function (event) {
+        if (event.key === 'Escape') hide();
+    });
+});
+
+// ================================
+// MEMBER DETAIL MODAL (ON DEMAND)
+// ================================
+// তালিকা পেজে সব সদস্যের জন্য একটিই মডাল। "View" চাপলে বাটনের `data-fragment-url`
+// (`?v=` এ সদস্যের updated_at) থেকে বিস্তারিত HTML fragment লোড হয়; একবার লোড হওয়া
+// fragment এই পেজে আবার নামানো হয় না। JS ছাড়া বাটনটি সদস্যের বিস্তারিত পেজের লিংক।
+(function (modal) {
+    if (!modal) return;
+    const body = modal.querySelector('[data-member-modal-body]');
+    const loading = body.innerHTML;
+    const fragments = new Map();
+    let current = null;
+
+    modal.addEventListener('show.bs.modal', function (event) {
+        const url = event.relatedTarget && event.relatedTarget.dataset.fragmentUrl;
+        if (!url) return;
+        current = url;
+        if (fragments.has(url)) {
+            body.innerHTML = fragments.get(url);
+            return;
+        }
+        body.innerHTML = loading;
+        fetch(url, { headers: { Accept: 'text/html' } })
+            .then(function (response) {
+                if (!response.ok) throw new Error(response.status);
+                return response.text();
+            })
+            .then(function (html) {
+                fragments.set(url, html);
+                if (current === url) body.innerHTML = html;
+            })
+            .catch(function () {
+                if (current === url) body.innerHTML = '<div class="alert alert-warning mb-0">সদস্যের তথ্য লোড করা যায়নি।</div>';
+            });
+    });
+})(document.getElementById('memberModal'));